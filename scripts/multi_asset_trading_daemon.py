@@ -91,7 +91,7 @@ def create_daemon(
     logger.info("Exchange client initialized (Binance mainnet)")
 
     # Watchlist manager for symbols and parameters
-    watchlist = WatchlistManager()
+    watchlist = WatchlistManager(client=exchange_client)
     logger.info(f"Watchlist loaded: {len(watchlist.symbols)} symbols")
 
     # ============================================================
@@ -20,26 +20,77 @@ This strategy beat:
 
 import sys
 import time
+import asyncio
+import queue
 import argparse
 import signal
+import threading
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_DOWN
 from pathlib import Path
-from typing import Optional
-import traceback
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from loguru import logger
-from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
-from src.infrastructure.database import DatabaseManager
-from src.domain.account.repositories.account_repository import AccountRepository
-from src.infrastructure.persistence.sqlite_account_repository import SQLiteAccountRepository
-from src.infrastructure.persistence.sqlite_transaction_repository import SQLiteTransactionRepository
+from src.domain.account.entities.account import Account
 from src.domain.account.value_objects.money import Money
 from src.domain.account.value_objects.currency import Currency
-from src.domain.account.entities.transaction import TransactionType
-from src.infrastructure.notifications.telegram_notifier import TelegramNotifier
+from src.shared.exceptions import ExchangeBannedException
+
+
+class _LazyLogger:
+    """Defer importing loguru until the first log call (keeps --help fast)."""
+
+    def __getattr__(self, name):
+        from loguru import logger as _logger
+        return getattr(_logger, name)
+
+
+logger = _LazyLogger()
+
+
+# Day names to weekday numbers (0=Monday, 6=Sunday)
+_DAY_MAP: Final[Mapping[str, int]] = MappingProxyType({
+    "monday": 0, "tuesday": 1, "wednesday": 2,
+    "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6
+})
+_DAY_NAMES: Final = tuple(_DAY_MAP)
+
+
+def _day_to_int(day: str) -> int:
+    """
+    Argparse type: resolve a day name to its weekday number.
+
+    Raises:
+        argparse.ArgumentTypeError: If the day name is unknown
+    """
+    try:
+        return _DAY_MAP[day.lower()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(
+            f"invalid day '{day}' (choose from {', '.join(_DAY_NAMES)})"
+        ) from None
+
+
+def _next_weekday_epoch(target_weekday: int, include_today: bool = True) -> float:
+    """
+    Get epoch seconds of the next 00:00 UTC falling on target_weekday.
+
+    Args:
+        target_weekday: Weekday number (0=Monday, 6=Sunday)
+        include_today: Whether today's midnight counts when it is the target day
+
+    Returns:
+        Unix timestamp of the next DCA window
+    """
+    now = datetime.fromtimestamp(time.time(), timezone.utc)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    days_ahead = (target_weekday - now.weekday()) % 7
+    if days_ahead == 0 and not include_today:
+        days_ahead = 7
+    return (midnight + timedelta(days=days_ahead)).timestamp()
 
 
 class BuyHoldDCAStrategy:
@@ -50,12 +101,45 @@ class BuyHoldDCAStrategy:
     No indicators, no timing, just discipline.
     """
 
+    STATUS_INTERVAL = 6 * 3600  # Log portfolio status every 6 hours
+    DCA_RETRY_INTERVAL = 3600  # Retry a failed DCA after an hour
+    DCA_WINDOW = 24 * 3600  # A DCA is only attempted on the DCA day itself
+    MIN_SLEEP = 60
+    BNB_QUANTUM = Decimal("0.000001")  # Precision of purchased BNB amounts
+
+    _DCA_MSG_TMPL = (
+        "📈 **Weekly DCA Executed**\\n\\n"
+        "✅ Bought {amount_bnb:.6f} BNB\\n"
+        "💵 Price: ${price:.2f}\\n"
+        "💰 Spent: ${amount_usd:.2f}\\n\\n"
+        "**New Balances:**\\n"
+        "• BNB: {new_bnb_balance:.6f}\\n"
+        "• USDT: ${new_usdt_balance:.2f}\\n\\n"
+        "Strategy: Buy & Hold + Fixed DCA\\n"
+        "Next DCA: Next {dca_day_cap}"
+    )
+    _STARTUP_MSG_TMPL = (
+        "🚀 **Buy & Hold + DCA Strategy Started**\\n\\n"
+        "📊 Initial Portfolio:\\n"
+        "• BNB: {bnb_balance:.6f}\\n"
+        "• USDT: ${usdt_balance:.2f}\\n"
+        "• Total: ${total_value:.2f}\\n"
+        "• P&L: ${pnl:.2f} ({pnl_pct:+.2f}%)\\n\\n"
+        "⚙️ Settings:\\n"
+        "• DCA Amount: ${dca_amount} weekly\\n"
+        "• DCA Day: {dca_day_cap}\\n"
+        "• Symbol: {symbol}"
+    )
+    _STATUS_DEFAULTS = {
+        "bnb_balance": 0, "usdt_balance": 0, "total_value": 0, "pnl": 0, "pnl_pct": 0
+    }
+
     def __init__(
         self,
         account_id: str,
         symbol: str = "BNB_USDT",
         dca_amount_usd: float = 200.0,
-        dca_day: str = "monday"
+        target_weekday: int = 0
     ):
         """
         Initialize Buy & Hold + DCA Strategy.
@@ -64,19 +148,32 @@ class BuyHoldDCAStrategy:
             account_id: Paper trading account ID
             symbol: Trading pair (e.g., BNB_USDT)
             dca_amount_usd: Weekly DCA amount in USD
-            dca_day: Day of week to execute DCA ("monday", "tuesday", etc.)
+            target_weekday: Weekday to execute DCA (0=Monday, 6=Sunday)
         """
         self.account_id = account_id
         self.symbol = symbol
         self.dca_amount_usd = dca_amount_usd
-        self.dca_day = dca_day.lower()
-
-        # Map day names to weekday numbers (0=Monday, 6=Sunday)
-        self.day_map = {
-            "monday": 0, "tuesday": 1, "wednesday": 2,
-            "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6
+        self._dca_amount = Decimal(str(dca_amount_usd))
+        self._target_weekday = target_weekday
+        self.dca_day = _DAY_NAMES[target_weekday]
+
+        # Constant per instance: resolve once instead of on every check
+        self._binance_symbol = self.symbol.replace("_", "")
+        self._msg_context = {
+            "dca_day_cap": self.dca_day.capitalize(),
+            "dca_amount": dca_amount_usd,
+            "symbol": symbol,
         }
 
+        # Infrastructure is imported here so --help and argument errors stay cheap
+        from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
+        from src.infrastructure.database import DatabaseManager
+        from src.infrastructure.persistence.sqlite_account_repository import SQLiteAccountRepository
+        from src.infrastructure.persistence.sqlite_transaction_repository import (
+            SQLiteTransactionRepository
+        )
+        from src.infrastructure.notifications.telegram_notifier import TelegramNotifier
+
         # Initialize components
         self.client = BinanceRESTClient(testnet=False)
         self.db_manager = DatabaseManager('data/jarvis_trading.db')
@@ -89,42 +186,109 @@ class BuyHoldDCAStrategy:
             logger.info("Telegram notifications enabled")
         except Exception as e:
             self.telegram = None
-            logger.warning(f"Telegram notifications disabled: {e}")
+            logger.warning("Telegram notifications disabled: {}", e)
+
+        # Notifications are sent by a worker thread so trades never wait on Telegram
+        self._notify_queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=32)
+        self._notify_thread: Optional[threading.Thread] = None
+        if self.telegram:
+            self._notify_thread = threading.Thread(
+                target=self._notification_worker,
+                name="telegram-notifier",
+                daemon=True
+            )
+            self._notify_thread.start()
 
         # Control flags
         self.running = False
-        self.last_dca_date = None
+        self._account: Optional[Account] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._next_dca_ts = 0.0
+        self._dca_window_end = 0.0
+        self._schedule_next_dca()
+
+        logger.info("Buy & Hold + DCA Strategy initialized")
+        logger.info("Account: {}", account_id)
+        logger.info("Symbol: {}", symbol)
+        logger.info("DCA Amount: ${} weekly on {}", dca_amount_usd, self.dca_day)
+
+    def _notification_worker(self):
+        """Send queued Telegram messages one at a time until a None sentinel."""
+        while True:
+            message = self._notify_queue.get()
+            if message is None:
+                break
+            try:
+                self.telegram.send_message(message)
+            except Exception as e:
+                logger.warning("Telegram notification failed: {}", e)
 
-        logger.info(f"Buy & Hold + DCA Strategy initialized")
-        logger.info(f"Account: {account_id}")
-        logger.info(f"Symbol: {symbol}")
-        logger.info(f"DCA Amount: ${dca_amount_usd} weekly on {dca_day}")
+    def _notify(self, message: str):
+        """
+        Queue a Telegram message without blocking the caller.
 
-    def should_execute_dca(self) -> bool:
+        Args:
+            message: Message text to send
+        """
+        if not self.telegram:
+            return
+        try:
+            self._notify_queue.put_nowait(message)
+        except queue.Full:
+            logger.warning("Telegram notification queue full, dropping message")
+
+    def _get_account(self) -> Optional[Account]:
         """
-        Check if today is DCA day and we haven't executed yet.
+        Get the strategy account, loading it from the database once.
+
+        This daemon is the only writer of the account, so the loaded
+        aggregate stays valid until a save fails.
 
         Returns:
-            True if we should execute DCA today
+            Account or None if not found
         """
-        now = datetime.now(timezone.utc)
-        current_weekday = now.weekday()
-        target_weekday = self.day_map.get(self.dca_day, 0)
+        if self._account is None:
+            self._account = self.account_repo.find_by_id(self.account_id)
+        return self._account
 
-        # Check if today is the DCA day
-        if current_weekday != target_weekday:
-            return False
+    def _handle_ban(self, error: ExchangeBannedException):
+        """Stop the daemon: any further request would extend a Binance IP ban."""
+        logger.critical("Binance banned this IP, stopping DCA daemon: {}", error)
+        self.stop()
 
-        # Check if we already executed today
-        today_date = now.date()
-        if self.last_dca_date == today_date:
-            return False
+    def _schedule_next_dca(self, include_today: bool = True):
+        """
+        Set the next DCA window: 00:00 UTC on the DCA day until the day ends.
 
-        # Check if market is open (after 00:00 UTC)
-        if now.hour < 0:  # Always true, but kept for clarity
-            return False
+        Args:
+            include_today: Whether today counts when it is the DCA day
+        """
+        self._next_dca_ts = _next_weekday_epoch(self._target_weekday, include_today)
+        self._dca_window_end = self._next_dca_ts + self.DCA_WINDOW
 
-        return True
+    def _schedule_dca_retry(self):
+        """Retry a failed DCA after DCA_RETRY_INTERVAL, but not past the DCA day."""
+        self._next_dca_ts = min(time.time() + self.DCA_RETRY_INTERVAL, self._dca_window_end)
+
+    def should_execute_dca(self) -> bool:
+        """
+        Check if the next DCA window has been reached.
+
+        The window is precomputed as epoch deadlines, so each daemon
+        wakeup costs a clock read and two compares. A DCA day that ends
+        without a successful purchase is skipped, not carried over into
+        the following days.
+
+        Returns:
+            True if we should execute DCA now
+        """
+        now = time.time()
+        if now >= self._dca_window_end:
+            logger.warning("No DCA executed on {}, waiting for next week", self.dca_day)
+            self._schedule_next_dca()
+            return False
+        return now >= self._next_dca_ts
 
     def execute_dca_purchase(self) -> dict:
         """
@@ -135,22 +299,25 @@ class BuyHoldDCAStrategy:
         """
         try:
             # Get current BNB price
-            ticker = self.client.get_24h_ticker(self.symbol.replace("_", ""))
-            bnb_price = float(ticker['lastPrice'])
+            ticker = self.client.get_24h_ticker(self._binance_symbol)
+            bnb_price = Decimal(ticker['lastPrice'])
 
-            # Calculate BNB amount to buy
-            bnb_amount = self.dca_amount_usd / bnb_price
+            # Calculate BNB amount to buy (exact decimal, rounded down so we never overspend)
+            bnb_amount = (self._dca_amount / bnb_price).quantize(self.BNB_QUANTUM, rounding=ROUND_DOWN)
 
             # Load account
-            account = self.account_repo.find_by_id(self.account_id)
+            account = self._get_account()
             if not account:
                 raise ValueError(f"Account {self.account_id} not found")
 
             # Check USDT balance
-            usdt_balance = account.balance.available.get(Currency.USDT, 0.0)
+            usdt_balance = account.snapshot(Currency.BNB).quote
 
             if usdt_balance < self.dca_amount_usd:
-                logger.warning(f"Insufficient USDT balance: ${usdt_balance:.2f} < ${self.dca_amount_usd:.2f}")
+                logger.warning(
+                    "Insufficient USDT balance: ${:.2f} < ${:.2f}",
+                    usdt_balance, self.dca_amount_usd
+                )
                 return {
                     "status": "FAILED",
                     "reason": "Insufficient balance",
@@ -161,64 +328,51 @@ class BuyHoldDCAStrategy:
             # Execute purchase
             timestamp = datetime.now(timezone.utc)
 
-            # Withdraw USDT
-            account.withdraw(
+            # Swap USDT for BNB in one domain operation
+            account.execute_buy(
                 Money(self.dca_amount_usd, Currency.USDT),
-                f"DCA purchase at ${bnb_price:.2f}"
-            )
-
-            # Deposit BNB
-            account.deposit(
-                Money(bnb_amount, Currency.BNB),
-                f"DCA: Bought {bnb_amount:.6f} BNB"
-            )
-
-            # Record trade
-            account.record_trade(
-                TransactionType.BUY,
-                Money(bnb_amount, Currency.BNB),
+                Money(float(bnb_amount), Currency.BNB),
+                float(bnb_price),
                 f"Weekly DCA at ${bnb_price:.2f}"
             )
 
             # Save to database
             self.account_repo.save(account)
 
-            # Update last DCA date
-            self.last_dca_date = timestamp.date()
+            # Schedule next week's window
+            self._schedule_next_dca(include_today=False)
 
             # Create result
+            after = account.snapshot(Currency.BNB)
             result = {
                 "status": "SUCCESS",
                 "timestamp": timestamp.isoformat(),
                 "action": "BUY",
-                "amount_bnb": bnb_amount,
+                "amount_bnb": float(bnb_amount),
                 "amount_usd": self.dca_amount_usd,
-                "price": bnb_price,
-                "new_bnb_balance": account.balance.available.get(Currency.BNB, 0.0),
-                "new_usdt_balance": account.balance.available.get(Currency.USDT, 0.0)
+                "price": float(bnb_price),
+                "new_bnb_balance": after.base,
+                "new_usdt_balance": after.quote
             }
 
             # Send Telegram notification
             if self.telegram:
-                message = (
-                    "📈 **Weekly DCA Executed**\\n\\n"
-                    f"✅ Bought {bnb_amount:.6f} BNB\\n"
-                    f"💵 Price: ${bnb_price:.2f}\\n"
-                    f"💰 Spent: ${self.dca_amount_usd:.2f}\\n\\n"
-                    f"**New Balances:**\\n"
-                    f"• BNB: {result['new_bnb_balance']:.6f}\\n"
-                    f"• USDT: ${result['new_usdt_balance']:.2f}\\n\\n"
-                    f"Strategy: Buy & Hold + Fixed DCA\\n"
-                    f"Next DCA: Next {self.dca_day.capitalize()}"
-                )
-                self.telegram.send_message(message)
+                self._notify(self._DCA_MSG_TMPL.format_map(self._msg_context | result))
 
-            logger.info(f"DCA executed: Bought {bnb_amount:.6f} BNB at ${bnb_price:.2f}")
+            logger.info("DCA executed: Bought {:.6f} BNB at ${:.2f}", bnb_amount, bnb_price)
             return result
 
+        except ExchangeBannedException as e:
+            self._handle_ban(e)
+            return {
+                "status": "ERROR",
+                "error": str(e)
+            }
+
         except Exception as e:
-            logger.error(f"DCA execution failed: {e}")
-            traceback.print_exc()
+            # The cached account may hold unsaved changes; reload next time
+            self._account = None
+            logger.exception("DCA execution failed")
             return {
                 "status": "ERROR",
                 "error": str(e)
@@ -227,16 +381,17 @@ class BuyHoldDCAStrategy:
     def get_portfolio_status(self) -> dict:
         """Get current portfolio status and performance."""
         try:
-            account = self.account_repo.find_by_id(self.account_id)
+            account = self._get_account()
             if not account:
                 return {"error": "Account not found"}
 
-            # Get balances
-            bnb_balance = account.balance.available.get(Currency.BNB, 0.0)
-            usdt_balance = account.balance.available.get(Currency.USDT, 0.0)
+            # Get balances (plain floats, one pass over the account)
+            balances = account.snapshot(Currency.BNB)
+            bnb_balance = balances.base
+            usdt_balance = balances.quote
 
             # Get current BNB price
-            ticker = self.client.get_24h_ticker(self.symbol.replace("_", ""))
+            ticker = self.client.get_24h_ticker(self._binance_symbol)
             bnb_price = float(ticker['lastPrice'])
 
             # Calculate total value
@@ -255,74 +410,104 @@ class BuyHoldDCAStrategy:
                 "strategy": "Buy & Hold + Fixed DCA"
             }
 
+        except ExchangeBannedException as e:
+            self._handle_ban(e)
+            return {"error": str(e)}
+
         except Exception as e:
-            logger.error(f"Failed to get portfolio status: {e}")
+            logger.error("Failed to get portfolio status: {}", e)
             return {"error": str(e)}
 
     def run_daemon(self):
         """
         Run the strategy as a daemon.
-        Checks daily if it's time for weekly DCA.
+        DCA checks and status logging run as independent asyncio tasks.
         """
+        asyncio.run(self.run_daemon_async())
+
+    async def run_daemon_async(self):
+        """Async daemon entry point: DCA loop plus a separate status task."""
         logger.info("Starting Buy & Hold + DCA daemon")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
 
         # Send startup notification
         if self.telegram:
-            status = self.get_portfolio_status()
-            message = (
-                "🚀 **Buy & Hold + DCA Strategy Started**\\n\\n"
-                f"📊 Initial Portfolio:\\n"
-                f"• BNB: {status.get('bnb_balance', 0):.6f}\\n"
-                f"• USDT: ${status.get('usdt_balance', 0):.2f}\\n"
-                f"• Total: ${status.get('total_value', 0):.2f}\\n"
-                f"• P&L: ${status.get('pnl', 0):.2f} ({status.get('pnl_pct', 0):+.2f}%)\\n\\n"
-                f"⚙️ Settings:\\n"
-                f"• DCA Amount: ${self.dca_amount_usd} weekly\\n"
-                f"• DCA Day: {self.dca_day.capitalize()}\\n"
-                f"• Symbol: {self.symbol}"
-            )
-            self.telegram.send_message(message)
+            status = await asyncio.to_thread(self.get_portfolio_status)
+            self._notify(self._STARTUP_MSG_TMPL.format_map(
+                self._STATUS_DEFAULTS | status | self._msg_context
+            ))
 
-        check_interval = 3600  # Check every hour
+        status_task = asyncio.create_task(self._status_loop())
 
+        try:
+            while self.running:
+                try:
+                    # Check if it's time for DCA
+                    if self.should_execute_dca():
+                        logger.info("It's {}! Executing weekly DCA...", self.dca_day)
+                        result = await asyncio.to_thread(self.execute_dca_purchase)
+
+                        if result['status'] == 'SUCCESS':
+                            logger.info("DCA successful: {}", result)
+                        else:
+                            logger.warning("DCA failed: {}", result)
+                            self._schedule_dca_retry()
+
+                    # Sleep until the next DCA window instead of polling hourly
+                    await self._sleep(max(self.MIN_SLEEP, self._next_dca_ts - time.time()))
+
+                except Exception:
+                    logger.exception("Error in daemon loop")
+                    await self._sleep(60)  # Wait a minute before retrying
+        finally:
+            status_task.cancel()
+
+        logger.info("Buy & Hold + DCA daemon stopped")
+
+    async def _status_loop(self):
+        """Log portfolio status every STATUS_INTERVAL seconds."""
         while self.running:
-            try:
-                # Check if it's time for DCA
-                if self.should_execute_dca():
-                    logger.info(f"It's {self.dca_day}! Executing weekly DCA...")
-                    result = self.execute_dca_purchase()
-
-                    if result['status'] == 'SUCCESS':
-                        logger.info(f"DCA successful: {result}")
-                    else:
-                        logger.warning(f"DCA failed: {result}")
-
-                # Log status every 6 hours
-                now = datetime.now(timezone.utc)
-                if now.hour % 6 == 0 and now.minute < 1:
-                    status = self.get_portfolio_status()
-                    logger.info(f"Portfolio Status: {status}")
-
-                # Sleep
-                time.sleep(check_interval)
-
-            except KeyboardInterrupt:
-                logger.info("Received interrupt signal")
+            await self._sleep(self.STATUS_INTERVAL)
+            if not self.running:
                 break
+            try:
+                status = await asyncio.to_thread(self.get_portfolio_status)
+                logger.info("Portfolio Status: {}", status)
+            except Exception:
+                logger.exception("Failed to log portfolio status")
 
-            except Exception as e:
-                logger.error(f"Error in daemon loop: {e}")
-                traceback.print_exc()
-                time.sleep(60)  # Wait a minute before retrying
-
-        logger.info("Buy & Hold + DCA daemon stopped")
+    async def _sleep(self, seconds: float):
+        """Sleep for up to `seconds`, returning early when stop() is called."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
     def stop(self):
         """Stop the daemon."""
         self.running = False
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
         logger.info("Stopping Buy & Hold + DCA strategy")
 
+    def close(self, timeout: float = 10.0):
+        """
+        Flush pending notifications and stop the notifier thread.
+
+        Args:
+            timeout: Maximum seconds to wait for queued messages
+        """
+        if self._notify_thread is None:
+            return
+        try:
+            self._notify_queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Telegram notification queue still full on shutdown")
+            return
+        self._notify_thread.join(timeout)
+
 
 def main():
     """Main entry point."""
@@ -349,9 +534,9 @@ def main():
     )
     parser.add_argument(
         "--dca-day",
-        type=str,
+        type=_day_to_int,
         default="monday",
-        choices=["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"],
+        metavar="{" + ",".join(_DAY_NAMES) + "}",
         help="Day of week to execute DCA"
     )
     parser.add_argument(
@@ -366,22 +551,27 @@ def main():
     )
 
     args = parser.parse_args()
+    dca_day_name = _DAY_NAMES[args.dca_day]
 
     # Configure logging
     logger.remove()
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-        level="INFO"
+        level="INFO",
+        enqueue=True,  # Write from a background thread so a slow TTY never blocks a DCA
+        backtrace=False,
+        diagnose=False
     )
 
     if args.daemon:
         logger.add(
-            f"logs/buyhold_dca_{args.symbol}_{args.dca_day}.log",
+            f"logs/buyhold_dca_{args.symbol}_{dca_day_name}.log",
             rotation="100 MB",
             retention="30 days",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
-            level="DEBUG"
+            level="DEBUG",
+            enqueue=True
         )
 
     # Create strategy
@@ -389,12 +579,12 @@ def main():
         account_id=args.account_id,
         symbol=args.symbol,
         dca_amount_usd=args.dca_amount,
-        dca_day=args.dca_day
+        target_weekday=args.dca_day
     )
 
     # Handle signals
     def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}")
+        logger.info("Received signal {}", signum)
         strategy.stop()
         sys.exit(0)
 
@@ -402,33 +592,38 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
 
     # Execute
-    if args.execute_now:
-        logger.info("Executing DCA purchase immediately...")
-        result = strategy.execute_dca_purchase()
-        print(f"Result: {result}")
-    elif args.daemon:
-        logger.info("Starting Buy & Hold + DCA daemon...")
-        logger.info(f"Strategy: Keep all BNB + Buy ${args.dca_amount} every {args.dca_day}")
-        logger.info("This is the PROVEN WINNER with +87.41% backtest returns")
-        strategy.run_daemon()
-    else:
-        # Just show status
-        status = strategy.get_portfolio_status()
-        print("=" * 60)
-        print("BUY & HOLD + FIXED DCA STRATEGY")
-        print("The Proven Winner: +87.41% Returns")
-        print("=" * 60)
-        print(f"Current Portfolio:")
-        print(f"  BNB:  {status['bnb_balance']:.6f}")
-        print(f"  USDT: ${status['usdt_balance']:.2f}")
-        print(f"  BNB Price: ${status['bnb_price']:.2f}")
-        print(f"  Total Value: ${status['total_value']:.2f}")
-        print(f"  P&L: ${status['pnl']:.2f} ({status['pnl_pct']:+.2f}%)")
-        print("=" * 60)
-        print(f"DCA Settings:")
-        print(f"  Amount: ${args.dca_amount} weekly")
-        print(f"  Day: {args.dca_day.capitalize()}")
-        print("=" * 60)
+    try:
+        if args.execute_now:
+            logger.info("Executing DCA purchase immediately...")
+            result = strategy.execute_dca_purchase()
+            print(f"Result: {result}")
+        elif args.daemon:
+            logger.info("Starting Buy & Hold + DCA daemon...")
+            logger.info(
+                "Strategy: Keep all BNB + Buy ${} every {}", args.dca_amount, dca_day_name
+            )
+            logger.info("This is the PROVEN WINNER with +87.41% backtest returns")
+            strategy.run_daemon()
+        else:
+            # Just show status
+            status = strategy.get_portfolio_status()
+            print("=" * 60)
+            print("BUY & HOLD + FIXED DCA STRATEGY")
+            print("The Proven Winner: +87.41% Returns")
+            print("=" * 60)
+            print(f"Current Portfolio:")
+            print(f"  BNB:  {status['bnb_balance']:.6f}")
+            print(f"  USDT: ${status['usdt_balance']:.2f}")
+            print(f"  BNB Price: ${status['bnb_price']:.2f}")
+            print(f"  Total Value: ${status['total_value']:.2f}")
+            print(f"  P&L: ${status['pnl']:.2f} ({status['pnl_pct']:+.2f}%)")
+            print("=" * 60)
+            print(f"DCA Settings:")
+            print(f"  Amount: ${args.dca_amount} weekly")
+            print(f"  Day: {dca_day_name.capitalize()}")
+            print("=" * 60)
+    finally:
+        strategy.close()
 
 
 if __name__ == "__main__":
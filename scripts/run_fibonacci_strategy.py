@@ -26,6 +26,9 @@ Usage:
     # Dry run (no trades)
     python scripts/run_fibonacci_strategy.py --dry-run
 
+    # Several symbols in one process (shared DB pool and HTTP session)
+    python scripts/run_fibonacci_strategy.py --daemon --symbol BNB_USDT,BTC_USDT
+
 Example:
     $ python scripts/run_fibonacci_strategy.py --dry-run
     FIBONACCI TRADING WORKFLOW
@@ -38,18 +41,31 @@ Example:
     DRY RUN: Would execute BUY signal
 """
 
+from __future__ import annotations
+
 import sys
+import signal
 import asyncio
+import threading
+from contextlib import ExitStack
 from pathlib import Path
+from typing import TYPE_CHECKING, List
 from loguru import logger
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path, unless already importable (e.g. run with
+# `python -m scripts.run_fibonacci_strategy` from the project root)
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from src.application.orchestrators import FibonacciTradingOrchestrator
 from src.domain.market_data.services.candle_scheduler import CandleScheduler
 
+# The orchestrator pulls in pandas, numpy and the strategy stack; it is
+# imported in main() after argument parsing so --help and usage errors
+# return immediately
+if TYPE_CHECKING:
+    from src.application.orchestrators import FibonacciTradingOrchestrator
+
 
 async def run_trading_cycle(orchestrator: FibonacciTradingOrchestrator, **kwargs):
     """
@@ -59,47 +75,85 @@ async def run_trading_cycle(orchestrator: FibonacciTradingOrchestrator, **kwargs
         orchestrator: FibonacciTradingOrchestrator instance
         **kwargs: Additional parameters (unused, for scheduler compatibility)
     """
-    result = orchestrator.execute()
+    result = await orchestrator.execute_async()
 
     if result['status'] == 'failure':
-        logger.error(f"Trading cycle failed: {result.get('error')}")
+        logger.error("[{}] Trading cycle failed: {}", orchestrator.symbol, result.get('error'))
     else:
-        logger.info(f"Trading cycle completed. Trade executed: {result['trade_executed']}")
+        logger.info(
+            "[{}] Trading cycle completed. Trade executed: {}",
+            orchestrator.symbol, result['trade_executed'],
+        )
+
+
+async def run_trading_cycle_batch(
+    orchestrators: List[FibonacciTradingOrchestrator], **kwargs
+):
+    """
+    Execute one trading cycle for every symbol concurrently.
+
+    Wall time is roughly the slowest symbol rather than the sum; the shared
+    Binance client caps how many requests are in flight at once.
+    Account reads, trades and saves still run one symbol at a time under
+    the orchestrators' shared account lock.
+
+    Args:
+        orchestrators: One FibonacciTradingOrchestrator per symbol
+        **kwargs: Additional parameters (unused, for scheduler compatibility)
+    """
+    await asyncio.gather(*(run_trading_cycle(o) for o in orchestrators))
 
 
 async def run_daemon(
-    orchestrator: FibonacciTradingOrchestrator,
+    orchestrators: List[FibonacciTradingOrchestrator],
     timeframe: str
 ):
     """
     Run paper trading in daemon mode (scheduled execution).
 
     Args:
-        orchestrator: FibonacciTradingOrchestrator instance
+        orchestrators: One FibonacciTradingOrchestrator per symbol
         timeframe: Candle timeframe for scheduling (e.g., '1d', '4h')
     """
     scheduler = CandleScheduler()
 
-    logger.info(f"Starting daemon mode for {orchestrator.symbol} {timeframe}")
+    symbols = ", ".join(o.symbol for o in orchestrators)
+    logger.info(f"Starting daemon mode for {symbols} {timeframe}")
     logger.info("Trades will execute at candle close using Fibonacci Golden Zone strategy")
 
     # Schedule job
     scheduler.start_job(
         timeframe=timeframe,
-        callback=run_trading_cycle,
-        callback_args=(orchestrator,),
+        callback=run_trading_cycle_batch,
+        callback_args=(orchestrators,),
         callback_kwargs={},
     )
 
-    # Keep running
+    # Keep running until SIGINT/SIGTERM; no periodic wakeups while idle
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
     try:
-        while True:
-            await asyncio.sleep(60)
-    except KeyboardInterrupt:
+        await stop.wait()
+    finally:
         logger.info("Stopping daemon...")
         scheduler.stop_all_jobs()
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's libuv event loop when available (optional dependency)."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -114,7 +168,10 @@ def main():
         help="Paper trading account ID",
     )
     parser.add_argument(
-        "--symbol", type=str, default="BNB_USDT", help="Trading pair (e.g., BNB_USDT)"
+        "--symbol",
+        type=str,
+        default="BNB_USDT",
+        help="Trading pair(s), comma-separated (e.g., BNB_USDT or BNB_USDT,BTC_USDT)",
     )
     parser.add_argument(
         "--timeframe", type=str, default="1d", help="Candle timeframe (e.g., 1d)"
@@ -135,6 +192,7 @@ def main():
     )
 
     args = parser.parse_args()
+    symbols = [s.strip() for s in args.symbol.split(",") if s.strip()]
 
     # Configure logging
     logger.remove()
@@ -144,27 +202,45 @@ def main():
         level="INFO",
     )
     logger.add(
-        project_root / "logs" / f"fibonacci_strategy_{args.symbol}_{args.timeframe}.log",
+        project_root / "logs" / f"fibonacci_strategy_{'+'.join(symbols)}_{args.timeframe}.log",
         rotation="1 day",
         retention="30 days",
         level="DEBUG",
     )
 
-    # Create orchestrator (now contains all workflow logic)
-    orchestrator = FibonacciTradingOrchestrator(
-        account_id=args.account_id,
-        symbol=args.symbol,
-        timeframe=args.timeframe,
-        db_path=args.db,
-        dry_run=args.dry_run,
-    )
-
-    # Run
-    if args.daemon:
-        asyncio.run(run_daemon(orchestrator, args.timeframe))
-    else:
-        # One-time execution
-        asyncio.run(run_trading_cycle(orchestrator))
+    from src.application.orchestrators import FibonacciTradingOrchestrator
+    from src.infrastructure.database import DatabaseManager
+    from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
+
+    # Create one orchestrator per symbol (they contain all workflow logic).
+    # One HTTP session and DB pool serve every symbol and cycle and are
+    # closed on exit. Every symbol trades the same account, so one lock
+    # serializes their account read/trade/save steps.
+    with ExitStack() as stack:
+        db = stack.enter_context(DatabaseManager(args.db))
+        binance_client = stack.enter_context(BinanceRESTClient(testnet=False))
+        account_lock = threading.Lock()
+        orchestrators = [
+            FibonacciTradingOrchestrator(
+                account_id=args.account_id,
+                symbol=symbol,
+                timeframe=args.timeframe,
+                db_path=args.db,
+                dry_run=args.dry_run,
+                db=db,
+                binance_client=binance_client,
+                account_lock=account_lock,
+            )
+            for symbol in symbols
+        ]
+
+        # Run
+        _install_uvloop()
+        if args.daemon:
+            asyncio.run(run_daemon(orchestrators, args.timeframe))
+        else:
+            # One-time execution
+            asyncio.run(run_trading_cycle_batch(orchestrators))
 
 
 if __name__ == "__main__":
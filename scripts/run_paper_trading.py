@@ -23,12 +23,15 @@ Usage:
     python scripts/run_paper_trading.py --dry-run
 """
 
+from __future__ import annotations
+
 import sys
+import time
+import signal
 import asyncio
-import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import logging
 from loguru import logger
 
@@ -36,21 +39,17 @@ from loguru import logger
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.infrastructure.database import DatabaseManager
-from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
-from src.infrastructure.persistence.sqlite_account_repository import (
-    SQLiteAccountRepository,
-)
-from src.domain.features.services.feature_calculator import FeatureCalculator
-from src.domain.reinforcement_learning.services.prediction_service import (
-    RLPredictionService,
-)
-from src.domain.reinforcement_learning.services.model_loader import ModelLoader
+# pandas, the database/exchange clients and the RL stack (torch) are
+# imported where they are first used, so --help and usage errors return
+# immediately
 from src.domain.market_data.services.candle_scheduler import CandleScheduler
 from src.domain.account.value_objects.money import Money
 from src.domain.account.value_objects.currency import Currency
 from src.domain.account.entities.transaction import TransactionType
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class PaperTradingSystem:
     """
@@ -68,6 +67,28 @@ class PaperTradingSystem:
     BUY_THRESHOLD = 0.3
     SELL_THRESHOLD = -0.3
 
+    OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+    # Account descriptions and log line per trade side
+    TRADE_TEMPLATES = {
+        TransactionType.BUY: {
+            "withdraw": "BUY {asset_amount:.6f} {asset} @ ${price:,.2f}",
+            "deposit": "Received {asset_amount:.6f} {asset} from BUY",
+            "trade": "BUY {asset_amount:.6f} {asset} @ ${price:,.2f} (cost: ${usdt_amount:,.2f} USDT)",
+            "executed": "✅ BUY executed: {asset_amount:.6f} {asset} @ ${price:,.2f} (spent ${usdt_amount:,.2f} USDT)",
+        },
+        TransactionType.SELL: {
+            "withdraw": "SELL {asset_amount:.6f} {asset} @ ${price:,.2f}",
+            "deposit": "Received ${usdt_amount:,.2f} USDT from SELL",
+            "trade": "SELL {asset_amount:.6f} {asset} @ ${price:,.2f} (received: ${usdt_amount:,.2f} USDT)",
+            "executed": "✅ SELL executed: {asset_amount:.6f} {asset} @ ${price:,.2f} -> ${usdt_amount:,.2f} USDT",
+        },
+    }
+
+    # Ticker prices are reused for this many seconds (a cycle reads the
+    # position before and after the trade)
+    TICKER_TTL_SECONDS = 5.0
+
     def __init__(
         self,
         account_id: str,
@@ -76,6 +97,7 @@ class PaperTradingSystem:
         models_path: str,
         db_path: str,
         dry_run: bool = False,
+        quantize: bool = False,
     ):
         """
         Initialize paper trading system.
@@ -87,12 +109,28 @@ class PaperTradingSystem:
             models_path: Path to trained models directory
             db_path: Path to SQLite database
             dry_run: If True, don't execute trades
+            quantize: If True, run the model with int8-quantized weights
         """
         self.account_id = account_id
         self.symbol = symbol
         self.timeframe = timeframe
         self.dry_run = dry_run
 
+        # Parsed once instead of on every position lookup and trade
+        self._binance_symbol = symbol.replace("_", "")
+        self._asset_symbol = symbol.split("_")[0]
+        self._asset_currency = Currency.from_string(self._asset_symbol)
+
+        from src.infrastructure.database import DatabaseManager
+        from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
+        from src.infrastructure.persistence.sqlite_account_repository import (
+            SQLiteAccountRepository,
+        )
+        from src.domain.features.services.feature_calculator import FeatureCalculator
+        from src.domain.reinforcement_learning.services.prediction_service import (
+            RLPredictionService,
+        )
+
         # Initialize services
         self.db = DatabaseManager(db_path)
         self.db.initialize()
@@ -101,10 +139,22 @@ class PaperTradingSystem:
         self.binance_client = BinanceRESTClient(testnet=False)
         self.feature_calculator = FeatureCalculator()
         self.prediction_service = RLPredictionService(
-            models_path=models_path, use_core_features=True
+            models_path=models_path, use_core_features=True, quantize=quantize
         )
+        # Load the model now so the first candle-close cycle doesn't pay
+        # for it; a missing model is reported again by that cycle
+        try:
+            self.prediction_service.warmup(symbol, timeframe)
+        except Exception as e:
+            logger.warning(f"Model warmup failed for {symbol} {timeframe}: {e}")
         self.scheduler = CandleScheduler()
 
+        # Last fetched window of candles; later fetches only add what is new
+        self._history = None
+
+        # Binance symbol -> (price, monotonic expiry)
+        self._ticker_cache: Dict[str, Tuple[Optional[float], float]] = {}
+
         logger.info(
             f"Paper Trading System initialized:\n"
             f"  Account: {account_id}\n"
@@ -118,33 +168,70 @@ class PaperTradingSystem:
         """
         Fetch latest candles from Binance.
 
+        After the first call only candles from the last stored one onwards
+        are requested (it was still open when fetched, so it is re-read)
+        and merged into the kept window.
+
         Args:
             limit: Number of candles to fetch (need 200+ for features)
 
         Returns:
             DataFrame with OHLCV data or None if error
         """
+        import numpy as np
+        import pandas as pd
+
         try:
-            # Convert symbol format (BNB_USDT -> BNBUSDT)
-            binance_symbol = self.symbol.replace("_", "")
+            binance_symbol = self._binance_symbol
 
-            logger.info(f"Fetching {limit} candles for {binance_symbol} {self.timeframe}")
+            start_time = None
+            if self._history is not None:
+                start_time = self._history.index[-1].value // 1_000_000
+                logger.info(
+                    f"Fetching {binance_symbol} {self.timeframe} candles since "
+                    f"{self._history.index[-1]}"
+                )
+            else:
+                logger.info(f"Fetching {limit} candles for {binance_symbol} {self.timeframe}")
 
             klines = self.binance_client.get_klines(
-                symbol=binance_symbol, interval=self.timeframe, limit=limit
+                symbol=binance_symbol, interval=self.timeframe, limit=limit,
+                start_time=start_time
             )
 
+            # A full page means more candles were missed than the window
+            # holds; it covers the oldest part of the gap, so refetch latest
+            if start_time is not None and len(klines) >= limit:
+                start_time = None
+                klines = self.binance_client.get_klines(
+                    symbol=binance_symbol, interval=self.timeframe, limit=limit
+                )
+
             if not klines:
                 logger.error("No candle data received from Binance")
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(klines)
-            df["timestamp"] = pd.to_datetime(df["open_time"], unit="ms")
-            df = df[["timestamp", "open", "high", "low", "close", "volume"]]
-            df.set_index("timestamp", inplace=True)
+            # Convert to DataFrame: one typed float64 array per OHLCV
+            # column instead of an object frame of every kline field. Open
+            # times are viewed as datetime64[ms] (no conversion pass).
+            count = len(klines)
+            index = pd.DatetimeIndex(
+                np.fromiter((k["open_time"] for k in klines), np.int64, count)
+                .view("datetime64[ms]"),
+                name="timestamp",
+            )
+            df = pd.DataFrame({
+                column: np.fromiter((k[column] for k in klines), np.float64, count)
+                for column in self.OHLCV_COLUMNS
+            }, index=index)
+
+            if start_time is not None:
+                df = pd.concat([self._history[self._history.index < df.index[0]], df])
+            # Frames are replaced, never modified in place, so the window
+            # can be handed out without a copy
+            self._history = df = df.iloc[-limit:]
 
-            logger.info(f"Fetched {len(df)} candles. Latest: {df.index[-1]}")
+            logger.info(f"Fetched {count} candles. Latest: {df.index[-1]}")
 
             return df
 
@@ -152,10 +239,14 @@ class PaperTradingSystem:
             logger.error(f"Error fetching candles: {e}", exc_info=True)
             return None
 
-    def get_current_position(self) -> dict:
+    def get_current_position(self, current_price: Optional[float] = None) -> dict:
         """
         Get current position from account.
 
+        Args:
+            current_price: Latest price if already known; otherwise it is
+                fetched from the ticker endpoint
+
         Returns:
             Dict with balance info (usdt_balance, asset_balance, current_price)
         """
@@ -164,23 +255,20 @@ class PaperTradingSystem:
             if not account:
                 raise ValueError(f"Account not found: {self.account_id}")
 
-            # Get asset symbol from trading pair (BNB from BNB_USDT)
-            asset_symbol = self.symbol.split("_")[0]
-            asset_currency = Currency.from_string(asset_symbol)
-
-            # Get balances directly from account.balance.available
-            usdt_balance = account.balance.available.get(Currency.USDT, Money(0, Currency.USDT)).amount
-            asset_balance = account.balance.available.get(asset_currency, Money(0, asset_currency)).amount
+            # Get balances (one pass, no zero Money for missing currencies)
+            balances = account.snapshot(self._asset_currency)
+            usdt_balance = float(balances.quote)
+            asset_balance = float(balances.base)
 
             # Get current price
-            binance_symbol = self.symbol.replace("_", "")
-            current_price = self.binance_client.get_ticker_price(binance_symbol)
+            if current_price is None:
+                current_price = self._get_ticker_price(self._binance_symbol)
 
             return {
-                "usdt_balance": float(usdt_balance),
-                "asset_balance": float(asset_balance),
+                "usdt_balance": usdt_balance,
+                "asset_balance": asset_balance,
                 "current_price": current_price or 0.0,
-                "position_value": float(asset_balance) * (current_price or 0.0),
+                "position_value": asset_balance * (current_price or 0.0),
             }
 
         except Exception as e:
@@ -192,7 +280,33 @@ class PaperTradingSystem:
                 "position_value": 0.0,
             }
 
-    def execute_trade(self, action: int, confidence: float, price: float) -> bool:
+    def _get_ticker_price(self, binance_symbol: str) -> Optional[float]:
+        """
+        Get the ticker price, reusing a recent one for TICKER_TTL_SECONDS.
+
+        Args:
+            binance_symbol: Symbol in Binance format (e.g., 'BNBUSDT')
+
+        Returns:
+            Current price or None if unavailable
+        """
+        now = time.monotonic()
+        cached = self._ticker_cache.get(binance_symbol)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        price = self.binance_client.get_ticker_price(binance_symbol)
+        if price is not None:
+            self._ticker_cache[binance_symbol] = (price, now + self.TICKER_TTL_SECONDS)
+        return price
+
+    def execute_trade(
+        self,
+        action: int,
+        confidence: float,
+        price: float,
+        current_price: Optional[float] = None,
+    ) -> Tuple[bool, dict]:
         """
         Execute trade based on model prediction.
 
@@ -200,12 +314,16 @@ class PaperTradingSystem:
             action: Model action (0=SELL, 1=HOLD, 2=BUY)
             confidence: Prediction confidence (0-1)
             price: Current price
+            current_price: Ticker price for the position, if already known
 
         Returns:
-            True if trade executed, False otherwise
+            Tuple of (True if trade executed, position after the decision).
+            The position is computed locally from the trade, so callers
+            don't need to read the account again.
         """
+        # Never raises; returns zero balances on error
+        position = self.get_current_position(current_price)
         try:
-            position = self.get_current_position()
             action_name = self.prediction_service.get_action_name(action)
 
             logger.info(
@@ -218,21 +336,20 @@ class PaperTradingSystem:
 
             if self.dry_run:
                 logger.info("DRY RUN: No trade executed")
-                return False
+                return False, position
 
             account = self.account_repo.find_by_id(self.account_id)
             if not account:
                 raise ValueError(f"Account not found: {self.account_id}")
 
-            # Get asset currency
-            asset_symbol = self.symbol.split("_")[0]
-            asset_currency = Currency.from_string(asset_symbol)
+            asset_symbol = self._asset_symbol
+            asset_currency = self._asset_currency
 
             # BUY: confidence > threshold AND no position
             if action == 2 and confidence > self.BUY_THRESHOLD:
                 if position["asset_balance"] > 0:
                     logger.info("Already in position. Skipping BUY.")
-                    return False
+                    return False, position
 
                 # Buy with available USDT
                 usdt_to_spend = position["usdt_balance"]
@@ -240,83 +357,112 @@ class PaperTradingSystem:
 
                 if amount_to_buy <= 0:
                     logger.warning("No USDT balance to buy")
-                    return False
-
-                # Execute BUY:
-                # 1. Withdraw USDT (deduct from balance)
-                account.withdraw(
-                    Money(usdt_to_spend, Currency.USDT),
-                    description=f"BUY {amount_to_buy:.6f} {asset_symbol} @ ${price:,.2f}"
-                )
-
-                # 2. Deposit asset (add to balance)
-                account.deposit(
-                    Money(amount_to_buy, asset_currency),
-                    description=f"Received {amount_to_buy:.6f} {asset_symbol} from BUY"
-                )
+                    return False, position
 
-                # 3. Record trade transaction
-                account.record_trade(
-                    transaction_type=TransactionType.BUY,
-                    amount=Money(amount_to_buy, asset_currency),
-                    description=f"BUY {amount_to_buy:.6f} {asset_symbol} @ ${price:,.2f} (cost: ${usdt_to_spend:,.2f} USDT)"
+                executed = self._execute_side(
+                    account, TransactionType.BUY, asset_symbol, asset_currency,
+                    amount_to_buy, usdt_to_spend, price
                 )
-
-                # Save account
-                self.account_repo.save(account)
-
-                logger.info(
-                    f"✅ BUY executed: {amount_to_buy:.6f} {asset_symbol} @ ${price:,.2f} "
-                    f"(spent ${usdt_to_spend:,.2f} USDT)"
-                )
-                return True
+                return executed, self._position_after(position, -usdt_to_spend, amount_to_buy)
 
             # SELL: confidence < threshold AND has position
             elif action == 0 and confidence < self.SELL_THRESHOLD:
                 if position["asset_balance"] <= 0:
                     logger.info("No position to sell. Skipping SELL.")
-                    return False
+                    return False, position
 
                 # Sell entire position
                 asset_to_sell = position["asset_balance"]
                 usdt_received = asset_to_sell * price
-
-                # Execute SELL:
-                # 1. Withdraw asset (deduct from balance)
-                account.withdraw(
-                    Money(asset_to_sell, asset_currency),
-                    description=f"SELL {asset_to_sell:.6f} {asset_symbol} @ ${price:,.2f}"
-                )
-
-                # 2. Deposit USDT (add to balance)
-                account.deposit(
-                    Money(usdt_received, Currency.USDT),
-                    description=f"Received ${usdt_received:,.2f} USDT from SELL"
-                )
-
-                # 3. Record trade transaction
-                account.record_trade(
-                    transaction_type=TransactionType.SELL,
-                    amount=Money(asset_to_sell, asset_currency),
-                    description=f"SELL {asset_to_sell:.6f} {asset_symbol} @ ${price:,.2f} (received: ${usdt_received:,.2f} USDT)"
+                executed = self._execute_side(
+                    account, TransactionType.SELL, asset_symbol, asset_currency,
+                    asset_to_sell, usdt_received, price
                 )
-
-                # Save account
-                self.account_repo.save(account)
-
-                logger.info(
-                    f"✅ SELL executed: {asset_to_sell:.6f} {asset_symbol} @ ${price:,.2f} "
-                    f"-> ${usdt_received:,.2f} USDT"
-                )
-                return True
+                return executed, self._position_after(position, usdt_received, -asset_to_sell)
 
             else:
                 logger.info(f"HOLD: No action taken (confidence={confidence:.2%})")
-                return False
+                return False, position
 
         except Exception as e:
             logger.error(f"Error executing trade: {e}", exc_info=True)
-            return False
+            return False, position
+
+    @staticmethod
+    def _position_after(position: dict, usdt_delta: float, asset_delta: float) -> dict:
+        """
+        Apply a trade's balance changes to a position dict.
+
+        Args:
+            position: Position before the trade
+            usdt_delta: USDT change (negative when spent)
+            asset_delta: Asset change (negative when sold)
+
+        Returns:
+            New position dict valued at the same current price
+        """
+        asset_balance = position["asset_balance"] + asset_delta
+        return {
+            **position,
+            "usdt_balance": position["usdt_balance"] + usdt_delta,
+            "asset_balance": asset_balance,
+            "position_value": asset_balance * position["current_price"],
+        }
+
+    def _execute_side(
+        self,
+        account,
+        side: TransactionType,
+        asset_symbol: str,
+        asset_currency: Currency,
+        asset_amount: float,
+        usdt_amount: float,
+        price: float,
+    ) -> bool:
+        """
+        Apply a BUY or SELL to the account and save it.
+
+        BUY withdraws USDT and deposits the asset, SELL the reverse; both
+        record the trade in asset units. Texts come from TRADE_TEMPLATES.
+
+        Args:
+            account: Account to trade on
+            side: TransactionType.BUY or TransactionType.SELL
+            asset_symbol: Asset symbol (e.g., 'BNB')
+            asset_currency: Asset currency
+            asset_amount: Asset units bought or sold
+            usdt_amount: USDT spent or received
+            price: Execution price
+
+        Returns:
+            True (trade executed)
+        """
+        templates = self.TRADE_TEMPLATES[side]
+        values = {
+            "asset": asset_symbol,
+            "asset_amount": asset_amount,
+            "usdt_amount": usdt_amount,
+            "price": price,
+        }
+        usdt = Money(usdt_amount, Currency.USDT)
+        asset = Money(asset_amount, asset_currency)
+        paid, received = (usdt, asset) if side == TransactionType.BUY else (asset, usdt)
+
+        # 1. Withdraw what is paid, 2. deposit what is received,
+        # 3. record the trade transaction
+        account.withdraw(paid, description=templates["withdraw"].format_map(values))
+        account.deposit(received, description=templates["deposit"].format_map(values))
+        account.record_trade(
+            transaction_type=side,
+            amount=asset,
+            description=templates["trade"].format_map(values)
+        )
+
+        # Save account
+        self.account_repo.save(account)
+
+        logger.info(templates["executed"].format_map(values))
+        return True
 
     async def run_trading_cycle(self, **kwargs):
         """
@@ -329,8 +475,12 @@ class PaperTradingSystem:
             logger.info(f"TRADING CYCLE - {datetime.utcnow().isoformat()} UTC")
             logger.info(f"{'=' * 80}\n")
 
-            # 1. Fetch latest candles
-            df = self.fetch_latest_candles(limit=300)
+            # 1. Fetch latest candles and the ticker price concurrently
+            # (independent requests; each runs in a worker thread)
+            df, ticker_price = await asyncio.gather(
+                asyncio.to_thread(self.fetch_latest_candles, 300),
+                asyncio.to_thread(self._get_ticker_price, self._binance_symbol),
+            )
             if df is None or len(df) < 200:
                 logger.error("Insufficient candle data. Skipping cycle.")
                 return
@@ -349,12 +499,14 @@ class PaperTradingSystem:
             )
 
             # 3. Execute trade if threshold met
-            trade_executed = self.execute_trade(
-                action=result.action, confidence=result.confidence, price=result.price
+            trade_executed, position = self.execute_trade(
+                action=result.action,
+                confidence=result.confidence,
+                price=result.price,
+                current_price=ticker_price,
             )
 
             # 4. Log final position
-            position = self.get_current_position()
             total_value = position["usdt_balance"] + position["position_value"]
 
             logger.info(
@@ -387,11 +539,15 @@ class PaperTradingSystem:
             callback_kwargs={},
         )
 
-        # Keep running
+        # Keep running until SIGINT/SIGTERM; no periodic wakeups while idle
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
         try:
-            while True:
-                await asyncio.sleep(60)  # Sleep 1 minute, scheduler handles timing
-        except KeyboardInterrupt:
+            await stop.wait()
+        finally:
             logger.info("Stopping daemon...")
             self.scheduler.stop_all_jobs()
 
@@ -437,6 +593,11 @@ def main():
     parser.add_argument(
         "--dry-run", action="store_true", help="Dry run (no trades executed)"
     )
+    parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Run the model with int8-quantized weights on CPU",
+    )
 
     args = parser.parse_args()
 
@@ -462,6 +623,7 @@ def main():
         models_path=args.models_path,
         db_path=args.db,
         dry_run=args.dry_run,
+        quantize=args.int8,
     )
 
     # Run
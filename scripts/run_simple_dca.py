@@ -10,6 +10,7 @@ Backtest results: +87.41% return
 
 import sys
 import time
+import atexit
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,34 +20,102 @@ sys.path.insert(0, str(project_root))
 
 from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 
+DB_PATH = 'data/jarvis_trading.db'
+ACCOUNT_ID = '868e0dd8-37f5-43ea-a956-7cc05e6bad66'
+
+# Adds delta in place and returns the new balance; matches no row (and
+# returns nothing) if the balance would go negative
+UPDATE_BALANCE_SQL = """
+    UPDATE balances
+    SET available_amount = available_amount + :delta
+    WHERE account_id = :account_id AND currency = :currency
+      AND available_amount + :delta >= 0
+    RETURNING available_amount
+"""
+
+# check_portfolio and execute_weekly_dca run seconds apart; the price
+# fetched by the first is reused by the second within this window
+TICKER_TTL_SECONDS = 5.0
+
+# WAL lets check_portfolio read while a DCA write is in progress; with WAL,
+# synchronous=NORMAL syncs once per checkpoint instead of on every commit
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256MB memory-mapped reads
+    "PRAGMA cache_size = -65536",  # 64MB page cache (default is 2MB)
+)
+
+
+_CONN = None
+
+
+def _connect():
+    """
+    Return the shared trading database connection, opening it on first use.
+
+    One connection serves check_portfolio and execute_weekly_dca, so the
+    PRAGMAs and schema are loaded once per process. It runs in autocommit
+    mode (transactions are explicit) and is closed at exit.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            _CONN.execute(pragma)
+        atexit.register(_CONN.close)
+    return _CONN
+
+
+_CLIENT = None
+_PRICE_CACHE = {}
+
+
+def _get_price(symbol='BNBUSDT'):
+    """
+    Get the last price from the 24h ticker, cached for TICKER_TTL_SECONDS.
+
+    One BinanceRESTClient (and HTTP session) is shared by the whole script.
+    """
+    global _CLIENT
+    now = time.monotonic()
+    cached = _PRICE_CACHE.get(symbol)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    if _CLIENT is None:
+        _CLIENT = BinanceRESTClient(testnet=False)
+        atexit.register(_CLIENT.close)
+    price = float(_CLIENT.get_24h_ticker(symbol)['lastPrice'])
+    _PRICE_CACHE[symbol] = (price, now + TICKER_TTL_SECONDS)
+    return price
+
 
 def check_portfolio():
     """Check current portfolio status."""
-    conn = sqlite3.connect('data/jarvis_trading.db')
+    conn = _connect()
     cursor = conn.cursor()
 
-    # Get balances
+    # Get both balances as one row (0.0 for a missing currency)
     cursor.execute("""
-        SELECT currency, available_amount
+        SELECT
+            COALESCE(SUM(CASE WHEN currency = 'BNB' THEN available_amount END), 0.0),
+            COALESCE(SUM(CASE WHEN currency = 'USDT' THEN available_amount END), 0.0)
         FROM balances
-        WHERE account_id = '868e0dd8-37f5-43ea-a956-7cc05e6bad66'
-    """)
-    balances = dict(cursor.fetchall())
+        WHERE account_id = ?
+    """, (ACCOUNT_ID,))
+    bnb_balance, usdt_balance = cursor.fetchone()
 
     # Get BNB price
-    client = BinanceRESTClient(testnet=False)
-    ticker = client.get_24h_ticker('BNBUSDT')
-    bnb_price = float(ticker['lastPrice'])
+    bnb_price = _get_price('BNBUSDT')
 
     # Calculate value
-    bnb_balance = balances.get('BNB', 0.0)
-    usdt_balance = balances.get('USDT', 0.0)
     total_value = usdt_balance + (bnb_balance * bnb_price)
     pnl = total_value - 5000.0
     pnl_pct = (total_value / 5000.0 - 1) * 100
 
-    conn.close()
-
     return {
         "bnb_balance": bnb_balance,
         "usdt_balance": usdt_balance,
@@ -57,75 +126,67 @@ def check_portfolio():
     }
 
 
-def execute_weekly_dca(amount_usd=200.0):
+def execute_weekly_dca(amount_usd=200.0, bnb_price=None):
     """
     Execute weekly DCA purchase.
 
     Args:
         amount_usd: Amount in USD to invest weekly
+        bnb_price: BNB price already fetched (e.g. by check_portfolio);
+            fetched from the ticker if None
     """
-    conn = sqlite3.connect('data/jarvis_trading.db')
+    conn = _connect()
     cursor = conn.cursor()
 
-    # Get current balances
-    cursor.execute("""
-        SELECT currency, available_amount
-        FROM balances
-        WHERE account_id = '868e0dd8-37f5-43ea-a956-7cc05e6bad66'
-    """)
-    balances = dict(cursor.fetchall())
-
-    usdt_balance = balances.get('USDT', 0.0)
-
-    if usdt_balance < amount_usd:
-        print(f"❌ Insufficient USDT: ${usdt_balance:.2f} < ${amount_usd:.2f}")
-        print("Note: This would need funding in real trading")
-        # For paper trading, we could "add" USDT here if needed
-        conn.close()
-        return None
-
     # Get BNB price
-    client = BinanceRESTClient(testnet=False)
-    ticker = client.get_24h_ticker('BNBUSDT')
-    bnb_price = float(ticker['lastPrice'])
+    if bnb_price is None:
+        bnb_price = _get_price('BNBUSDT')
 
     # Calculate BNB amount
     bnb_amount = amount_usd / bnb_price
 
-    # Update balances
-    new_usdt = usdt_balance - amount_usd
-    new_bnb = balances.get('BNB', 0.0) + bnb_amount
-
-    cursor.execute("""
-        UPDATE balances
-        SET available_amount = ?
-        WHERE account_id = '868e0dd8-37f5-43ea-a956-7cc05e6bad66' AND currency = 'USDT'
-    """, (new_usdt,))
-
-    cursor.execute("""
-        UPDATE balances
-        SET available_amount = ?
-        WHERE account_id = '868e0dd8-37f5-43ea-a956-7cc05e6bad66' AND currency = 'BNB'
-    """, (new_bnb,))
-
-    # Record transaction
+    # Both balance updates and the order are written in one transaction
+    # (a single commit); the context manager rolls back on error. The
+    # balances are updated in place, so no SELECT is needed beforehand.
     timestamp = datetime.now(timezone.utc).isoformat()
-    cursor.execute("""
-        INSERT INTO orders (order_id, account_id, symbol, order_type, quantity, price, status, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        f"DCA_{timestamp}",
-        '868e0dd8-37f5-43ea-a956-7cc05e6bad66',
-        'BNBUSDT',
-        'BUY',
-        bnb_amount,
-        bnb_price,
-        'FILLED',
-        timestamp
-    ))
-
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = cursor.execute(UPDATE_BALANCE_SQL, {
+            "delta": -amount_usd, "account_id": ACCOUNT_ID, "currency": "USDT"
+        }).fetchone()
+        if row is None:
+            usdt_balance = cursor.execute(
+                "SELECT available_amount FROM balances WHERE account_id = ? AND currency = 'USDT'",
+                (ACCOUNT_ID,)
+            ).fetchone()
+            usdt_balance = usdt_balance[0] if usdt_balance else 0.0
+            print(f"❌ Insufficient USDT: ${usdt_balance:.2f} < ${amount_usd:.2f}")
+            print("Note: This would need funding in real trading")
+            # For paper trading, we could "add" USDT here if needed
+            return None
+        new_usdt = row[0]
+
+        row = cursor.execute(UPDATE_BALANCE_SQL, {
+            "delta": bnb_amount, "account_id": ACCOUNT_ID, "currency": "BNB"
+        }).fetchone()
+        if row is None:
+            raise sqlite3.DatabaseError(f"No BNB balance for account {ACCOUNT_ID}")
+        new_bnb = row[0]
+
+        # Record transaction
+        cursor.execute("""
+            INSERT INTO orders (order_id, account_id, symbol, order_type, quantity, price, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            f"DCA_{timestamp}",
+            ACCOUNT_ID,
+            'BNBUSDT',
+            'BUY',
+            bnb_amount,
+            bnb_price,
+            'FILLED',
+            timestamp
+        ))
 
     print(f"✅ DCA Executed:")
     print(f"   Bought: {bnb_amount:.6f} BNB")
@@ -176,7 +237,7 @@ def main():
         print("\n" + "=" * 60)
         print("EXECUTING WEEKLY DCA...")
         print("=" * 60)
-        result = execute_weekly_dca(200.0)
+        result = execute_weekly_dca(200.0, bnb_price=status['bnb_price'])
         if result:
             print("\n✅ DCA Complete! Next DCA: Next Monday")
 
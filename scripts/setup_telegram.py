@@ -20,16 +20,31 @@ Usage:
 
 import sys
 import os
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import argparse
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.infrastructure.notifications.telegram_notifier import TelegramNotifier
-from loguru import logger
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(path: str, mtime: float) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse KEY=VALUE pairs from an env file.
+
+    Cached per (path, mtime), so the file is only re-read after it changes.
+    Returns a tuple of pairs (immutable, safe to share between callers).
+    """
+    lines = (line.strip() for line in Path(path).read_text().splitlines())
+    assignments = (
+        line.split("=", 1)
+        for line in lines
+        if line and not line.startswith("#") and "=" in line
+    )
+    return tuple((key.strip(), value.strip()) for key, value in assignments)
 
 
 class TelegramSetup:
@@ -65,20 +80,13 @@ class TelegramSetup:
         print("   python scripts/setup_telegram.py\n")
 
     def load_existing_env(self) -> dict:
-        """Load existing .env configuration."""
-        config = {}
-
-        if not self.env_path.exists():
-            return config
-
-        with open(self.env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    config[key.strip()] = value.strip()
+        """Load existing .env configuration (cached until the file changes)."""
+        try:
+            mtime = self.env_path.stat().st_mtime
+        except FileNotFoundError:
+            return {}
 
-        return config
+        return dict(_parse_env(str(self.env_path), mtime))
 
     def save_to_env(self, bot_token: str, chat_id: str, authorized_chat_ids: str):
         """Save Telegram configuration to .env file."""
@@ -90,22 +98,36 @@ class TelegramSetup:
         config["TELEGRAM_CHAT_ID"] = chat_id
         config["TELEGRAM_AUTHORIZED_CHAT_IDS"] = authorized_chat_ids
 
-        # Write back to .env
-        with open(self.env_path, "w") as f:
-            f.write("# Telegram Bot Configuration\n")
-            f.write(f"TELEGRAM_BOT_TOKEN={bot_token}\n")
-            f.write(f"TELEGRAM_CHAT_ID={chat_id}\n")
-            f.write(f"TELEGRAM_AUTHORIZED_CHAT_IDS={authorized_chat_ids}\n\n")
-
-            # Write other existing config
-            for key, value in config.items():
-                if not key.startswith("TELEGRAM_"):
-                    f.write(f"{key}={value}\n")
+        # Build the whole file: Telegram header, then other existing config
+        body = "".join([
+            "# Telegram Bot Configuration\n",
+            f"TELEGRAM_BOT_TOKEN={bot_token}\n",
+            f"TELEGRAM_CHAT_ID={chat_id}\n",
+            f"TELEGRAM_AUTHORIZED_CHAT_IDS={authorized_chat_ids}\n\n",
+            *(
+                f"{key}={value}\n"
+                for key, value in config.items()
+                if not key.startswith("TELEGRAM_")
+            ),
+        ])
+
+        # Write beside the target and rename over it, so a reader (e.g. the
+        # bot process) never sees a truncated or half-written .env
+        tmp_path = self.env_path.with_name(self.env_path.name + ".tmp")
+        tmp_path.write_text(body)
+        tmp_path.chmod(0o600)  # Holds the bot token
+        os.replace(tmp_path, self.env_path)
+
+        # A rewrite within the mtime resolution would otherwise hit the cache
+        _parse_env.cache_clear()
 
         print(f"✅ Configuration saved to {self.env_path}")
 
     def test_bot(self, bot_token: str, chat_id: str) -> bool:
         """Test Telegram bot connection."""
+        # Deferred so --help and a cancelled setup skip the HTTP client stack
+        from src.infrastructure.notifications.telegram_notifier import TelegramNotifier
+
         try:
             print("\n🔧 Testing Telegram bot...")
 
@@ -185,7 +207,7 @@ class TelegramSetup:
 
         # Test before saving
         if not self.test_bot(bot_token, chat_id):
-            print("\n⚠️ Bot test failed. Save anyway? (y/n): ", end="")
+            print("\n⚠️ Bot test failed. Save anyway? (y/n): ", end="", flush=True)
             if input().strip().lower() != "y":
                 print("❌ Setup cancelled")
                 return False
@@ -226,6 +248,10 @@ class TelegramSetup:
 
 def main():
     """Main entry point."""
+    # Prompts and instructions must reach the terminal before input() blocks,
+    # even when stdout is a pipe (block-buffered by default)
+    sys.stdout.reconfigure(line_buffering=True)
+
     parser = argparse.ArgumentParser(description="Telegram bot setup")
     parser.add_argument(
         "--test", action="store_true", help="Test existing configuration"
@@ -17,65 +17,158 @@ Comandos disponíveis:
 
 import sys
 import os
-import sqlite3
-import json
+import time
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 import asyncio
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import (
-    Application,
-    CommandHandler,
-    CallbackQueryHandler,
-    MessageHandler,
-    filters,
-    ContextTypes
-)
+from telegram import Update
+from telegram.ext import Application, CommandHandler, ContextTypes, Defaults
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from loguru import logger
 from scripts.watchlist_manager import WatchlistManager
+from src.infrastructure.database import DatabaseManager
 from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 
 
+# Textos fixos de /start e /help, montados uma vez no carregamento do módulo
+START_MESSAGE = (
+    "🤖 *Bot de Trading Multi-Ativo*\n\n"
+    "Comandos disponíveis:\n"
+    "/status - Status do portfólio\n"
+    "/balance - Balanços detalhados\n"
+    "/trades - Últimas transações\n"
+    "/watchlist - Lista de ativos\n"
+    "/add SYMBOL - Adicionar ativo\n"
+    "/remove SYMBOL - Remover ativo\n"
+    "/performance - Métricas\n"
+    "/pause - Pausar trading\n"
+    "/resume - Retomar trading\n"
+    "/help - Ajuda"
+)
+
+HELP_MESSAGE = """
+*📚 AJUDA - Bot de Trading*
+
+*Comandos Principais:*
+/status - Status completo do portfólio
+/balance - Balanços detalhados por moeda
+/trades - Últimas 10 transações
+
+*Gerenciar Watchlist:*
+/watchlist - Lista ativos monitorados
+/add SYMBOL - Adicionar ativo (ex: /add SOLUSDT)
+/remove SYMBOL - Remover ativo
+
+*Controle:*
+/pause - Pausar trading automático
+/resume - Retomar trading
+/performance - Métricas de performance
+
+*Estratégia:*
+O bot monitora múltiplos ativos em 3 timeframes (1h, 4h, 1d) e executa trades baseado em distâncias otimizadas das médias móveis.
+
+*Parâmetros:*
+• 1H: Trades rápidos (10% capital)
+• 4H: Swing trades (20% capital)
+• 1D: Position trades (30% capital)
+"""
+
+
+def _short_datetime(timestamp: str) -> str:
+    """
+    Formata um timestamp ISO 8601 do banco como 'DD/MM HH:MM'.
+
+    Os campos são recortados direto da string; formatos curtos (só data)
+    passam por fromisoformat().
+    """
+    if len(timestamp) < 16:
+        return datetime.fromisoformat(timestamp).strftime("%d/%m %H:%M")
+    return f"{timestamp[8:10]}/{timestamp[5:7]} {timestamp[11:16]}"
+
+
 class TradingBot:
     """Bot Telegram para gerenciar trading multi-ativo."""
 
+    TICKER_TTL_SECONDS = 5.0
+    INITIAL_CAPITAL = 5000.0
+    TIMEFRAMES = ('1h', '4h', '1d')
+
     def __init__(self, token: str, chat_id: str):
         self.token = token
         self.allowed_chat_id = int(chat_id)
         self.db_path = 'data/jarvis_trading.db'
         self.account_id = '868e0dd8-37f5-43ea-a956-7cc05e6bad66'
 
-        self.watchlist = WatchlistManager()
+        # Um único cliente (sessão HTTP keep-alive com pool de conexões)
+        # para os comandos e para a watchlist
         self.client = BinanceRESTClient(testnet=False)
+        self.watchlist = WatchlistManager(client=self.client)
+
+        # Pool de conexões compartilhado por todos os comandos: o cache de
+        # páginas e os PRAGMAs (WAL, mmap) sobrevivem entre mensagens
+        self.db = DatabaseManager(self.db_path)
+
+        # Tickers recentes, compartilhados entre comandos: símbolo -> (ticker, expira_em)
+        self._ticker_cache: Dict[str, Tuple[Dict, float]] = {}
 
         # Estado do daemon
         self.daemon_paused = False
 
+    async def _fetch_tickers(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Busca o ticker 24h de vários símbolos.
+
+        Tickers obtidos há menos de TICKER_TTL_SECONDS são reaproveitados,
+        então comandos repetidos não refazem as mesmas requisições. Os
+        restantes vêm todos em uma única requisição.
+
+        Returns:
+            Dict símbolo -> ticker (None se a requisição falhou)
+        """
+        now = time.monotonic()
+        result: Dict[str, Optional[Dict]] = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._ticker_cache.get(symbol)
+            if cached is not None and now < cached[1]:
+                result[symbol] = cached[0]
+            else:
+                missing.append(symbol)
+
+        tickers = await self.client.get_24h_tickers_async(missing) if missing else {}
+        expires_at = time.monotonic() + self.TICKER_TTL_SECONDS
+        for symbol in missing:
+            ticker = tickers.get(symbol)
+            if ticker is not None:
+                self._ticker_cache[symbol] = (ticker, expires_at)
+            result[symbol] = ticker
+
+        return result
+
+    async def _query(self, sql: str, params: tuple = ()) -> list:
+        """
+        Executa uma consulta de leitura em uma thread de trabalho.
+
+        O sqlite3 é bloqueante; rodando fora do event loop, outros comandos
+        continuam sendo atendidos enquanto a consulta (ou a trava de escrita
+        do daemon) não termina. As conexões vêm do pool compartilhado.
+        """
+        def fetch_all() -> list:
+            with self.db.get_connection() as conn:
+                return conn.execute(sql, params).fetchall()
+
+        return await asyncio.to_thread(fetch_all)
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Comando /start."""
         if update.effective_chat.id != self.allowed_chat_id:
             return
 
-        await update.message.reply_text(
-            "🤖 *Bot de Trading Multi-Ativo*\n\n"
-            "Comandos disponíveis:\n"
-            "/status - Status do portfólio\n"
-            "/balance - Balanços detalhados\n"
-            "/trades - Últimas transações\n"
-            "/watchlist - Lista de ativos\n"
-            "/add SYMBOL - Adicionar ativo\n"
-            "/remove SYMBOL - Remover ativo\n"
-            "/performance - Métricas\n"
-            "/pause - Pausar trading\n"
-            "/resume - Retomar trading\n"
-            "/help - Ajuda",
-            parse_mode='Markdown'
-        )
+        await update.message.reply_text(START_MESSAGE, parse_mode='Markdown')
 
     async def status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Comando /status - Status geral do portfólio."""
@@ -84,62 +177,66 @@ class TradingBot:
 
         try:
             # Obter balanços
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            balances = dict(await self._query("""
                 SELECT currency, available_amount
                 FROM balances
                 WHERE account_id = ?
-            """, (self.account_id,))
-
-            balances = dict(cursor.fetchall())
+            """, (self.account_id,)))
             usdt_balance = balances.get('USDT', 0.0)
             total_value = usdt_balance
 
             # Calcular valor das posições
-            positions_text = ""
-            for symbol in self.watchlist.symbols:
+            held = [
+                symbol for symbol in self.watchlist.symbols
+                if balances.get(symbol.replace('USDT', ''), 0) > 0
+            ]
+            tickers = await self._fetch_tickers(held)
+
+            positions = []
+            for symbol in held:
                 base_currency = symbol.replace('USDT', '')
-                if base_currency in balances and balances[base_currency] > 0:
+                ticker = tickers[symbol]
+                if ticker:
                     quantity = balances[base_currency]
-                    ticker = self.client.get_24h_ticker(symbol)
                     price = float(ticker['lastPrice'])
                     value = quantity * price
                     total_value += value
                     change_pct = float(ticker['priceChangePercent'])
 
                     emoji = "🟢" if change_pct > 0 else "🔴"
-                    positions_text += f"{emoji} {base_currency}: {quantity:.4f} @ ${price:.2f} ({change_pct:+.1f}%)\n"
+                    positions.append(
+                        f"{emoji} {base_currency}: {quantity:.4f} @ ${price:.2f} ({change_pct:+.1f}%)\n"
+                    )
 
             # Calcular P&L
-            initial_capital = 5000.0
-            pnl = total_value - initial_capital
-            pnl_pct = (pnl / initial_capital) * 100
-
-            message = f"📊 *STATUS DO PORTFÓLIO*\n\n"
-            message += f"💰 Valor Total: *${total_value:.2f}*\n"
-            message += f"📈 P&L: ${pnl:.2f} ({pnl_pct:+.2f}%)\n"
-            message += f"💵 USDT Livre: ${usdt_balance:.2f}\n\n"
-
-            if positions_text:
-                message += f"*Posições Abertas:*\n{positions_text}\n"
+            pnl = total_value - self.INITIAL_CAPITAL
+            pnl_pct = (pnl / self.INITIAL_CAPITAL) * 100
+
+            parts = [
+                "📊 *STATUS DO PORTFÓLIO*\n\n",
+                f"💰 Valor Total: *${total_value:.2f}*\n",
+                f"📈 P&L: ${pnl:.2f} ({pnl_pct:+.2f}%)\n",
+                f"💵 USDT Livre: ${usdt_balance:.2f}\n\n",
+            ]
+
+            if positions:
+                parts += ["*Posições Abertas:*\n", *positions, "\n"]
             else:
-                message += "Sem posições abertas\n\n"
+                parts.append("Sem posições abertas\n\n")
 
             # Watchlist
-            message += f"📋 *Watchlist:* {', '.join(self.watchlist.symbols)}\n"
+            parts.append(f"📋 *Watchlist:* {', '.join(self.watchlist.symbols)}\n")
 
             # Status do daemon
             status_emoji = "⚠️" if self.daemon_paused else "✅"
-            message += f"\n{status_emoji} Trading: {'Pausado' if self.daemon_paused else 'Ativo'}"
+            parts.append(f"\n{status_emoji} Trading: {'Pausado' if self.daemon_paused else 'Ativo'}")
 
-            conn.close()
+            message = "".join(parts)
 
             await update.message.reply_text(message, parse_mode='Markdown')
 
         except Exception as e:
-            logger.error(f"Erro no comando status: {e}")
+            logger.exception("Erro no comando status")
             await update.message.reply_text(f"❌ Erro ao obter status: {e}")
 
     async def balance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -148,52 +245,47 @@ class TradingBot:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT currency, available_amount, reserved_amount
+            balances = await self._query("""
+                SELECT currency, available_amount + reserved_amount AS total
                 FROM balances
                 WHERE account_id = ? AND (available_amount > 0 OR reserved_amount > 0)
                 ORDER BY currency
             """, (self.account_id,))
 
-            balances = cursor.fetchall()
-            conn.close()
-
             if not balances:
                 await update.message.reply_text("💰 Sem balanços")
                 return
 
-            message = "💰 *BALANÇOS*\n\n"
-            total_usd = 0
-
-            for currency, available, reserved in balances:
-                total = available + reserved
-
+            # Em fases: balanços (uma consulta), preços (uma requisição),
+            # valores; a mensagem só é montada no fim
+            symbols = {
+                currency: f"{currency}USDT" for currency, _ in balances if currency != 'USDT'
+            }
+            tickers = await self._fetch_tickers(list(symbols.values()))
+            prices: Dict[str, float] = {'USDT': 1.0}
+            prices.update({
+                currency: float(tickers[symbol]['lastPrice'])
+                for currency, symbol in symbols.items() if tickers.get(symbol)
+            })
+            values = [total * prices.get(currency, 0.0) for currency, total in balances]
+
+            parts = ["💰 *BALANÇOS*\n\n"]
+
+            for (currency, total), value in zip(balances, values):
                 if currency == 'USDT':
-                    value = total
-                    message += f"*{currency}:* {total:.2f}\n"
+                    parts.append(f"*{currency}:* {total:.2f}\n")
+                elif currency in prices:
+                    parts.append(f"*{currency}:* {total:.6f} @ ${prices[currency]:.2f} = ${value:.2f}\n")
                 else:
-                    # Obter preço atual
-                    symbol = f"{currency}USDT"
-                    try:
-                        ticker = self.client.get_24h_ticker(symbol)
-                        price = float(ticker['lastPrice'])
-                        value = total * price
-                        message += f"*{currency}:* {total:.6f} @ ${price:.2f} = ${value:.2f}\n"
-                    except:
-                        value = 0
-                        message += f"*{currency}:* {total:.6f}\n"
-
-                total_usd += value
+                    parts.append(f"*{currency}:* {total:.6f}\n")
 
-            message += f"\n💎 *Total em USD:* ${total_usd:.2f}"
+            parts.append(f"\n💎 *Total em USD:* ${sum(values):.2f}")
+            message = "".join(parts)
 
             await update.message.reply_text(message, parse_mode='Markdown')
 
         except Exception as e:
-            logger.error(f"Erro no comando balance: {e}")
+            logger.exception("Erro no comando balance")
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def trades(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -202,10 +294,7 @@ class TradingBot:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            trades = await self._query("""
                 SELECT symbol, order_type, quantity, price, created_at
                 FROM orders
                 WHERE account_id = ? AND status = 'FILLED'
@@ -213,28 +302,29 @@ class TradingBot:
                 LIMIT 10
             """, (self.account_id,))
 
-            trades = cursor.fetchall()
-            conn.close()
-
             if not trades:
                 await update.message.reply_text("📊 Sem transações")
                 return
 
-            message = "📊 *ÚLTIMAS TRANSAÇÕES*\n\n"
+            parts = ["📊 *ÚLTIMAS TRANSAÇÕES*\n\n"]
 
             for symbol, order_type, quantity, price, created_at in trades:
-                dt = datetime.fromisoformat(created_at)
-                time_str = dt.strftime("%d/%m %H:%M")
+                time_str = _short_datetime(created_at)
                 emoji = "🟢" if order_type == 'BUY' else "🔴"
+                base = symbol.replace('USDT', '')
 
-                message += f"{emoji} {time_str}\n"
-                message += f"{order_type} {quantity:.4f} {symbol.replace('USDT', '')}\n"
-                message += f"@ ${price:.2f}\n\n"
+                parts.append(
+                    f"{emoji} {time_str}\n"
+                    f"{order_type} {quantity:.4f} {base}\n"
+                    f"@ ${price:.2f}\n\n"
+                )
+
+            message = "".join(parts)
 
             await update.message.reply_text(message, parse_mode='Markdown')
 
         except Exception as e:
-            logger.error(f"Erro no comando trades: {e}")
+            logger.exception("Erro no comando trades")
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def watchlist_cmd(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -243,42 +333,48 @@ class TradingBot:
             return
 
         try:
-            symbols_data = self.watchlist.list_symbols()
+            symbols_data = await asyncio.to_thread(self.watchlist.list_symbols)
 
             if not symbols_data:
                 await update.message.reply_text("📋 Watchlist vazia")
                 return
 
-            message = "📋 *WATCHLIST*\n\n"
+            # Obter preços atuais
+            tickers = await self._fetch_tickers([item['symbol'] for item in symbols_data])
+
+            parts = ["📋 *WATCHLIST*\n\n"]
 
             for item in symbols_data:
                 symbol = item['symbol']
                 base = symbol.replace('USDT', '')
 
-                # Obter preço atual
-                ticker = self.client.get_24h_ticker(symbol)
-                price = float(ticker['lastPrice'])
-                change = float(ticker['priceChangePercent'])
+                ticker = tickers[symbol]
+                if ticker:
+                    price = float(ticker['lastPrice'])
+                    change = float(ticker['priceChangePercent'])
 
-                emoji = "🟢" if change > 0 else "🔴"
-                message += f"{emoji} *{base}*: ${price:.2f} ({change:+.1f}%)\n"
+                    emoji = "🟢" if change > 0 else "🔴"
+                    parts.append(f"{emoji} *{base}*: ${price:.2f} ({change:+.1f}%)\n")
+                else:
+                    parts.append(f"⚪ *{base}*: preço indisponível\n")
 
                 # Parâmetros
-                if item['params_1h']:
-                    message += f"  1H: {item['params_1h']['buy_threshold']:.1f}% / {item['params_1h']['sell_threshold']:.1f}%\n"
-                if item['params_4h']:
-                    message += f"  4H: {item['params_4h']['buy_threshold']:.1f}% / {item['params_4h']['sell_threshold']:.1f}%\n"
-                if item['params_1d']:
-                    message += f"  1D: {item['params_1d']['buy_threshold']:.1f}% / {item['params_1d']['sell_threshold']:.1f}%\n"
+                for tf in self.TIMEFRAMES:
+                    params = item[f'params_{tf}']
+                    if params:
+                        parts.append(
+                            f"  {tf.upper()}: {params['buy_threshold']:.1f}% / {params['sell_threshold']:.1f}%\n"
+                        )
 
-                message += "\n"
+                parts.append("\n")
 
-            message += f"Total: {len(symbols_data)} ativos"
+            parts.append(f"Total: {len(symbols_data)} ativos")
+            message = "".join(parts)
 
             await update.message.reply_text(message, parse_mode='Markdown')
 
         except Exception as e:
-            logger.error(f"Erro no comando watchlist: {e}")
+            logger.exception("Erro no comando watchlist")
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def add_symbol(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -299,25 +395,28 @@ class TradingBot:
         await update.message.reply_text(f"⏳ Adicionando {symbol}...")
 
         try:
-            result = self.watchlist.add_symbol(symbol)
+            # Baixa histórico e calcula parâmetros: roda fora do event loop
+            result = await asyncio.to_thread(self.watchlist.add_symbol, symbol)
 
             if result['status'] == 'success':
                 params = result.get('params', {})
-                message = f"✅ *{symbol} adicionado com sucesso!*\n\n"
+                parts = [f"✅ *{symbol} adicionado com sucesso!*\n\n"]
 
                 if params:
-                    message += "*Parâmetros calculados:*\n"
-                    for tf in ['1h', '4h', '1d']:
+                    parts.append("*Parâmetros calculados:*\n")
+                    for tf in self.TIMEFRAMES:
                         if tf in params:
                             p = params[tf]
-                            message += f"{tf.upper()}: Compra {p['buy_threshold']:.1f}%, Venda {p['sell_threshold']:.1f}%\n"
+                            parts.append(f"{tf.upper()}: Compra {p['buy_threshold']:.1f}%, Venda {p['sell_threshold']:.1f}%\n")
+
+                message = "".join(parts)
 
                 await update.message.reply_text(message, parse_mode='Markdown')
             else:
                 await update.message.reply_text(f"❌ {result['message']}")
 
         except Exception as e:
-            logger.error(f"Erro ao adicionar {symbol}: {e}")
+            logger.exception("Erro ao adicionar {}", symbol)
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def remove_symbol(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -335,7 +434,7 @@ class TradingBot:
             symbol += 'USDT'
 
         try:
-            result = self.watchlist.remove_symbol(symbol)
+            result = await asyncio.to_thread(self.watchlist.remove_symbol, symbol)
 
             if result['status'] == 'success':
                 await update.message.reply_text(f"✅ {symbol} removido da watchlist")
@@ -343,7 +442,7 @@ class TradingBot:
                 await update.message.reply_text(f"❌ {result['message']}")
 
         except Exception as e:
-            logger.error(f"Erro ao remover {symbol}: {e}")
+            logger.exception("Erro ao remover {}", symbol)
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def performance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -352,47 +451,52 @@ class TradingBot:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Estatísticas de trades
-            cursor.execute("""
+            # Estatísticas e acertos em uma única passada ordenada: cada venda
+            # é comparada com a última compra do mesmo ativo (buy_seq agrupa
+            # uma compra com as vendas seguintes), mesmo que essa compra seja
+            # anterior à janela de 7 dias
+            stats = (await self._query("""
+                WITH fills AS (
+                    SELECT
+                        symbol, order_type, price, created_at,
+                        SUM(CASE WHEN order_type = 'BUY' THEN 1 ELSE 0 END) OVER (
+                            PARTITION BY symbol ORDER BY created_at
+                        ) AS buy_seq
+                    FROM orders
+                    WHERE account_id = ? AND status = 'FILLED'
+                ),
+                priced AS (
+                    SELECT
+                        order_type, price, created_at,
+                        MAX(CASE WHEN order_type = 'BUY' THEN price END) OVER (
+                            PARTITION BY symbol, buy_seq
+                        ) AS last_buy_price
+                    FROM fills
+                )
                 SELECT
                     COUNT(*) as total_trades,
-                    SUM(CASE WHEN order_type = 'BUY' THEN 1 ELSE 0 END) as buys,
-                    SUM(CASE WHEN order_type = 'SELL' THEN 1 ELSE 0 END) as sells
-                FROM orders
-                WHERE account_id = ? AND status = 'FILLED'
-                AND created_at > datetime('now', '-7 days')
-            """, (self.account_id,))
-
-            stats = cursor.fetchone()
-            total_trades, buys, sells = stats
-
-            # Win rate (simplificado)
-            cursor.execute("""
-                SELECT COUNT(*) FROM transactions
-                WHERE account_id = ? AND transaction_type = 'SELL'
-                AND amount > 0
-                AND created_at > datetime('now', '-7 days')
-            """, (self.account_id,))
-
-            profitable_trades = cursor.fetchone()[0]
-
-            conn.close()
+                    COALESCE(SUM(order_type = 'BUY'), 0) as buys,
+                    COALESCE(SUM(order_type = 'SELL'), 0) as sells,
+                    COALESCE(SUM(order_type = 'SELL' AND price > last_buy_price), 0) as wins
+                FROM priced
+                WHERE created_at > datetime('now', '-7 days')
+            """, (self.account_id,)))[0]
+            total_trades, buys, sells, profitable_trades = stats
 
             win_rate = (profitable_trades / sells * 100) if sells > 0 else 0
 
-            message = "📈 *PERFORMANCE (7 DIAS)*\n\n"
-            message += f"Total de Trades: {total_trades}\n"
-            message += f"Compras: {buys}\n"
-            message += f"Vendas: {sells}\n"
-            message += f"Taxa de Acerto: {win_rate:.1f}%\n"
+            message = (
+                "📈 *PERFORMANCE (7 DIAS)*\n\n"
+                f"Total de Trades: {total_trades}\n"
+                f"Compras: {buys}\n"
+                f"Vendas: {sells}\n"
+                f"Taxa de Acerto: {win_rate:.1f}%\n"
+            )
 
             await update.message.reply_text(message, parse_mode='Markdown')
 
         except Exception as e:
-            logger.error(f"Erro no comando performance: {e}")
+            logger.exception("Erro no comando performance")
             await update.message.reply_text(f"❌ Erro: {e}")
 
     async def pause(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -416,38 +520,15 @@ class TradingBot:
         if update.effective_chat.id != self.allowed_chat_id:
             return
 
-        message = """
-*📚 AJUDA - Bot de Trading*
-
-*Comandos Principais:*
-/status - Status completo do portfólio
-/balance - Balanços detalhados por moeda
-/trades - Últimas 10 transações
-
-*Gerenciar Watchlist:*
-/watchlist - Lista ativos monitorados
-/add SYMBOL - Adicionar ativo (ex: /add SOLUSDT)
-/remove SYMBOL - Remover ativo
-
-*Controle:*
-/pause - Pausar trading automático
-/resume - Retomar trading
-/performance - Métricas de performance
-
-*Estratégia:*
-O bot monitora múltiplos ativos em 3 timeframes (1h, 4h, 1d) e executa trades baseado em distâncias otimizadas das médias móveis.
-
-*Parâmetros:*
-• 1H: Trades rápidos (10% capital)
-• 4H: Swing trades (20% capital)
-• 1D: Position trades (30% capital)
-        """
-
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await update.message.reply_text(HELP_MESSAGE, parse_mode='Markdown')
 
 
 def main():
     """Main entry point."""
+    # Logs gravados por uma thread de fundo: um terminal lento não trava o loop
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", enqueue=True, backtrace=False, diagnose=False)
+
     # Obter credenciais do .env
     from dotenv import load_dotenv
     load_dotenv()
@@ -462,8 +543,9 @@ def main():
     # Criar bot
     bot = TradingBot(token, chat_id)
 
-    # Criar application
-    app = Application.builder().token(token).build()
+    # Criar application (block=False: cada comando roda como tarefa própria,
+    # então um /add demorado não segura os demais)
+    app = Application.builder().token(token).defaults(Defaults(block=False)).build()
 
     # Adicionar handlers
     app.add_handler(CommandHandler("start", bot.start))
@@ -479,10 +561,14 @@ def main():
     app.add_handler(CommandHandler("help", bot.help_cmd))
 
     logger.info("🤖 Bot Telegram iniciado")
-    logger.info(f"Chat ID autorizado: {chat_id}")
+    logger.info("Chat ID autorizado: {}", chat_id)
 
     # Executar bot
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    try:
+        app.run_polling(allowed_updates=Update.ALL_TYPES)
+    finally:
+        bot.db.close()
+        bot.client.close()
 
 
 if __name__ == "__main__":
@@ -9,9 +9,10 @@ e calcula parâmetros ideais automaticamente.
 import sys
 import json
 import sqlite3
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
 
@@ -24,10 +25,26 @@ from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 class WatchlistManager:
     """Gerencia watchlist de ativos para trading."""
 
-    def __init__(self):
+    # Validade da watchlist em memória. Outros processos (bot, comando
+    # update) alteram o banco sem passar por invalidate_params().
+    WATCHLIST_TTL_SECONDS = 30.0
+
+    def __init__(self, client: Optional[BinanceRESTClient] = None):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            client: Cliente Binance compartilhado (reaproveita a sessão HTTP
+                e o pool de conexões do chamador); cria um se omitido
+        """
         self.watchlist_file = 'data/watchlist.json'
         self.db_path = 'data/jarvis_trading.db'
-        self.client = BinanceRESTClient(testnet=False)
+        self.client = client or BinanceRESTClient(testnet=False)
+
+        # Linhas ativas com parâmetros já decodificados, por símbolo, e o
+        # instante em que expiram; recarregado quando a watchlist muda
+        # aqui ou após WATCHLIST_TTL_SECONDS
+        self._watchlist_cache: Optional[Tuple[Dict[str, Dict], float]] = None
 
         # Criar tabela de watchlist se não existir
         self._init_database()
@@ -117,6 +134,7 @@ class WatchlistManager:
 
             conn.commit()
             self.symbols.append(symbol)
+            self.invalidate_params()
 
             if not init_only:
                 # Baixar dados históricos
@@ -140,6 +158,7 @@ class WatchlistManager:
                     symbol
                 ))
                 conn.commit()
+                self.invalidate_params()
 
                 return {
                     'status': 'success',
@@ -182,6 +201,7 @@ class WatchlistManager:
 
             conn.commit()
             self.symbols.remove(symbol)
+            self.invalidate_params()
 
             return {'status': 'success', 'message': f'{symbol} removido da watchlist'}
 
@@ -193,6 +213,24 @@ class WatchlistManager:
 
     def list_symbols(self) -> List[Dict]:
         """Lista todos os símbolos com seus parâmetros."""
+        return [dict(row) for row in self._active_symbols().values()]
+
+    def _active_symbols(self) -> Dict[str, Dict]:
+        """
+        Retorna as linhas ativas da watchlist, indexadas por símbolo.
+
+        O JSON de cada timeframe é decodificado uma única vez por carga;
+        /watchlist e as verificações de sinais leem o resultado em memória
+        por até WATCHLIST_TTL_SECONDS.
+        """
+        now = time.monotonic()
+        if self._watchlist_cache is None or now >= self._watchlist_cache[1]:
+            rows = self._load_watchlist_rows()
+            self._watchlist_cache = (rows, now + self.WATCHLIST_TTL_SECONDS)
+        return self._watchlist_cache[0]
+
+    def _load_watchlist_rows(self) -> Dict[str, Dict]:
+        """Lê do banco os símbolos ativos e decodifica seus parâmetros."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -203,19 +241,20 @@ class WatchlistManager:
             ORDER BY symbol
         """)
 
-        results = []
-        for row in cursor.fetchall():
-            results.append({
+        rows = {
+            row[0]: {
                 'symbol': row[0],
                 'added_at': row[1],
                 'params_1h': json.loads(row[2]) if row[2] else {},
                 'params_4h': json.loads(row[3]) if row[3] else {},
                 'params_1d': json.loads(row[4]) if row[4] else {},
                 'last_updated': row[5]
-            })
+            }
+            for row in cursor.fetchall()
+        }
 
         conn.close()
-        return results
+        return rows
 
     def download_historical_data(self, symbol: str):
         """Baixa dados históricos para todos os timeframes."""
@@ -325,22 +364,20 @@ class WatchlistManager:
         return params
 
     def get_params(self, symbol: str, timeframe: str) -> Optional[Dict]:
-        """Obtém parâmetros otimizados para um símbolo e timeframe."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(f"""
-            SELECT params_{timeframe}
-            FROM watchlist
-            WHERE symbol = ? AND is_active = 1
-        """, (symbol,))
+        """
+        Obtém parâmetros otimizados para um símbolo e timeframe.
 
-        row = cursor.fetchone()
-        conn.close()
+        Lido da watchlist em memória (veja _active_symbols), então cada
+        verificação de sinais não reabre o banco nem decodifica JSON.
+        """
+        row = self._active_symbols().get(symbol)
+        if row is None:
+            return None
+        return row.get(f'params_{timeframe}') or None
 
-        if row and row[0]:
-            return json.loads(row[0])
-        return None
+    def invalidate_params(self):
+        """Descarta a watchlist em memória (recarregada sob demanda)."""
+        self._watchlist_cache = None
 
     def update_all_params(self):
         """Atualiza parâmetros de todos os símbolos."""
@@ -367,6 +404,8 @@ class WatchlistManager:
             conn.commit()
             conn.close()
 
+        self.invalidate_params()
+
 
 def main():
     """Interface CLI para gerenciar watchlist."""
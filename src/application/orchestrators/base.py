@@ -98,8 +98,11 @@ class BaseOrchestrator(ABC):
         Returns:
             Error result dict or None if should retry
         """
+        # Passed as arguments: the error text (e.g. a context dict) may
+        # contain braces, which loguru would try to format as fields
         logger.error(
-            f"Orchestration error (attempt {retry_count + 1}/{max_retries}): {error}",
+            "Orchestration error (attempt {}/{}): {}",
+            retry_count + 1, max_retries, error,
             exc_info=True,
             extra={'context': context}
         )
@@ -16,11 +16,14 @@ Business logic is in:
 - src/domain/market_data/ (data fetching)
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 from loguru import logger
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import time
+import threading
 
 from src.application.orchestrators.base import BaseOrchestrator, OrchestrationError
 from src.strategies import FibonacciGoldenZoneStrategy
@@ -29,6 +32,7 @@ from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 from src.infrastructure.persistence.sqlite_account_repository import (
     SQLiteAccountRepository,
 )
+from src.domain.account.entities.account import Account
 from src.domain.account.value_objects.money import Money
 from src.domain.account.value_objects.currency import Currency
 from src.domain.account.entities.transaction import TransactionType
@@ -60,8 +64,16 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
         ... )
         >>> result = orchestrator.execute()
         >>> print(result['status'])  # 'success' or 'failure'
+
+    The Binance session and database pool are created once and reused by
+    every execute() call; use it as a context manager (or call close())
+    to release them.
     """
 
+    WORKFLOW_NAME = "Fibonacci Trading Workflow"
+    OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+    SIGNAL_CACHE_SIZE = 2  # Current and previous candle
+
     def __init__(
         self,
         account_id: str,
@@ -69,7 +81,10 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
         timeframe: str,
         db_path: str,
         dry_run: bool = False,
-        candles_limit: int = 300
+        candles_limit: int = 300,
+        db: Optional[DatabaseManager] = None,
+        binance_client: Optional[BinanceRESTClient] = None,
+        account_lock: Optional[threading.Lock] = None
     ):
         """
         Initialize Fibonacci trading orchestrator.
@@ -81,19 +96,47 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
             db_path: Path to SQLite database
             dry_run: If True, don't execute actual trades
             candles_limit: Number of candles to fetch (need 200+ for EMAs)
+            db: Shared database manager (overrides db_path); not closed
+                by close(), the caller owns it
+            binance_client: Shared Binance client; not closed by close(),
+                the caller owns it
+            account_lock: Lock shared by every orchestrator trading the
+                same account, so their position/trade/save steps run one
+                at a time on a freshly read account
         """
         self.account_id = account_id
         self.symbol = symbol
         self.timeframe = timeframe
         self.dry_run = dry_run
         self.candles_limit = candles_limit
+        self._binance_symbol = symbol.replace("_", "")
+
+        # Resolved once: an unsupported asset fails here, not every cycle
+        self._asset_symbol = symbol.split("_")[0]
+        self._asset_currency = Currency.from_string(self._asset_symbol)
+
+        # Signal per (symbol, timeframe, latest candle open_time): while no
+        # new candle has opened, the full fetch and analysis are skipped
+        self._signal_cache: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+
+        # Last candles_limit candles; later fetches only add what is new
+        self._history: Optional[pd.DataFrame] = None
 
-        # Initialize services and repositories
-        self.db = DatabaseManager(db_path)
+        # Account loaded once per cycle and shared by the position lookup
+        # and the trade; re-read under account_lock before each cycle's
+        # position/trade step
+        self._account_cache: Optional[Account] = None
+        self._account_lock = account_lock or threading.Lock()
+
+        # Initialize services and repositories (shared ones are reused so
+        # several symbols can run on one DB pool and HTTP session)
+        self._owns_db = db is None
+        self.db = db or DatabaseManager(db_path)
         self.db.initialize()
 
         self.account_repo = SQLiteAccountRepository(self.db)
-        self.binance_client = BinanceRESTClient(testnet=False)
+        self._owns_client = binance_client is None
+        self.binance_client = binance_client or BinanceRESTClient(testnet=False)
         self.strategy = FibonacciGoldenZoneStrategy()
 
         logger.info(
@@ -105,13 +148,29 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
             f"  Dry run: {dry_run}"
         )
 
+    def close(self) -> None:
+        """Close the Binance session and pooled database connections it created."""
+        if self._owns_client:
+            self.binance_client.close()
+        if self._owns_db:
+            self.db.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute complete Fibonacci trading workflow.
 
         Workflow steps:
-        1. Fetch latest candles from Binance
-        2. Generate Fibonacci strategy signal
+        1. Fetch latest candles from Binance (skipped if the latest
+           candle is unchanged since the last run)
+        2. Generate Fibonacci strategy signal (or reuse the cached one)
         3. Get current account position
         4. Execute trade if signal is BUY/SELL
         5. Return workflow results
@@ -126,105 +185,348 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
                     'error': <error message if failed>
                 }
         """
-        start_time = time.time()
-        workflow_name = "Fibonacci Trading Workflow"
+        start_time = self._start_workflow()
+        try:
+            logger.info("Step 1/4: Fetching market data...")
+            latest = self.binance_client.get_klines(
+                self._binance_symbol, self.timeframe, limit=1
+            )
+            key = self._signal_cache_key(latest)
+            signal = self._cached_signal(key)
+            if signal is None:
+                signal = self._signal_from_candles(key, self._fetch_candles(latest))
+            return self._complete_workflow(signal, latest, start_time)
+        except Exception as e:
+            return self._fail_workflow(e, start_time)
+
+    async def execute_async(self, **kwargs) -> Dict[str, Any]:
+        """
+        Execute the workflow with a non-blocking candle fetch.
+
+        Same steps and result as execute(), but the Binance requests are
+        awaited and the account reads/writes run in a worker thread, so
+        the event loop keeps serving other jobs meanwhile.
+
+        Returns:
+            Dict with workflow results (see execute())
+        """
+        start_time = self._start_workflow()
+        try:
+            logger.info("Step 1/4: Fetching market data...")
+            latest = await self.binance_client.get_klines_async(
+                self._binance_symbol, self.timeframe, limit=1
+            )
+            key = self._signal_cache_key(latest)
+            signal = self._cached_signal(key)
+            if signal is None:
+                df = await self._fetch_candles_async(latest)
+                signal = self._signal_from_candles(key, df)
+            # Position lookup and trade do blocking SQLite reads/writes
+            return await asyncio.to_thread(
+                self._complete_workflow, signal, latest, start_time
+            )
+        except Exception as e:
+            return self._fail_workflow(e, start_time)
 
-        self._log_execution_start(workflow_name, {
+    def _start_workflow(self) -> float:
+        """Log workflow start and return the start time."""
+        self._log_execution_start(self.WORKFLOW_NAME, {
             'symbol': self.symbol,
             'timeframe': self.timeframe,
             'dry_run': self.dry_run
         })
+        return time.time()
 
-        try:
-            # Step 1: Fetch market data
-            logger.info("Step 1/4: Fetching market data...")
-            df = self._fetch_candles()
-            if df is None or len(df) < 200:
-                raise OrchestrationError(
-                    "Insufficient market data",
-                    {'candles_received': len(df) if df is not None else 0}
-                )
+    def _signal_cache_key(
+        self, latest: List[Dict]
+    ) -> Optional[Tuple[str, str, int]]:
+        """
+        Build the signal cache key from the latest kline.
 
-            # Step 2: Generate signal
-            logger.info("Step 2/4: Generating trading signal...")
-            signal = self._generate_signal(df)
+        Args:
+            latest: Result of a limit=1 klines request
+
+        Returns:
+            (symbol, timeframe, open_time) or None if the request failed
+        """
+        if not latest:
+            return None
+        return (self.symbol, self.timeframe, latest[-1]["open_time"])
+
+    def _cached_signal(
+        self, key: Optional[Tuple[str, str, int]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached signal for key, or None on a miss."""
+        signal = self._signal_cache.get(key)
+        if signal is not None:
+            logger.info(
+                f"Step 2/4: Candle {key[2]} unchanged, reusing cached signal"
+            )
+        return signal
+
+    def _signal_from_candles(
+        self, key: Optional[Tuple[str, str, int]], df: Optional[pd.DataFrame]
+    ) -> Dict[str, Any]:
+        """
+        Generate the signal for fetched candles and cache it under key.
+
+        Args:
+            key: Cache key from _signal_cache_key (None disables caching)
+            df: Market data from step 1
+
+        Returns:
+            Signal dictionary from strategy
+
+        Raises:
+            OrchestrationError: If market data is insufficient
+        """
+        if df is None or len(df) < 200:
+            raise OrchestrationError(
+                "Insufficient market data",
+                {'candles_received': len(df) if df is not None else 0}
+            )
+
+        logger.info("Step 2/4: Generating trading signal...")
+        signal = self._generate_signal(df)
+
+        if key is not None:
+            self._signal_cache[key] = signal
+            while len(self._signal_cache) > self.SIGNAL_CACHE_SIZE:
+                del self._signal_cache[next(iter(self._signal_cache))]
+
+        return signal
+
+    def _complete_workflow(
+        self, signal: Dict[str, Any], latest: List[Dict], start_time: float
+    ) -> Dict[str, Any]:
+        """
+        Run workflow steps 3-4 for a signal.
+
+        Args:
+            signal: Strategy signal from step 2
+            latest: Latest kline from step 1 (its close is the live price)
+            start_time: Workflow start time
+
+        Returns:
+            Success result dict
+        """
+        # Other symbols on the same account may be trading concurrently:
+        # read, trade and save the account as one step under the shared lock
+        with self._account_lock:
+            self._account_cache = None
 
             # Step 3: Get current position
             logger.info("Step 3/4: Fetching current position...")
-            position = self._get_position()
+            position = self._get_position(latest[-1]["close"] if latest else None)
 
             # Step 4: Execute trade
             logger.info("Step 4/4: Executing trade...")
             trade_executed = self._execute_trade(signal, position)
 
-            # Success result
-            result = {
-                'status': 'success',
-                'signal': signal,
-                'trade_executed': trade_executed,
-                'position': position,
-                'timestamp': datetime.utcnow().isoformat()
+        result = {
+            'status': 'success',
+            'signal': signal,
+            'trade_executed': trade_executed,
+            'position': position,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+        self._log_execution_end(self.WORKFLOW_NAME, result, time.time() - start_time)
+        return result
+
+    def _fail_workflow(self, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Build and log the failure result for a workflow error."""
+        error_result = self._handle_error(
+            error=error,
+            context={
+                'symbol': self.symbol,
+                'timeframe': self.timeframe,
+                'account_id': self.account_id
             }
+        )
 
-            duration = time.time() - start_time
-            self._log_execution_end(workflow_name, result, duration)
+        self._log_execution_end(
+            self.WORKFLOW_NAME, error_result, time.time() - start_time
+        )
+        return error_result
 
-            return result
+    def _fetch_candles(self, latest: Optional[List[Dict]] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch latest candles from Binance.
 
-        except Exception as e:
-            error_result = self._handle_error(
-                error=e,
-                context={
-                    'symbol': self.symbol,
-                    'timeframe': self.timeframe,
-                    'account_id': self.account_id
-                }
-            )
+        Only candles from the last known one onwards are requested once a
+        history exists; see _klines_params and _update_history.
+
+        Args:
+            latest: Latest kline from step 1, used to size the gap since
+                the stored history
 
-            duration = time.time() - start_time
-            self._log_execution_end(workflow_name, error_result, duration)
+        Returns:
+            DataFrame with OHLCV data or None if error
+        """
+        try:
+            params = self._klines_params(self._gap_fits_window(latest))
+            klines = self.binance_client.get_klines(**params)
+            if self._gap_exceeds_window(params, klines):
+                klines = self.binance_client.get_klines(
+                    **self._klines_params(incremental=False)
+                )
+            return self._update_history(klines)
 
-            return error_result
+        except Exception as e:
+            logger.error(f"Error fetching candles: {e}", exc_info=True)
+            raise OrchestrationError("Failed to fetch market data", {'error': str(e)})
 
-    def _fetch_candles(self) -> Optional[pd.DataFrame]:
+    async def _fetch_candles_async(
+        self, latest: Optional[List[Dict]] = None
+    ) -> Optional[pd.DataFrame]:
         """
-        Fetch latest candles from Binance.
+        Fetch latest candles from Binance without blocking the event loop.
+
+        Args:
+            latest: Latest kline from step 1 (see _fetch_candles)
 
         Returns:
             DataFrame with OHLCV data or None if error
         """
         try:
-            # Convert symbol format (BNB_USDT -> BNBUSDT)
-            binance_symbol = self.symbol.replace("_", "")
+            params = self._klines_params(self._gap_fits_window(latest))
+            klines = await self.binance_client.get_klines_async(**params)
+            if self._gap_exceeds_window(params, klines):
+                klines = await self.binance_client.get_klines_async(
+                    **self._klines_params(incremental=False)
+                )
+            return self._update_history(klines)
+
+        except Exception as e:
+            logger.error(f"Error fetching candles: {e}", exc_info=True)
+            raise OrchestrationError("Failed to fetch market data", {'error': str(e)})
+
+    def _klines_params(self, incremental: bool = True) -> Dict[str, Any]:
+        """
+        Build get_klines arguments for the next fetch and log it.
 
+        With a history, the request starts at the last stored candle: it
+        was still open when fetched, so it is re-read along with any
+        candles opened since.
+
+        Args:
+            incremental: Start from the stored history if there is one
+
+        Returns:
+            Keyword arguments for BinanceRESTClient.get_klines
+        """
+        params = {
+            "symbol": self._binance_symbol,
+            "interval": self.timeframe,
+            "limit": self.candles_limit,
+        }
+        if incremental and self._history is not None:
+            params["start_time"] = self._history.index[-1].value // 1_000_000
             logger.info(
-                f"Fetching {self.candles_limit} candles for "
-                f"{binance_symbol} {self.timeframe}"
+                "Fetching {} {} candles since {}",
+                self._binance_symbol, self.timeframe, self._history.index[-1]
             )
-
-            klines = self.binance_client.get_klines(
-                symbol=binance_symbol,
-                interval=self.timeframe,
-                limit=self.candles_limit
+        else:
+            logger.info(
+                "Fetching {} candles for {} {}",
+                self.candles_limit, self._binance_symbol, self.timeframe
             )
+        return params
+
+    def _gap_fits_window(self, latest: Optional[List[Dict]]) -> bool:
+        """
+        Check if the candles since the stored history fit in one window.
+
+        The gap is counted from the stored candle spacing up to the
+        latest candle's open time. After a long outage the latest window
+        is requested directly instead of paging through the whole gap.
+
+        Args:
+            latest: Result of a limit=1 klines request, if known
 
-            if not klines:
-                logger.error("No candle data received from Binance")
-                return None
+        Returns:
+            False only if the gap is known to exceed candles_limit
+        """
+        if not latest or self._history is None or len(self._history) < 2:
+            return True
 
-            # Convert to DataFrame
-            df = pd.DataFrame(klines)
-            df["timestamp"] = pd.to_datetime(df["open_time"], unit="ms")
-            df = df[["timestamp", "open", "high", "low", "close", "volume"]]
-            df.set_index("timestamp", inplace=True)
+        index = self._history.index
+        step_ms = (index[-1] - index[-2]).value // 1_000_000
+        last_ms = index[-1].value // 1_000_000
+        missing = (latest[-1]["open_time"] - last_ms) // step_ms + 1
+        if missing <= self.candles_limit:
+            return True
 
-            logger.info(f"Fetched {len(df)} candles. Latest: {df.index[-1]}")
+        logger.info("{} candles missed, refetching the latest window", missing)
+        return False
 
-            return df
+    def _gap_exceeds_window(self, params: Dict[str, Any], klines: List[Dict]) -> bool:
+        """
+        Check if an incremental fetch came back as a full page.
 
-        except Exception as e:
-            logger.error(f"Error fetching candles: {e}", exc_info=True)
-            raise OrchestrationError("Failed to fetch market data", {'error': str(e)})
+        A full page means more candles were missed than the window holds,
+        so it covers the oldest part of the gap, not the latest candles.
+        Only reached when the gap could not be sized up front.
+        """
+        return "start_time" in params and len(klines) >= self.candles_limit
+
+    def _update_history(self, klines: List[Dict]) -> Optional[pd.DataFrame]:
+        """
+        Merge fetched klines into the stored window of candles.
+
+        Fetched rows replace stored rows from their first open time on;
+        the window is trimmed to candles_limit.
+
+        Args:
+            klines: Klines from BinanceRESTClient
+
+        Returns:
+            Copy of the updated window (the strategy adds columns to the
+            frame it receives), or None if no klines were received
+        """
+        df = self._klines_to_dataframe(klines)
+        if df is None:
+            return None
+
+        if self._history is not None:
+            df = pd.concat([self._history[self._history.index < df.index[0]], df])
+
+        self._history = df.iloc[-self.candles_limit:]
+        return self._history.copy()
+
+    @staticmethod
+    def _klines_to_dataframe(klines: List[Dict]) -> Optional[pd.DataFrame]:
+        """
+        Convert parsed klines to an OHLCV DataFrame indexed by open time.
+
+        Args:
+            klines: Klines from BinanceRESTClient
+
+        Returns:
+            DataFrame with OHLCV data or None if no klines
+        """
+        if not klines:
+            logger.error("No candle data received from Binance")
+            return None
+
+        # Build only the OHLCV columns as float64 arrays instead of a full
+        # 11-column frame from the dicts that is then projected down; the
+        # index is built directly rather than via a column + set_index
+        count = len(klines)
+        index = pd.DatetimeIndex(
+            np.fromiter((k["open_time"] for k in klines), np.int64, count)
+            .view("datetime64[ms]"),
+            name="timestamp",
+        )
+        df = pd.DataFrame({
+            column: np.fromiter((k[column] for k in klines), np.float64, count)
+            for column in FibonacciTradingOrchestrator.OHLCV_COLUMNS
+        }, index=index)
+
+        logger.info("Fetched {} candles. Latest: {}", count, df.index[-1])
+
+        return df
 
     def _generate_signal(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -239,26 +541,30 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
         try:
             signal = self.strategy.generate_signal(df)
 
+            # Templates are only formatted if a sink accepts the level.
+            # BUY/SELL signals carry 'entry' instead of 'current_price'.
             logger.info(
-                f"\nFibonacci Strategy Signal:\n"
-                f"  Action: {signal['action']}\n"
-                f"  Reason: {signal['reason']}\n"
-                f"  Trend: {signal['trend']}\n"
-                f"  Current Price: ${signal['current_price']:,.2f}"
+                "\nFibonacci Strategy Signal:\n"
+                "  Action: {s[action]}\n"
+                "  Reason: {s[reason]}\n"
+                "  Trend: {s[trend]}\n"
+                "  Current Price: ${price:,.2f}",
+                s=signal,
+                price=signal.get('current_price', signal.get('entry', 0.0)),
             )
 
             # Log additional details if available
             if 'fib_levels' in signal:
                 logger.info(
-                    f"\nFibonacci Levels:\n"
-                    f"  High: ${signal['fib_levels']['high']:,.2f}\n"
-                    f"  Low: ${signal['fib_levels']['low']:,.2f}\n"
-                    f"  Golden Zone: ${signal['fib_levels']['0.618']:,.2f} - "
-                    f"${signal['fib_levels']['0.500']:,.2f}"
+                    "\nFibonacci Levels:\n"
+                    "  High: ${f[high]:,.2f}\n"
+                    "  Low: ${f[low]:,.2f}\n"
+                    "  Golden Zone: ${f[0.618]:,.2f} - ${f[0.500]:,.2f}",
+                    f=signal['fib_levels'],
                 )
 
             if 'confirmations' in signal and signal['confirmations']:
-                logger.info(f"  Confirmations: {', '.join(signal['confirmations'])}")
+                logger.info("  Confirmations: {}", ', '.join(signal['confirmations']))
 
             return signal
 
@@ -269,36 +575,30 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
                 {'error': str(e)}
             )
 
-    def _get_position(self) -> Dict[str, float]:
+    def _get_position(self, current_price: Optional[float] = None) -> Dict[str, float]:
         """
         Get current position from account repository.
 
+        Args:
+            current_price: Latest price if already known; otherwise it is
+                fetched from the ticker endpoint
+
         Returns:
             Dict with balance info (usdt_balance, asset_balance, current_price)
         """
         try:
-            account = self.account_repo.find_by_id(self.account_id)
-            if not account:
-                raise OrchestrationError(
-                    "Account not found",
-                    {'account_id': self.account_id}
-                )
+            account = self._get_account()
 
-            # Get asset symbol from trading pair (BNB from BNB_USDT)
-            asset_symbol = self.symbol.split("_")[0]
-            asset_currency = Currency.from_string(asset_symbol)
-
-            # Get balances
-            usdt_balance = account.balance.available.get(
-                Currency.USDT, Money(0, Currency.USDT)
-            ).amount
-            asset_balance = account.balance.available.get(
-                asset_currency, Money(0, asset_currency)
-            ).amount
+            # Get balances (one pass, no zero Money for missing currencies)
+            balances = account.snapshot(self._asset_currency)
+            usdt_balance = balances.quote
+            asset_balance = balances.base
 
             # Get current price
-            binance_symbol = self.symbol.replace("_", "")
-            current_price = self.binance_client.get_ticker_price(binance_symbol)
+            if current_price is None:
+                current_price = self.binance_client.get_ticker_price(
+                    self._binance_symbol
+                )
 
             position = {
                 "usdt_balance": float(usdt_balance),
@@ -308,11 +608,14 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
             }
 
             logger.info(
-                f"\nCurrent Position:\n"
-                f"  USDT: ${position['usdt_balance']:,.2f}\n"
-                f"  {asset_symbol}: {position['asset_balance']:.6f}\n"
-                f"  Position value: ${position['position_value']:,.2f}\n"
-                f"  Total value: ${position['usdt_balance'] + position['position_value']:,.2f}"
+                "\nCurrent Position:\n"
+                "  USDT: ${p[usdt_balance]:,.2f}\n"
+                "  {asset}: {p[asset_balance]:.6f}\n"
+                "  Position value: ${p[position_value]:,.2f}\n"
+                "  Total value: ${total:,.2f}",
+                p=position,
+                asset=self._asset_symbol,
+                total=position['usdt_balance'] + position['position_value'],
             )
 
             return position
@@ -324,6 +627,26 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
                 {'error': str(e)}
             )
 
+    def _get_account(self) -> Account:
+        """
+        Get the trading account, reading it from the repository once per cycle.
+
+        Returns:
+            Account aggregate
+
+        Raises:
+            OrchestrationError: If the account does not exist
+        """
+        if self._account_cache is None:
+            account = self.account_repo.find_by_id(self.account_id)
+            if not account:
+                raise OrchestrationError(
+                    "Account not found",
+                    {'account_id': self.account_id}
+                )
+            self._account_cache = account
+        return self._account_cache
+
     def _execute_trade(self, signal: Dict, position: Dict) -> bool:
         """
         Execute trade based on signal and position.
@@ -345,27 +668,22 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
 
             # Dry run mode
             if self.dry_run:
-                logger.info(f"DRY RUN: Would execute {action} signal")
+                logger.info("DRY RUN: Would execute {} signal", action)
                 if action in ['BUY', 'SELL']:
                     logger.info(
-                        f"  Entry: ${signal['entry']:,.2f}\n"
-                        f"  Stop Loss: ${signal['stop_loss']:,.2f}\n"
-                        f"  Take Profit 1: ${signal['take_profit_1']:,.2f}\n"
-                        f"  Take Profit 2: ${signal['take_profit_2']:,.2f}\n"
-                        f"  Confirmations: {', '.join(signal.get('confirmations', []))}"
+                        "  Entry: ${s[entry]:,.2f}\n"
+                        "  Stop Loss: ${s[stop_loss]:,.2f}\n"
+                        "  Take Profit 1: ${s[take_profit_1]:,.2f}\n"
+                        "  Take Profit 2: ${s[take_profit_2]:,.2f}\n"
+                        "  Confirmations: {confirmations}",
+                        s=signal,
+                        confirmations=', '.join(signal.get('confirmations', [])),
                     )
                 return False
 
             # Get account
-            account = self.account_repo.find_by_id(self.account_id)
-            if not account:
-                raise OrchestrationError(
-                    "Account not found",
-                    {'account_id': self.account_id}
-                )
+            account = self._get_account()
 
-            asset_symbol = self.symbol.split("_")[0]
-            asset_currency = Currency.from_string(asset_symbol)
             price = signal['entry']
 
             # Execute BUY
@@ -375,7 +693,8 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
                     return False
 
                 return self._execute_buy(
-                    account, position, asset_symbol, asset_currency, price, signal
+                    account, position, self._asset_symbol, self._asset_currency,
+                    price, signal
                 )
 
             # Execute SELL
@@ -385,7 +704,8 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
                     return False
 
                 return self._execute_sell(
-                    account, position, asset_symbol, asset_currency, price, signal
+                    account, position, self._asset_symbol, self._asset_currency,
+                    price, signal
                 )
 
             return False
@@ -434,15 +754,21 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
         )
 
         self.account_repo.save(account)
+        self._account_cache = account
 
         logger.info(
-            f"✅ BUY executed:\n"
-            f"  Amount: {amount_to_buy:.6f} {asset_symbol}\n"
-            f"  Price: ${price:,.2f}\n"
-            f"  Cost: ${usdt_to_spend:,.2f} USDT\n"
-            f"  Stop Loss: ${signal['stop_loss']:,.2f}\n"
-            f"  Take Profit 1: ${signal['take_profit_1']:,.2f}\n"
-            f"  Take Profit 2: ${signal['take_profit_2']:,.2f}"
+            "✅ BUY executed:\n"
+            "  Amount: {amount:.6f} {asset}\n"
+            "  Price: ${price:,.2f}\n"
+            "  Cost: ${cost:,.2f} USDT\n"
+            "  Stop Loss: ${s[stop_loss]:,.2f}\n"
+            "  Take Profit 1: ${s[take_profit_1]:,.2f}\n"
+            "  Take Profit 2: ${s[take_profit_2]:,.2f}",
+            amount=amount_to_buy,
+            asset=asset_symbol,
+            price=price,
+            cost=usdt_to_spend,
+            s=signal,
         )
         return True
 
@@ -481,14 +807,20 @@ class FibonacciTradingOrchestrator(BaseOrchestrator):
         )
 
         self.account_repo.save(account)
+        self._account_cache = account
 
         logger.info(
-            f"✅ SELL executed:\n"
-            f"  Amount: {asset_to_sell:.6f} {asset_symbol}\n"
-            f"  Price: ${price:,.2f}\n"
-            f"  Received: ${usdt_received:,.2f} USDT\n"
-            f"  Stop Loss: ${signal['stop_loss']:,.2f}\n"
-            f"  Take Profit 1: ${signal['take_profit_1']:,.2f}\n"
-            f"  Take Profit 2: ${signal['take_profit_2']:,.2f}"
+            "✅ SELL executed:\n"
+            "  Amount: {amount:.6f} {asset}\n"
+            "  Price: ${price:,.2f}\n"
+            "  Received: ${received:,.2f} USDT\n"
+            "  Stop Loss: ${s[stop_loss]:,.2f}\n"
+            "  Take Profit 1: ${s[take_profit_1]:,.2f}\n"
+            "  Take Profit 2: ${s[take_profit_2]:,.2f}",
+            amount=asset_to_sell,
+            asset=asset_symbol,
+            price=price,
+            received=usdt_received,
+            s=signal,
         )
         return True
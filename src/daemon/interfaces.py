@@ -28,6 +28,15 @@ class ExchangeClient(Protocol):
         """
         ...
 
+    def get_all_prices(self) -> Dict[str, float]:
+        """
+        Get the current price of every symbol in one request.
+
+        Returns:
+            Dict mapping symbol to last price (empty on error)
+        """
+        ...
+
     def get_klines(
         self,
         symbol: str,
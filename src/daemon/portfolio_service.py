@@ -64,27 +64,26 @@ class PortfolioService:
             usdt_balance = balances.get('USDT', 0.0)
             total_value = usdt_balance
 
-            # Get positions with current values
-            positions = []
+            # Get held positions
+            held = []
             for symbol in watchlist:
                 position = self.position_repo.get_position(symbol)
-
                 if position and position.quantity > 0:
-                    try:
-                        # Get current market price
-                        ticker = self.exchange_client.get_24h_ticker(symbol)
-                        current_price = float(ticker['lastPrice'])
+                    held.append(position)
 
-                        # Add to total value
-                        position_value = position.get_value(current_price)
-                        total_value += position_value
+            # One request prices every held symbol
+            prices = self.exchange_client.get_all_prices() if held else {}
 
-                        positions.append(position)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error getting price for {symbol}: {e}"
-                        )
+            # Add current values
+            positions = []
+            for position in held:
+                current_price = prices.get(position.symbol)
+                if current_price is None:
+                    logger.error(f"Error getting price for {position.symbol}")
+                    continue
+
+                total_value += position.get_value(current_price)
+                positions.append(position)
 
             return PortfolioStatus(
                 total_value=total_value,
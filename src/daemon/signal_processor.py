@@ -4,8 +4,9 @@ Signal detection and processing service.
 Monitors market data, generates trading signals, and handles signal prioritization.
 """
 
-import pandas as pd
+import numpy as np
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from loguru import logger
 from datetime import datetime, timezone
@@ -22,6 +23,10 @@ class SignalProcessor:
     filters conflicts, and prioritizes by timeframe.
     """
 
+    # Checks run side by side, at most this many at once (the Binance
+    # client keeps the same number of pooled connections)
+    MAX_CONCURRENT_CHECKS = 4
+
     def __init__(
         self,
         exchange_client: ExchangeClient,
@@ -76,9 +81,11 @@ class SignalProcessor:
                 )
                 return None
 
-            # Get current price
-            ticker = self.exchange_client.get_24h_ticker(symbol)
-            current_price = float(ticker['lastPrice'])
+            # Get current price (one shared snapshot prices every symbol)
+            current_price = self.exchange_client.get_all_prices().get(symbol)
+            if current_price is None:
+                logger.warning(f"No current price for {symbol}")
+                return None
 
             # Get historical data for MA calculation
             ma_period = params['ma_period']
@@ -95,10 +102,13 @@ class SignalProcessor:
                 )
                 return None
 
-            # Calculate moving average
-            df = pd.DataFrame(klines)
-            df['close'] = df['close'].astype(float)
-            ma = df['close'].rolling(window=ma_period).mean().iloc[-1]
+            # Calculate moving average (mean of the last ma_period closes)
+            closes = np.fromiter(
+                (kline['close'] for kline in klines),
+                dtype=np.float64,
+                count=len(klines)
+            )
+            ma = float(closes[-ma_period:].mean())
 
             # Calculate distance from MA (%)
             distance = ((current_price - ma) / ma) * 100
@@ -164,6 +174,8 @@ class SignalProcessor:
 
         Implements rate limiting to avoid excessive API calls.
         Each symbol/timeframe combination has minimum check interval.
+        Due checks are network-bound, so they run concurrently in a small
+        thread pool; the cycle takes about as long as the slowest check.
 
         Args:
             timeframes: List of timeframes to check
@@ -171,8 +183,8 @@ class SignalProcessor:
         Returns:
             List of detected signals
         """
-        signals = []
         now = time.time()
+        due = []
 
         for symbol in self.watchlist.symbols:
             for timeframe in timeframes:
@@ -189,15 +201,22 @@ class SignalProcessor:
                     )
                     continue
 
-                # Check for signal
-                signal = self.check_signal(symbol, timeframe)
-                if signal:
-                    signals.append(signal)
-                    logger.info(f"Signal detected: {signal}")
+                due.append((symbol, timeframe))
 
                 # Update last check time
                 self.last_check[check_key] = now
 
+        # Check for signals (results keep watchlist/timeframe order)
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_CHECKS) as pool:
+            futures = [
+                pool.submit(self.check_signal, symbol, timeframe)
+                for symbol, timeframe in due
+            ]
+            signals = [signal for signal in (f.result() for f in futures) if signal]
+
+        for signal in signals:
+            logger.info(f"Signal detected: {signal}")
+
         logger.info(f"Signal check complete: {len(signals)} signals found")
         return signals
 
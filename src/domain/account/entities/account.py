@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
+from ..value_objects.balance_snapshot import BalanceSnapshot
 from ..value_objects.currency import Currency
 from ..value_objects.money import Money
 from .balance import Balance
@@ -135,6 +136,49 @@ class Account:
         )
         self.transactions.append(transaction)
 
+    def execute_buy(
+        self,
+        cost: Money,
+        quantity: Money,
+        price: float,
+        description: str,
+        reference_id: Optional[str] = None,
+    ) -> None:
+        """Execute a spot buy as a single balance update and transaction.
+
+        Deducts the quote cost, credits the purchased quantity and records
+        one BUY transaction carrying the price and cost as metadata.
+
+        Args:
+            cost: Quote currency spent (e.g., USDT)
+            quantity: Base currency received (e.g., BNB)
+            price: Execution price in quote currency
+            description: Trade description
+            reference_id: Reference to order or position
+
+        Raises:
+            ValueError: If account is closed, currencies match or funds insufficient
+        """
+        if not self.is_active:
+            raise ValueError("Cannot trade on closed account")
+        if cost.currency == quantity.currency:
+            raise ValueError("Cost and quantity must be different currencies")
+
+        self.balance.deduct_available(cost)
+        self.balance.add_available(quantity)
+        transaction = Transaction(
+            transaction_type=TransactionType.BUY,
+            amount=quantity,
+            description=description,
+            reference_id=reference_id,
+            metadata={
+                "price": float(price),
+                "cost": cost.amount,
+                "cost_currency": cost.currency.value,
+            },
+        )
+        self.transactions.append(transaction)
+
     def record_fee(self, money: Money, description: str) -> None:
         """Record a trading fee.
 
@@ -178,6 +222,26 @@ class Account:
         """
         return self.balance.get_available(currency)
 
+    def snapshot(
+        self, base: Currency, quote: Currency = Currency.USDT
+    ) -> BalanceSnapshot:
+        """Get available amounts of a base/quote pair in one pass.
+
+        Args:
+            base: Base currency (e.g., BNB)
+            quote: Quote currency (default USDT)
+
+        Returns:
+            BalanceSnapshot with amounts (0.0 for missing currencies)
+        """
+        available = self.balance.available
+        base_money = available.get(base)
+        quote_money = available.get(quote)
+        return BalanceSnapshot(
+            base=base_money.amount if base_money else 0.0,
+            quote=quote_money.amount if quote_money else 0.0,
+        )
+
     def get_transaction_history(self) -> List[Transaction]:
         """Get all transactions.
 
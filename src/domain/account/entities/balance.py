@@ -79,6 +79,22 @@ class Balance:
             raise KeyError(f"Currency {currency} not in available balance")
         return self.available[currency]
 
+    def available_float(self, currency: Currency, default: float = 0.0) -> float:
+        """Get available amount for currency as a plain float.
+
+        Avoids building a zero Money for missing currencies on read-only
+        paths such as position reporting.
+
+        Args:
+            currency: Currency to get balance for
+            default: Value returned if currency has no available balance
+
+        Returns:
+            Available amount as float
+        """
+        money = self.available.get(currency)
+        return default if money is None else float(money.amount)
+
     def get_reserved(self, currency: Currency) -> Money:
         """Get reserved balance for currency.
 
@@ -0,0 +1,19 @@
+"""Balance snapshot value object for account domain."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceSnapshot:
+    """
+    Value Object with the available amounts of a base/quote pair.
+
+    Read once from the account so callers don't repeat balance lookups.
+
+    Attributes:
+        base: Available amount of the base currency (e.g., BNB)
+        quote: Available amount of the quote currency (e.g., USDT)
+    """
+
+    base: float
+    quote: float
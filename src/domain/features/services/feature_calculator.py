@@ -81,8 +81,6 @@ class FeatureCalculator:
             Index(['open', 'high', 'low', 'close', 'volume', 'vpt', 'macd_signal', ...])
         """
         try:
-            df = df.copy()
-
             # Validate required columns
             missing = [col for col in self.required_columns if col not in df.columns]
             if missing:
@@ -91,58 +89,63 @@ class FeatureCalculator:
             if len(df) < 50:
                 logger.warning(f"Limited data ({len(df)} rows) - some features will have NaN")
 
-            # 1. Calculate EMAs (needed for distances and slope)
-            ema_8 = df['close'].ewm(span=8, adjust=False).mean()
-            ema_21 = df['close'].ewm(span=21, adjust=False).mean()
-            ema_50 = df['close'].ewm(span=50, adjust=False).mean()
-            ema_200 = df['close'].ewm(span=200, adjust=False).mean()
-
-            # 2. EMA distances (normalized)
-            df['ema_8_distance'] = (df['close'] - ema_8) / df['close']
-            df['ema_21_distance'] = (df['close'] - ema_21) / df['close']
-            df['ema_50_distance'] = (df['close'] - ema_50) / df['close']
-            df['ema_200_distance'] = (df['close'] - ema_200) / df['close']
-
-            # 3. EMA 200 Slope Normalized
-            ema_200_slope = ema_200.diff()
-            df['ema_200_slope_normalized'] = ema_200_slope / ema_200.shift(1)
+            # Windowed kernels (ewm/rolling/pct_change) run in pandas; the
+            # element-wise arithmetic runs on plain float64 arrays, and the
+            # result frame is built once instead of inserting 12 columns
+            close_series = df['close']
+            close = close_series.to_numpy(dtype=np.float64)
+            # 1-period return, shared by VPT, price diff and momentum
+            returns = close_series.pct_change()
 
-            # 4. ATR Percentage
-            atr = self._calculate_atr(df, period=14)
-            df['atr_percentage'] = (atr / df['close']) * 100
-
-            # 5. Volume Price Trend (VPT)
-            df['vpt'] = self._calculate_vpt(df, smooth_period=14)
+            # 1. Calculate EMAs (needed for distances and slope)
+            ema_8 = close_series.ewm(span=8, adjust=False).mean().to_numpy()
+            ema_21 = close_series.ewm(span=21, adjust=False).mean().to_numpy()
+            ema_50 = close_series.ewm(span=50, adjust=False).mean().to_numpy()
+            ema_200 = close_series.ewm(span=200, adjust=False).mean().to_numpy()
 
-            # 6. MACD Signal (using FinRL parameters: fast=3, slow=10, signal=16)
-            df['macd_signal'] = self._calculate_macd_signal(df)
+            # 3. EMA 200 Slope Normalized (diff / previous value)
+            ema_200_slope_normalized = np.full(len(close), np.nan)
+            ema_200_slope_normalized[1:] = np.diff(ema_200) / ema_200[:-1]
 
             # 7. Close Position in 20-period channel (0-1)
-            high_20 = df['high'].rolling(window=20).max()
-            low_20 = df['low'].rolling(window=20).min()
-            df['close_position_20'] = (df['close'] - low_20) / (high_20 - low_20 + 1e-8)
-            df['close_position_20'] = df['close_position_20'].clip(0, 1)
-
-            # 8. Price Diff 1c (1-period return as percentage)
-            df['price_diff_1c'] = df['close'].pct_change() * 100
+            high_20 = df['high'].rolling(window=20).max().to_numpy()
+            low_20 = df['low'].rolling(window=20).min().to_numpy()
+            close_position_20 = np.clip((close - low_20) / (high_20 - low_20 + 1e-8), 0, 1)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                features = {
+                    # 5. Volume Price Trend (VPT)
+                    'vpt': self._calculate_vpt(df, smooth_period=14, price_change=returns),
+                    # 6. MACD Signal (FinRL parameters: fast=3, slow=10, signal=16)
+                    'macd_signal': self._calculate_macd_signal(df),
+                    'ema_200_slope_normalized': ema_200_slope_normalized,
+                    # 4. ATR Percentage
+                    'atr_percentage': self._calculate_atr(df, period=14).to_numpy() / close * 100,
+                    'close_position_20': close_position_20,
+                    # 2. EMA distances (normalized)
+                    'ema_8_distance': (close - ema_8) / close,
+                    'ema_21_distance': (close - ema_21) / close,
+                    'ema_50_distance': (close - ema_50) / close,
+                    'ema_200_distance': (close - ema_200) / close,
+                    # 8. Price Diff 1c (1-period return as percentage)
+                    'price_diff_1c': returns * 100,
+                    # 9. Momentum Consistency: % of positive closes in last 5 candles
+                    'momentum_consistency_5c': (returns > 0).rolling(window=5).mean() * 100,
+                    # 10. Days Since Epoch (time feature)
+                    'days_since_epoch': self._calculate_days_since_epoch(df),
+                }
 
-            # 9. Momentum Consistency (5-candle lookback)
-            # Percentage of positive closes in last 5 candles
-            returns = df['close'].pct_change() > 0
-            df['momentum_consistency_5c'] = returns.rolling(window=5).mean() * 100
-
-            # 10. Days Since Epoch (time feature)
-            df['days_since_epoch'] = self._calculate_days_since_epoch(df)
+            # Select OHLCV + core features
+            output_cols = ['open', 'high', 'low', 'close', 'volume'] + self.CORE_FEATURES
+            columns = {col: df[col] for col in self.required_columns}
+            columns.update(features)
+            result = pd.DataFrame(columns, index=df.index)[output_cols]
 
             # Handle NaN values from rolling calculations
-            df = df.ffill().fillna(0)
+            result = result.ffill().fillna(0)
 
             # Replace infinite values
-            df = df.replace([np.inf, -np.inf], 0)
-
-            # Select OHLCV + core features
-            output_cols = ['open', 'high', 'low', 'close', 'volume'] + self.CORE_FEATURES
-            result = df[output_cols].copy()
+            result = result.replace([np.inf, -np.inf], 0)
 
             logger.info(f"Calculated features for {len(result)} rows. Shape: {result.shape}")
             return result
@@ -171,7 +174,12 @@ class FeatureCalculator:
 
         return atr
 
-    def _calculate_vpt(self, df: pd.DataFrame, smooth_period: int = 14) -> pd.Series:
+    def _calculate_vpt(
+        self,
+        df: pd.DataFrame,
+        smooth_period: int = 14,
+        price_change: Optional[pd.Series] = None
+    ) -> pd.Series:
         """
         Calculate Volume Price Trend (VPT).
 
@@ -181,11 +189,13 @@ class FeatureCalculator:
         Args:
             df: DataFrame with close and volume
             smooth_period: EMA period for smoothing
+            price_change: Precomputed close pct_change, if available
 
         Returns:
             Series with VPT values
         """
-        price_change = df['close'].pct_change()
+        if price_change is None:
+            price_change = df['close'].pct_change()
         vpt_raw = (df['volume'] * price_change).fillna(0)
         vpt = vpt_raw.ewm(span=smooth_period, adjust=False).mean()
 
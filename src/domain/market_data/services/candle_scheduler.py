@@ -42,6 +42,8 @@ class CandleScheduler:
         """Initialize scheduler."""
         self.jobs: Dict[str, asyncio.Task] = {}
         self.running_jobs: Dict[str, bool] = {}
+        # Next close per timeframe for "now" lookups; valid until it passes
+        self._next_run_cache: Dict[str, datetime] = {}
 
     def get_next_candle_time(self, timeframe: str, reference_time: Optional[datetime] = None) -> datetime:
         """
@@ -55,8 +57,29 @@ class CandleScheduler:
             datetime of next candle close in UTC
         """
         if reference_time is None:
-            reference_time = datetime.utcnow()
+            return self._cached_next_candle_time(timeframe, datetime.utcnow())
+
+        return self._compute_next_candle_time(timeframe, reference_time)
+
+    def _cached_next_candle_time(self, timeframe: str, now: datetime) -> datetime:
+        """
+        Return the memoized next close for timeframe, recomputing once it passes.
+
+        Args:
+            timeframe: Candle timeframe
+            now: Current UTC time
 
+        Returns:
+            datetime of next candle close in UTC
+        """
+        next_time = self._next_run_cache.get(timeframe)
+        if next_time is None or now >= next_time:
+            next_time = self._compute_next_candle_time(timeframe, now)
+            self._next_run_cache[timeframe] = next_time
+        return next_time
+
+    def _compute_next_candle_time(self, timeframe: str, reference_time: datetime) -> datetime:
+        """Calculate the next candle close strictly after reference_time."""
         # Round down to UTC epoch for calculations
         epoch = datetime(1970, 1, 1)
         seconds_since_epoch = (reference_time - epoch).total_seconds()
@@ -125,8 +148,9 @@ class CandleScheduler:
         """
         if reference_time is None:
             reference_time = datetime.utcnow()
-
-        next_close = self.get_next_candle_time(timeframe, reference_time)
+            next_close = self._cached_next_candle_time(timeframe, reference_time)
+        else:
+            next_close = self.get_next_candle_time(timeframe, reference_time)
         wait_delta = next_close - reference_time
 
         return wait_delta.total_seconds()
@@ -15,6 +15,7 @@ import pickle
 import logging
 from pathlib import Path
 
+import torch
 from stable_baselines3 import PPO
 from stable_baselines3.common.vec_env import VecNormalize
 
@@ -34,15 +35,19 @@ class ModelLoader:
         model, vec_norm = loader.load_model('BTC_USDT', '1d')
     """
 
-    def __init__(self, models_path: str):
+    def __init__(self, models_path: str, quantize: bool = False):
         """
         Initialize model loader.
 
         Args:
             models_path: Path to FinRL trained_models directory
                        (typically /path/to/finrl/trained_models/)
+            quantize: If True, load policies on CPU with their Linear
+                     layers dynamically quantized to int8 (smaller and
+                     faster on CPU; actions may differ marginally)
         """
         self.models_path = Path(models_path)
+        self.quantize = quantize
 
         if not self.models_path.exists():
             raise ValueError(f"Models path does not exist: {models_path}")
@@ -86,7 +91,12 @@ class ModelLoader:
         try:
             # Load PPO model
             logger.debug(f"Loading PPO model from: {model_file}")
-            model = PPO.load(str(model_file), device='auto')
+            model = PPO.load(str(model_file), device='cpu' if self.quantize else 'auto')
+            if self.quantize:
+                model.policy = torch.ao.quantization.quantize_dynamic(
+                    model.policy, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.debug(f"Quantized {model_name} policy to int8")
 
             # Load VecNormalize (handles feature normalization)
             logger.debug(f"Loading VecNormalize from: {vec_norm_file}")
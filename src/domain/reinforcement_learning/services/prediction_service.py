@@ -58,7 +58,8 @@ class RLPredictionService:
     def __init__(
         self,
         models_path: str,
-        use_core_features: bool = True
+        use_core_features: bool = True,
+        quantize: bool = False
     ):
         """
         Initialize RL prediction service.
@@ -67,8 +68,9 @@ class RLPredictionService:
             models_path: Path to FinRL trained_models directory
             use_core_features: If True, use 13 core features.
                               If False, use 50+ features (requires advanced engineer)
+            quantize: If True, run int8-quantized policies on CPU
         """
-        self.model_loader = ModelLoader(models_path)
+        self.model_loader = ModelLoader(models_path, quantize=quantize)
         self.feature_calculator = FeatureCalculator()
         self.use_core_features = use_core_features
 
@@ -144,13 +146,7 @@ class RLPredictionService:
             logger.debug(f"Feature vector shape: {feature_vector.shape} (expected (1, 13))")
 
             # 2. Load model (with caching)
-            model_key = f"{symbol}_{timeframe}"
-            if model_key not in self.model_cache:
-                model, vec_norm = self.model_loader.load_model(symbol, timeframe)
-                self.model_cache[model_key] = (model, vec_norm)
-                logger.info(f"Cached model: {model_key}")
-            else:
-                model, vec_norm = self.model_cache[model_key]
+            model, vec_norm = self._get_model(symbol, timeframe)
 
             # 3. Generate prediction
             action = self.model_loader.predict_action(model, vec_norm, feature_vector)
@@ -185,6 +181,45 @@ class RLPredictionService:
             )
             raise
 
+    def warmup(self, symbol: str, timeframe: str) -> None:
+        """
+        Load and exercise the model before the first real prediction.
+
+        Loads the model into the cache and runs one inference on a
+        zero feature vector, so loading and first-call setup happen at
+        startup rather than inside the first trading cycle.
+
+        Args:
+            symbol: Trading pair (e.g., 'BTC_USDT')
+            timeframe: Candle timeframe (e.g., '1d')
+
+        Raises:
+            FileNotFoundError: If model not found
+        """
+        model, vec_norm = self._get_model(symbol, timeframe)
+        observation = np.zeros(
+            (1, len(dict.fromkeys(FeatureCalculator.CORE_FEATURES))), dtype=np.float32
+        )
+        self.model_loader.predict_action(model, vec_norm, observation)
+        logger.info(f"Warmed up model: {symbol}_{timeframe}")
+
+    def _get_model(self, symbol: str, timeframe: str) -> Tuple:
+        """
+        Get (model, vec_norm) for symbol/timeframe, loading it once.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe
+
+        Returns:
+            Tuple of (model, vec_norm)
+        """
+        model_key = f"{symbol}_{timeframe}"
+        if model_key not in self.model_cache:
+            self.model_cache[model_key] = self.model_loader.load_model(symbol, timeframe)
+            logger.info(f"Cached model: {model_key}")
+        return self.model_cache[model_key]
+
     def predict_batch(
         self,
         predictions: Dict[str, Dict[str, pd.DataFrame]]
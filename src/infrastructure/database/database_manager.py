@@ -1,5 +1,6 @@
 """SQLite database manager with connection pooling and transactions."""
 
+import asyncio
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
@@ -11,6 +12,18 @@ from loguru import logger
 from .schema import init_database, verify_database
 
 
+# Applied to every pooled connection. journal_mode persists in the file,
+# the others are per-connection and default to slower settings.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # Safe with WAL: one fsync per checkpoint
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256MB memory-mapped reads
+    "PRAGMA cache_size = -65536",  # 64MB page cache (default is 2MB)
+)
+
+
 class DatabaseManager:
     """
     Manage SQLite database connections with pooling and transaction support.
@@ -73,6 +86,19 @@ class DatabaseManager:
             logger.error(f"Database initialization failed: {e}")
             raise
 
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Open a new connection with row factory and performance PRAGMAs.
+
+        Returns:
+            Configured sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     @contextmanager
     def get_connection(self):
         """
@@ -95,10 +121,7 @@ class DatabaseManager:
             if len(self._connections) > 0:
                 conn = self._connections.pop()
             else:
-                conn = sqlite3.connect(self.db_path, check_same_thread=False)
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute("PRAGMA journal_mode = WAL")
+                conn = self._create_connection()
 
         try:
             yield conn
@@ -203,6 +226,41 @@ class DatabaseManager:
             logger.error(f"Batch update failed: {e}")
             raise sqlite3.DatabaseError(f"Batch execution failed: {e}")
 
+    async def execute_query_async(self, sql: str, params: Tuple = ()) -> list[sqlite3.Row]:
+        """
+        Awaitable execute_query that keeps the event loop free.
+
+        The query runs in a worker thread on a pooled connection, so
+        concurrent callers each get their own connection.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (for parameterized queries)
+
+        Returns:
+            List of result rows
+
+        Raises:
+            sqlite3.DatabaseError: If query fails
+        """
+        return await asyncio.to_thread(self.execute_query, sql, params)
+
+    async def execute_update_async(self, sql: str, params: Tuple = ()) -> int:
+        """
+        Awaitable execute_update, run in a worker thread like execute_query_async.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters
+
+        Returns:
+            Number of affected rows
+
+        Raises:
+            sqlite3.DatabaseError: If update fails
+        """
+        return await asyncio.to_thread(self.execute_update, sql, params)
+
     def close(self) -> None:
         """Close all pooled connections."""
         with self._lock:
@@ -85,14 +85,21 @@ CREATE INDEX IF NOT EXISTS idx_transactions_account_created
 CREATE INDEX IF NOT EXISTS idx_transactions_type
     ON transactions(account_id, transaction_type);
 
-CREATE INDEX IF NOT EXISTS idx_orders_account_status
-    ON orders(account_id, status);
+-- Filled orders are read newest first per account (bot /trades and
+-- /performance), so created_at extends the account/status index and
+-- both the date range and the ORDER BY are served from it
+DROP INDEX IF EXISTS idx_orders_account_status;
+
+CREATE INDEX IF NOT EXISTS idx_orders_account_status_created
+    ON orders(account_id, status, created_at DESC);
 
 CREATE INDEX IF NOT EXISTS idx_orders_created
     ON orders(created_at DESC);
 
-CREATE INDEX IF NOT EXISTS idx_balances_account
-    ON balances(account_id);
+-- balances is looked up through its UNIQUE(account_id, currency) index,
+-- which also serves account_id-only queries. A separate account_id
+-- index only added a write per balance update.
+DROP INDEX IF EXISTS idx_balances_account;
 
 CREATE INDEX IF NOT EXISTS idx_performance_account_date
     ON performance_metrics(account_id, date DESC);
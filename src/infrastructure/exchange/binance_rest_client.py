@@ -2,11 +2,19 @@
 Binance REST API Client for fetching market data.
 Uses REST API instead of WebSocket for more reliable candle-close timing.
 """
+import asyncio
+import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Dict, Optional
+from threading import Lock
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from src.shared.exceptions import ExchangeBannedException
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +26,13 @@ class BinanceRESTClient:
 
     BASE_URL = "https://api.binance.com/api/v3"
     TESTNET_URL = "https://testnet.binance.vision/api/v3"
+    USER_AGENT = "jarvis-trading/1.0"
+    POOL_SIZE = 4
+    RATE_LIMIT_RETRIES = 3
+    # Request weight allowed per minute before pausing (Binance cap is 1200)
+    WEIGHT_LIMIT_PER_MINUTE = 1100
+    # How long a get_all_prices() snapshot is reused before refetching
+    PRICE_TTL_SECONDS = 5.0
 
     def __init__(self, testnet: bool = False):
         """
@@ -28,7 +43,114 @@ class BinanceRESTClient:
         """
         self.base_url = self.TESTNET_URL if testnet else self.BASE_URL
         self.testnet = testnet
-        self.session = requests.Session()
+        self.session = self._create_session()
+        self._async_slots: Optional[asyncio.Semaphore] = None
+        # Epoch seconds until which requests pause because the weight budget is spent
+        self._weight_resume_at = 0.0
+        # Last full price list and its expiry (monotonic seconds)
+        self._price_cache: Tuple[Dict[str, float], float] = ({}, 0.0)
+        self._price_lock = Lock()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled keep-alive session.
+
+        Connections to the API host are reused across calls, so only the
+        first request pays the TCP + TLS handshake.
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            # 5xx are retried with exponential backoff here; 429/418 are
+            # handled in _get so Retry-After and bans are surfaced explicitly.
+            # urllib3 would otherwise retry any 429 carrying Retry-After on
+            # its own, unseen by _get's retry loop and weight tracking.
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "User-Agent": self.USER_AGENT,
+        })
+        return session
+
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a GET request honouring Binance rate-limit responses.
+
+        On HTTP 429 the request is retried after the Retry-After delay
+        (exponential backoff if the header is missing). HTTP 418 means the
+        IP is banned, so retrying would only extend the ban. Once the used
+        weight reported by Binance reaches WEIGHT_LIMIT_PER_MINUTE, further
+        requests wait for the next minute instead of provoking a 429.
+
+        Args:
+            endpoint: Full endpoint URL
+            params: Query parameters
+
+        Returns:
+            Successful response
+
+        Raises:
+            ExchangeBannedException: If Binance answered 418
+            requests.exceptions.RequestException: On other HTTP errors
+        """
+        self._wait_for_weight()
+
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            response = self.session.get(endpoint, params=params, timeout=10)
+            self._track_weight(response)
+
+            if response.status_code == 418:
+                retry_after = response.headers.get("Retry-After", "unknown")
+                logger.critical(f"Binance IP ban (418), retry after {retry_after}s")
+                raise ExchangeBannedException(
+                    f"Binance banned this IP, retry after {retry_after}s"
+                )
+
+            if response.status_code != 429 or attempt == self.RATE_LIMIT_RETRIES:
+                response.raise_for_status()
+                return response
+
+            delay = self._retry_after(response, attempt)
+            logger.warning(f"Binance rate limit hit (429), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _track_weight(self, response: requests.Response) -> None:
+        """Pause until the next minute once the used weight nears the limit."""
+        try:
+            used = int(response.headers["X-MBX-USED-WEIGHT-1M"])
+        except (KeyError, ValueError):
+            return
+
+        if used >= self.WEIGHT_LIMIT_PER_MINUTE:
+            # Binance resets the weight counter at each minute boundary
+            self._weight_resume_at = (time.time() // 60 + 1) * 60
+
+    def _wait_for_weight(self) -> None:
+        """Sleep while the request weight budget for this minute is spent."""
+        delay = self._weight_resume_at - time.time()
+        if delay > 0:
+            logger.warning(f"Binance weight budget spent, pausing {delay:.1f}s")
+            time.sleep(delay)
+
+    @staticmethod
+    def _retry_after(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, from Retry-After or exponential backoff."""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return float(2 ** attempt)
 
     def get_klines(
         self, symbol: str, interval: str, limit: int = 100, start_time: Optional[int] = None
@@ -56,13 +178,78 @@ class BinanceRESTClient:
             params["startTime"] = start_time
 
         try:
-            response = self.session.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
-            return self._parse_klines(response.json())
-        except requests.exceptions.RequestException as e:
+            response = self._get(endpoint, params)
+            # Klines are the largest payload; orjson decodes the raw bytes
+            # several times faster than the stdlib parser behind .json()
+            return self._parse_klines(orjson.loads(response.content))
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching klines for {symbol}: {e}")
             return []
 
+    async def get_klines_async(
+        self, symbol: str, interval: str, limit: int = 100, start_time: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Awaitable get_klines that keeps the event loop free during the request.
+
+        The blocking call runs in a worker thread on the same pooled session.
+        At most POOL_SIZE requests are in flight, so concurrent callers queue
+        here instead of opening extra connections or bursting request weight.
+
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            interval: Candle interval (1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w)
+            limit: Number of candles to fetch (default 100, max 1000)
+            start_time: Optional start time in milliseconds
+
+        Returns:
+            List of kline data with OHLCV
+        """
+        return await self._run_async(
+            self.get_klines, symbol, interval, limit, start_time
+        )
+
+    async def get_24h_tickers_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Awaitable get_24h_tickers, bounded like get_klines_async.
+
+        Args:
+            symbols: Trading pairs
+
+        Returns:
+            Dict of symbol -> 24h ticker data (empty if error)
+        """
+        return await self._run_async(self.get_24h_tickers, symbols)
+
+    async def get_ticker_price_async(self, symbol: str) -> Optional[float]:
+        """
+        Awaitable get_ticker_price, bounded like get_klines_async.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Current price or None if error
+        """
+        return await self._run_async(self.get_ticker_price, symbol)
+
+    async def get_all_prices_async(self) -> Dict[str, float]:
+        """
+        Awaitable get_all_prices, bounded like get_klines_async.
+
+        Returns:
+            Dict of symbol -> price (empty if error)
+        """
+        return await self._run_async(self.get_all_prices)
+
+    async def _run_async(self, func, *args):
+        """Run a blocking request method in a worker thread, POOL_SIZE at a time."""
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.POOL_SIZE)
+
+        async with self._async_slots:
+            return await asyncio.to_thread(func, *args)
+
     def get_ticker_price(self, symbol: str) -> Optional[float]:
         """
         Get current price for a symbol.
@@ -77,8 +264,7 @@ class BinanceRESTClient:
         params = {"symbol": symbol}
 
         try:
-            response = self.session.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(endpoint, params)
             return float(response.json()["price"])
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching price for {symbol}: {e}")
@@ -98,13 +284,84 @@ class BinanceRESTClient:
         params = {"symbol": symbol}
 
         try:
-            response = self.session.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(endpoint, params)
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching 24h ticker for {symbol}: {e}")
             return None
 
+    def get_24h_tickers(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get 24-hour ticker statistics for several symbols in one request.
+
+        Binance rejects the whole batch (HTTP 400) if any symbol is invalid
+        or delisted; the symbols are then fetched one by one so the valid
+        ones are still returned.
+
+        Args:
+            symbols: Trading pairs
+
+        Returns:
+            Dict of symbol -> 24h ticker data (symbols that failed are
+            missing; empty if error)
+        """
+        if not symbols:
+            return {}
+
+        endpoint = f"{self.base_url}/ticker/24hr"
+        # Binance expects a compact JSON array, e.g. ["BNBUSDT","BTCUSDT"]
+        params = {"symbols": orjson.dumps(list(symbols)).decode()}
+
+        try:
+            response = self._get(endpoint, params)
+            return {ticker["symbol"]: ticker for ticker in orjson.loads(response.content)}
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 400 or len(symbols) == 1:
+                logger.error(f"Error fetching 24h tickers for {symbols}: {e}")
+                return {}
+
+            logger.warning(
+                f"Batch 24h ticker request rejected ({e}), fetching {symbols} one by one"
+            )
+            tickers = {symbol: self.get_24h_ticker(symbol) for symbol in symbols}
+            return {symbol: ticker for symbol, ticker in tickers.items() if ticker is not None}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error fetching 24h tickers for {symbols}: {e}")
+            return {}
+
+    def get_all_prices(self) -> Dict[str, float]:
+        """
+        Get the current price of every symbol in one request.
+
+        The snapshot is shared for PRICE_TTL_SECONDS, so callers pricing
+        the same symbols within a few seconds (signal checks, portfolio
+        status, bot commands) cost a single request. Concurrent callers
+        wait for one refresh instead of each fetching. Failures are not
+        cached.
+
+        Returns:
+            Dict of symbol -> price (empty if error)
+        """
+        with self._price_lock:
+            prices, expires_at = self._price_cache
+            if time.monotonic() < expires_at:
+                return prices
+
+            endpoint = f"{self.base_url}/ticker/price"
+
+            try:
+                response = self._get(endpoint)
+                prices = {
+                    item["symbol"]: float(item["price"])
+                    for item in orjson.loads(response.content)
+                }
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                logger.error(f"Error fetching prices: {e}")
+                return {}
+
+            self._price_cache = (prices, time.monotonic() + self.PRICE_TTL_SECONDS)
+            return prices
+
     def get_exchange_info(self) -> Optional[Dict]:
         """
         Get exchange information including trading pairs.
@@ -115,8 +372,7 @@ class BinanceRESTClient:
         endpoint = f"{self.base_url}/exchangeInfo"
 
         try:
-            response = self.session.get(endpoint, timeout=10)
-            response.raise_for_status()
+            response = self._get(endpoint)
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching exchange info: {e}")
@@ -133,8 +389,7 @@ class BinanceRESTClient:
         endpoint = f"{self.base_url}/time"
 
         try:
-            response = self.session.get(endpoint, timeout=10)
-            response.raise_for_status()
+            response = self._get(endpoint)
             return response.json()["serverTime"]
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching server time: {e}")
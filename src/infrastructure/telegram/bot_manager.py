@@ -15,11 +15,13 @@ from telegram.ext import (
     Application,
     CommandHandler,
     CallbackQueryHandler,
+    Defaults,
     MessageHandler,
     filters
 )
 from loguru import logger
 
+from src.infrastructure.database import DatabaseManager
 from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 from src.infrastructure.telegram.formatters.message_formatter import MessageFormatter
 from src.infrastructure.telegram.handlers.command_handlers import CommandHandlers
@@ -52,13 +54,16 @@ class BotManager:
         # Initialize dependencies
         self.client = BinanceRESTClient(testnet=False)
         self.formatter = MessageFormatter()
+        # One connection pool shared by every handler (warm page cache)
+        self.db = DatabaseManager(self.db_path)
 
         # Initialize handler instances with dependency injection
         self.command_handlers = CommandHandlers(
             db_path=self.db_path,
             account_id=self.account_id,
             client=self.client,
-            formatter=self.formatter
+            formatter=self.formatter,
+            db=self.db
         )
 
         self.callback_handlers = CallbackHandlers(
@@ -73,7 +78,8 @@ class BotManager:
             db_path=self.db_path,
             account_id=self.account_id,
             client=self.client,
-            formatter=self.formatter
+            formatter=self.formatter,
+            db=self.db
         )
 
         logger.info("Bot Manager initialized successfully")
@@ -86,6 +92,21 @@ class BotManager:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in .env file")
         return token
 
+    def _build_application(self) -> Application:
+        """
+        Build the Telegram application.
+
+        Handlers default to block=False: each update runs as its own task,
+        so a command waiting on Binance or the database does not hold up
+        the next one.
+        """
+        return (
+            Application.builder()
+            .token(self.token)
+            .defaults(Defaults(block=False))
+            .build()
+        )
+
     def _register_handlers(self, application: Application):
         """
         Register all handlers with the application.
@@ -125,13 +146,16 @@ class BotManager:
 
     def run(self):
         """Start the bot with polling."""
-        application = Application.builder().token(self.token).build()
+        application = self._build_application()
 
         # Register all handlers
         self._register_handlers(application)
 
         logger.info("Bot starting with polling mode...")
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
+        try:
+            application.run_polling(allowed_updates=Update.ALL_TYPES)
+        finally:
+            self.db.close()
 
     def run_webhook(self, webhook_url: str, port: int = 8080):
         """
@@ -141,18 +165,21 @@ class BotManager:
             webhook_url: Full webhook URL
             port: Port to listen on
         """
-        application = Application.builder().token(self.token).build()
+        application = self._build_application()
 
         # Register all handlers
         self._register_handlers(application)
 
         logger.info(f"Bot starting with webhook mode (URL: {webhook_url}, port: {port})...")
-        application.run_webhook(
-            listen="0.0.0.0",
-            port=port,
-            url_path=self.token,
-            webhook_url=webhook_url
-        )
+        try:
+            application.run_webhook(
+                listen="0.0.0.0",
+                port=port,
+                url_path=self.token,
+                webhook_url=webhook_url
+            )
+        finally:
+            self.db.close()
 
 
 def create_bot(token: Optional[str] = None) -> BotManager:
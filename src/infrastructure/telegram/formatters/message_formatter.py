@@ -8,6 +8,18 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 
+def _short_datetime(timestamp: str) -> str:
+    """
+    Render a stored ISO 8601 timestamp as 'DD/MM HH:MM'.
+
+    SQLite and isoformat() both store 'YYYY-MM-DD?HH:MM...', so the fields
+    are sliced directly; anything shorter goes through fromisoformat().
+    """
+    if len(timestamp) < 16:
+        return datetime.fromisoformat(timestamp).strftime('%d/%m %H:%M')
+    return f"{timestamp[8:10]}/{timestamp[5:7]} {timestamp[11:16]}"
+
+
 class MessageFormatter:
     """Formats Telegram messages with consistent styling."""
 
@@ -85,7 +97,7 @@ class MessageFormatter:
 
         if last_order:
             symbol, side, qty, price, created_at = last_order
-            time_str = datetime.fromisoformat(created_at).strftime('%H:%M')
+            time_str = _short_datetime(created_at)[-5:]
             status_msg += f"\n📈 *Última Ordem:* {side} {symbol}\n"
             status_msg += f"   {qty:.6f} @ ${price:.2f} ({time_str})\n"
 
@@ -222,7 +234,7 @@ class MessageFormatter:
         history_text = f"📜 *Últimas {len(transactions)} Transações*\n\n"
 
         for tx_type, amount, currency, desc, created_at in transactions:
-            time_str = datetime.fromisoformat(created_at).strftime('%d/%m %H:%M')
+            time_str = _short_datetime(created_at)
             emoji = "🟢" if tx_type == "BUY" else "🔴"
 
             history_text += (
@@ -5,19 +5,40 @@ Follows Single Responsibility: each method handles one command.
 """
 
 import asyncio
-import sqlite3
 from datetime import datetime, timezone
-from typing import List, Tuple, Optional
+from typing import Dict, List, Optional
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode, ChatAction
 
+from src.infrastructure.database import DatabaseManager
 from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
-from src.utils.chart_generator import ChartGenerator
 from src.infrastructure.telegram.formatters.message_formatter import MessageFormatter
 
 
+# Main menu shown by /start. Telegram objects are immutable, so one markup
+# is built at import and reused for every reply.
+MAIN_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📊 Portfolio", callback_data='portfolio'),
+        InlineKeyboardButton("📈 Sinais", callback_data='signals')
+    ],
+    [
+        InlineKeyboardButton("📋 Watchlist", callback_data='watchlist'),
+        InlineKeyboardButton("💹 Performance", callback_data='performance')
+    ],
+    [
+        InlineKeyboardButton("📜 Histórico", callback_data='history'),
+        InlineKeyboardButton("⚙️ Configurações", callback_data='settings')
+    ],
+    [
+        InlineKeyboardButton("💰 Comprar", callback_data='buy_menu'),
+        InlineKeyboardButton("💵 Vender", callback_data='sell_menu')
+    ]
+])
+
+
 class CommandHandlers:
     """Handles slash commands (/start, /help, /status, etc)."""
 
@@ -26,10 +47,12 @@ class CommandHandlers:
         db_path: str,
         account_id: str,
         client: BinanceRESTClient,
-        formatter: MessageFormatter
+        formatter: MessageFormatter,
+        db: Optional[DatabaseManager] = None
     ):
         """Initialize with dependencies (Dependency Injection)."""
         self.db_path = db_path
+        self.db = db or DatabaseManager(db_path)
         self.account_id = account_id
         self.client = client
         self.formatter = formatter
@@ -41,92 +64,81 @@ class CommandHandlers:
             'pause', 'resume'
         }
 
+    async def _prices_for(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Look up current prices for several symbols.
+
+        One /ticker/price request prices every symbol, and the client
+        reuses that snapshot for a few seconds, so repeated taps on the
+        portfolio or watchlist buttons do not refetch.
+
+        Args:
+            symbols: Trading pairs (e.g. ['BNBUSDT', 'BTCUSDT'])
+
+        Returns:
+            Dict of symbol -> price (None if unknown or the request failed)
+        """
+        prices = await self.client.get_all_prices_async()
+        return {symbol: prices.get(symbol) for symbol in symbols}
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /start command - Main menu."""
-        await update.message.chat.send_action(ChatAction.TYPING)
-
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 Portfolio", callback_data='portfolio'),
-                InlineKeyboardButton("📈 Sinais", callback_data='signals')
-            ],
-            [
-                InlineKeyboardButton("📋 Watchlist", callback_data='watchlist'),
-                InlineKeyboardButton("💹 Performance", callback_data='performance')
-            ],
-            [
-                InlineKeyboardButton("📜 Histórico", callback_data='history'),
-                InlineKeyboardButton("⚙️ Configurações", callback_data='settings')
-            ],
-            [
-                InlineKeyboardButton("💰 Comprar", callback_data='buy_menu'),
-                InlineKeyboardButton("💵 Vender", callback_data='sell_menu')
-            ]
-        ]
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
-        reply_markup = InlineKeyboardMarkup(keyboard)
         welcome_text = self.formatter.format_welcome()
 
-        await update.message.reply_text(
+        await update.effective_message.reply_text(
             welcome_text,
-            reply_markup=reply_markup,
+            reply_markup=MAIN_MENU_MARKUP,
             parse_mode=ParseMode.MARKDOWN
         )
 
     async def help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /help command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
         help_text = self.formatter.format_help()
-        await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
+        await update.effective_message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
 
     async def status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /status command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
-        processing_msg = await update.message.reply_text(
+        processing_msg = await update.effective_message.reply_text(
             self.formatter.format_processing("Verificando status do sistema..."),
             parse_mode=ParseMode.MARKDOWN
         )
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Fetch balance
-            cursor.execute("""
-                SELECT currency, available_amount
-                FROM balances
-                WHERE account_id = ? AND available_amount > 0
-                ORDER BY currency
-            """, (self.account_id,))
-
-            balances = cursor.fetchall()
-
-            # Fetch last order
-            cursor.execute("""
-                SELECT symbol, side, quantity, price, created_at
-                FROM orders
-                WHERE account_id = ?
-                ORDER BY created_at DESC
-                LIMIT 1
-            """, (self.account_id,))
-
-            last_order = cursor.fetchone()
-
-            # Count orders today
             today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
-            cursor.execute("""
-                SELECT COUNT(*) FROM orders
-                WHERE account_id = ? AND created_at > ?
-            """, (self.account_id, today.isoformat()))
 
-            orders_today = cursor.fetchone()[0]
-            conn.close()
+            # Balances, last order and today's order count (run concurrently)
+            balances, last_orders, counts = await asyncio.gather(
+                self.db.execute_query_async("""
+                    SELECT currency, available_amount
+                    FROM balances
+                    WHERE account_id = ? AND available_amount > 0
+                    ORDER BY currency
+                """, (self.account_id,)),
+                self.db.execute_query_async("""
+                    SELECT symbol, side, quantity, price, created_at
+                    FROM orders
+                    WHERE account_id = ?
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                """, (self.account_id,)),
+                self.db.execute_query_async("""
+                    SELECT COUNT(*) FROM orders
+                    WHERE account_id = ? AND created_at > ?
+                """, (self.account_id, today.isoformat())),
+            )
+
+            last_order = last_orders[0] if last_orders else None
+            orders_today = counts[0][0]
 
             status_msg = self.formatter.format_status(balances, last_order, orders_today)
 
             await processing_msg.delete()
-            await update.message.reply_text(
+            await update.effective_message.reply_text(
                 status_msg,
                 parse_mode=ParseMode.MARKDOWN
             )
@@ -139,27 +151,21 @@ class CommandHandlers:
 
     async def portfolio(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /portfolio and /p command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
-        processing_msg = await update.message.reply_text(
+        processing_msg = await update.effective_message.reply_text(
             self.formatter.format_processing("Calculando seu portfolio..."),
             parse_mode=ParseMode.MARKDOWN
         )
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            balances = await self.db.execute_query_async("""
                 SELECT currency, available_amount
                 FROM balances
                 WHERE account_id = ? AND available_amount > 0.0001
                 ORDER BY currency
             """, (self.account_id,))
 
-            balances = cursor.fetchall()
-            conn.close()
-
             if not balances:
                 await processing_msg.edit_text(
                     self.formatter.format_portfolio([], 0, {}),
@@ -167,7 +173,10 @@ class CommandHandlers:
                 )
                 return
 
-            # Calculate values
+            # Calculate values (one cached price list covers every currency)
+            prices = await self._prices_for([
+                f"{currency}USDT" for currency, _ in balances if currency != 'USDT'
+            ])
             total_value = 0
             price_data = {}
 
@@ -176,13 +185,9 @@ class CommandHandlers:
                     total_value += amount
                 else:
                     symbol = f"{currency}USDT"
-                    try:
-                        ticker = self.client.get_symbol_ticker(symbol)
-                        price = float(ticker['price'])
-                        price_data[symbol] = price
-                        total_value += amount * price
-                    except:
-                        price_data[symbol] = 0
+                    price = prices[symbol] or 0
+                    price_data[symbol] = price
+                    total_value += amount * price
 
             portfolio_text = self.formatter.format_portfolio(balances, total_value, price_data)
 
@@ -199,9 +204,9 @@ class CommandHandlers:
 
     async def signals(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /signals and /s command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
-        progress_msg = await update.message.reply_text(
+        progress_msg = await update.effective_message.reply_text(
             "🔍 Analisando sinais...\n⬜⬜⬜⬜⬜ 0%",
             parse_mode=ParseMode.MARKDOWN
         )
@@ -237,64 +242,49 @@ class CommandHandlers:
 
     async def watchlist(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /watchlist and /w command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            symbols = await self.db.execute_query_async("""
                 SELECT symbol FROM watchlist
                 WHERE account_id = ?
                 ORDER BY symbol
             """, (self.account_id,))
 
-            symbols = cursor.fetchall()
-            conn.close()
-
             if not symbols:
-                await update.message.reply_text(
+                await update.effective_message.reply_text(
                     self.formatter.format_watchlist([]),
                     parse_mode=ParseMode.MARKDOWN
                 )
                 return
 
-            # Get prices
-            symbols_with_prices = []
-            for (symbol,) in symbols:
-                try:
-                    ticker = self.client.get_symbol_ticker(symbol)
-                    price = float(ticker['price'])
-                    symbols_with_prices.append((symbol, price))
-                except:
-                    symbols_with_prices.append((symbol, None))
+            # Get prices (one cached price list for the whole watchlist)
+            prices = await self._prices_for([symbol for (symbol,) in symbols])
+            symbols_with_prices = list(prices.items())
 
             watchlist_text = self.formatter.format_watchlist(symbols_with_prices)
 
-            await update.message.reply_text(
+            await update.effective_message.reply_text(
                 watchlist_text,
                 parse_mode=ParseMode.MARKDOWN
             )
 
         except Exception as e:
-            await update.message.reply_text(
+            await update.effective_message.reply_text(
                 self.formatter.format_error_generic(f"Erro ao obter watchlist: {e}"),
                 parse_mode=ParseMode.MARKDOWN
             )
 
     async def history(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /history command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
         limit = 10
         if context.args and context.args[0].isdigit():
             limit = int(context.args[0])
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            transactions = await self.db.execute_query_async("""
                 SELECT
                     transaction_type,
                     amount,
@@ -307,27 +297,24 @@ class CommandHandlers:
                 LIMIT ?
             """, (self.account_id, limit))
 
-            transactions = cursor.fetchall()
-            conn.close()
-
             history_text = self.formatter.format_history(transactions)
 
-            await update.message.reply_text(
+            await update.effective_message.reply_text(
                 history_text,
                 parse_mode=ParseMode.MARKDOWN
             )
 
         except Exception as e:
-            await update.message.reply_text(
+            await update.effective_message.reply_text(
                 self.formatter.format_error_generic(f"Erro ao obter histórico: {e}"),
                 parse_mode=ParseMode.MARKDOWN
             )
 
     async def performance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /performance command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
-        processing_msg = await update.message.reply_text(
+        processing_msg = await update.effective_message.reply_text(
             self.formatter.format_processing("Analisando performance..."),
             parse_mode=ParseMode.MARKDOWN
         )
@@ -343,27 +330,28 @@ class CommandHandlers:
 
     async def handle_settings(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for /settings command."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        await update.effective_message.chat.send_action(ChatAction.TYPING)
 
         settings_text = self.formatter.format_settings()
 
-        await update.message.reply_text(
+        await update.effective_message.reply_text(
             settings_text,
             parse_mode=ParseMode.MARKDOWN
         )
 
     async def unknown_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handler for unknown commands."""
-        command = update.message.text.split()[0]
+        command = update.effective_message.text.split()[0]
 
         # Find similar commands
-        suggestions = []
         cmd_name = command[1:].lower()  # Remove / and lowercase
-
-        for valid_cmd in self.valid_commands:
-            if cmd_name in valid_cmd or valid_cmd.startswith(cmd_name[:2]):
-                suggestions.append(f"/{valid_cmd}")
+        prefix = cmd_name[:2]
+        suggestions = [
+            f"/{valid_cmd}"
+            for valid_cmd in self.valid_commands
+            if cmd_name in valid_cmd or valid_cmd.startswith(prefix)
+        ]
 
         error_msg = self.formatter.format_error_unknown_command(command, suggestions)
 
-        await update.message.reply_text(error_msg, parse_mode=ParseMode.MARKDOWN)
+        await update.effective_message.reply_text(error_msg, parse_mode=ParseMode.MARKDOWN)
@@ -5,20 +5,28 @@ Follows Single Responsibility: trading operations only.
 """
 
 import asyncio
-import sqlite3
 import os
 from typing import Optional
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode, ChatAction
-from datetime import datetime
 
+from src.infrastructure.database import DatabaseManager
 from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
 from src.utils.chart_generator import ChartGenerator
 from src.infrastructure.telegram.formatters.message_formatter import MessageFormatter
 
 
+# Order progress buttons, built once (Telegram objects are immutable)
+ORDER_PROCESSING_MARKUP = InlineKeyboardMarkup([[
+    InlineKeyboardButton("⏳ Executando ordem...", callback_data="processing")
+]])
+ORDER_DONE_MARKUP = InlineKeyboardMarkup([[
+    InlineKeyboardButton("✅ Ordem executada com sucesso!", callback_data="done")
+]])
+
+
 class MessageHandlers:
     """Handles trading messages (buy, sell, add, remove, candles)."""
 
@@ -27,10 +35,12 @@ class MessageHandlers:
         db_path: str,
         account_id: str,
         client: BinanceRESTClient,
-        formatter: MessageFormatter
+        formatter: MessageFormatter,
+        db: Optional[DatabaseManager] = None
     ):
         """Initialize with dependencies."""
         self.db_path = db_path
+        self.db = db or DatabaseManager(db_path)
         self.account_id = account_id
         self.client = client
         self.formatter = formatter
@@ -61,13 +71,9 @@ class MessageHandlers:
             return
 
         # Show confirmation with button
-        keyboard = [[
-            InlineKeyboardButton("⏳ Executando ordem...", callback_data="processing")
-        ]]
-
         confirm_msg = await update.message.reply_text(
             self.formatter.format_buy_confirmation(symbol, amount_usdt),
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=ORDER_PROCESSING_MARKUP,
             parse_mode=ParseMode.MARKDOWN
         )
 
@@ -75,10 +81,6 @@ class MessageHandlers:
         await asyncio.sleep(1.5)
 
         # Update button with result
-        keyboard = [[
-            InlineKeyboardButton("✅ Ordem executada com sucesso!", callback_data="done")
-        ]]
-
         result_text = self.formatter.format_buy_result(
             symbol,
             0.001234,  # Simulated quantity
@@ -88,7 +90,7 @@ class MessageHandlers:
 
         await confirm_msg.edit_text(
             result_text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=ORDER_DONE_MARKUP,
             parse_mode=ParseMode.MARKDOWN
         )
 
@@ -164,9 +166,11 @@ class MessageHandlers:
         try:
             await update.message.chat.send_action(ChatAction.UPLOAD_PHOTO)
 
-            # Generate chart
+            # Generate chart (matplotlib rendering runs off the event loop)
             chart_generator = ChartGenerator(self.db_path)
-            chart_path = chart_generator.generate_chart(symbol, timeframe)
+            chart_path = await asyncio.to_thread(
+                chart_generator.generate_chart, symbol, timeframe
+            )
 
             # Send image
             with open(chart_path, 'rb') as photo:
@@ -212,21 +216,16 @@ class MessageHandlers:
 
         try:
             # Verify symbol exists on Binance
-            ticker = self.client.get_symbol_ticker(symbol)
-            price = float(ticker['price'])
+            price = await self.client.get_ticker_price_async(symbol)
+            if price is None:
+                raise ValueError(f"{symbol} não encontrado na Binance")
 
             # Add to database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            await self.db.execute_update_async("""
                 INSERT OR IGNORE INTO watchlist (account_id, symbol)
                 VALUES (?, ?)
             """, (self.account_id, symbol))
 
-            conn.commit()
-            conn.close()
-
             await processing_msg.edit_text(
                 self.formatter.format_success_symbol_added(symbol, price),
                 parse_mode=ParseMode.MARKDOWN
@@ -254,15 +253,12 @@ class MessageHandlers:
             symbol += 'USDT'
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            removed = await self.db.execute_update_async("""
                 DELETE FROM watchlist
                 WHERE account_id = ? AND symbol = ?
             """, (self.account_id, symbol))
 
-            if cursor.rowcount > 0:
+            if removed > 0:
                 await update.message.reply_text(
                     self.formatter.format_success_symbol_removed(symbol),
                     parse_mode=ParseMode.MARKDOWN
@@ -273,9 +269,6 @@ class MessageHandlers:
                     parse_mode=ParseMode.MARKDOWN
                 )
 
-            conn.commit()
-            conn.close()
-
         except Exception as e:
             await update.message.reply_text(
                 self.formatter.format_error_generic(f"Erro ao remover {symbol}: {e}"),
@@ -8,6 +8,7 @@ from src.shared.exceptions import (
     DataFetchException,
     DataValidationException,
     EnvironmentException,
+    ExchangeBannedException,
     ExchangeException,
     FeatureEngineeringException,
     FeatureSelectionException,
@@ -42,6 +43,7 @@ __all__ = [
     "ConfigurationException",
     "InfrastructureException",
     "ExchangeException",
+    "ExchangeBannedException",
     "PersistenceException",
     "MLOpsException",
 ]
@@ -109,6 +109,12 @@ class ExchangeException(InfrastructureException):
     pass
 
 
+class ExchangeBannedException(ExchangeException):
+    """Raised when the exchange bans the client IP (HTTP 418)."""
+
+    pass
+
+
 class PersistenceException(InfrastructureException):
     """Raised when persistence operation fails."""
 
@@ -151,20 +151,17 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
         if len(df) < min_candles:
             raise ValueError(f"Need at least {min_candles} candles for swing points, got {len(df)}")
 
-        # Find local maxima (swing highs)
+        # Find local maxima (swing highs). NaN never compares equal, so the
+        # rolling window edges (and NaN prices) are already excluded here.
         highs_rolling = df['high'].rolling(window=lookback*2+1, center=True).max()
-        is_swing_high = df['high'] == highs_rolling
+        is_swing_high = df['high'].to_numpy() == highs_rolling.to_numpy()
         swing_highs = df[is_swing_high].copy()
 
         # Find local minima (swing lows)
         lows_rolling = df['low'].rolling(window=lookback*2+1, center=True).min()
-        is_swing_low = df['low'] == lows_rolling
+        is_swing_low = df['low'].to_numpy() == lows_rolling.to_numpy()
         swing_lows = df[is_swing_low].copy()
 
-        # Remove NaN rows (from rolling window edges)
-        swing_highs = swing_highs.dropna(subset=['high'])
-        swing_lows = swing_lows.dropna(subset=['low'])
-
         logger.debug(
             f"Found {len(swing_highs)} swing highs and {len(swing_lows)} swing lows "
             f"(lookback={lookback})"
@@ -303,11 +300,21 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
         if 'rsi' not in df.columns:
             df['rsi'] = self.calculate_rsi(df['close'], period=14)
 
+        # Scalar reads go through ndarrays: df.iloc[i] builds a row Series
+        # and the full-length rolling mean is O(n) per call, which dominates
+        # when a backtest calls this for every bar
+        close = df['close'].to_numpy()
+        open_ = df['open'].to_numpy()
+        high = df['high'].to_numpy()
+        low = df['low'].to_numpy()
+        volume = df['volume'].to_numpy()
+        rsi = df['rsi'].to_numpy()
+
         # 1. RSI Divergence (bullish)
-        price_now = df['close'].iloc[index]
-        price_prev = df['close'].iloc[index - 5]
-        rsi_now = df['rsi'].iloc[index]
-        rsi_prev = df['rsi'].iloc[index - 5]
+        price_now = close[index]
+        price_prev = close[index - 5]
+        rsi_now = rsi[index]
+        rsi_prev = rsi[index - 5]
 
         if not pd.isna(rsi_now) and not pd.isna(rsi_prev):
             # Bullish divergence: price lower, RSI higher
@@ -328,9 +335,9 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
                     f"RSI {rsi_prev:.1f}->{rsi_now:.1f}"
                 )
 
-        # 2. Volume Spike
-        volume_now = df['volume'].iloc[index]
-        avg_volume = df['volume'].rolling(20).mean().iloc[index]
+        # 2. Volume Spike (20-period average ending at index)
+        volume_now = volume[index]
+        avg_volume = volume[index - 19:index + 1].mean() if index >= 19 else np.nan
 
         if not pd.isna(avg_volume) and avg_volume > 0:
             if volume_now > avg_volume * 1.5:
@@ -342,15 +349,15 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
 
         # 3. Candlestick Patterns (need previous candle)
         if index > 0:
-            current = df.iloc[index]
-            prev = df.iloc[index - 1]
+            cur_open, cur_close = open_[index], close[index]
+            prev_open, prev_close = open_[index - 1], close[index - 1]
 
             # Bullish Engulfing
-            prev_bearish = prev['close'] < prev['open']
-            current_bullish = current['close'] > current['open']
+            prev_bearish = prev_close < prev_open
+            current_bullish = cur_close > cur_open
             current_engulfs = (
-                current['close'] > prev['open'] and
-                current['open'] < prev['close']
+                cur_close > prev_open and
+                cur_open < prev_close
             )
 
             if prev_bearish and current_bullish and current_engulfs:
@@ -358,11 +365,11 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
                 logger.debug("Bullish Engulfing candle detected")
 
             # Bearish Engulfing
-            prev_bullish = prev['close'] > prev['open']
-            current_bearish = current['close'] < current['open']
+            prev_bullish = prev_close > prev_open
+            current_bearish = cur_close < cur_open
             current_engulfs_bear = (
-                current['open'] > prev['close'] and
-                current['close'] < prev['open']
+                cur_open > prev_close and
+                cur_close < prev_open
             )
 
             if prev_bullish and current_bearish and current_engulfs_bear:
@@ -370,9 +377,9 @@ class FibonacciGoldenZoneStrategy(BaseIndicatorStrategy):
                 logger.debug("Bearish Engulfing candle detected")
 
             # Hammer (bullish reversal)
-            body = abs(current['close'] - current['open'])
-            lower_shadow = min(current['open'], current['close']) - current['low']
-            upper_shadow = current['high'] - max(current['open'], current['close'])
+            body = abs(cur_close - cur_open)
+            lower_shadow = min(cur_open, cur_close) - low[index]
+            upper_shadow = high[index] - max(cur_open, cur_close)
 
             if body > 0 and lower_shadow > body * 2 and upper_shadow < body:
                 confirmations.append('HAMMER')
@@ -0,0 +1,321 @@
+"""Tests for FibonacciTradingOrchestrator candle handling."""
+
+import asyncio
+import copy
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pandas as pd
+import pytest
+
+from src.application.orchestrators.fibonacci_trading_orchestrator import (
+    FibonacciTradingOrchestrator,
+)
+from src.domain.account.entities.account import Account
+from src.domain.account.value_objects.currency import Currency
+from src.domain.account.value_objects.money import Money
+
+
+def _klines(count: int) -> list[dict]:
+    """Build parsed klines as returned by BinanceRESTClient."""
+    return [
+        {
+            "open_time": 1700000000000 + i * 86_400_000,
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 10.0,
+            "close_time": 1700000000000 + (i + 1) * 86_400_000 - 1,
+            "number_of_trades": 5,
+        }
+        for i in range(count)
+    ]
+
+
+def _market(klines: list[dict]):
+    """Fake get_klines serving the given klines like Binance does."""
+    def get_klines(symbol, interval, limit=100, start_time=None):
+        if start_time is None:
+            return klines[-limit:]
+        return [k for k in klines if k["open_time"] >= start_time][:limit]
+    return get_klines
+
+
+class TestKlinesToDataFrame:
+    """Test conversion of klines to the strategy DataFrame."""
+
+    def test_builds_ohlcv_frame_indexed_by_open_time(self) -> None:
+        """Test that only OHLCV float columns are kept, indexed by timestamp."""
+        df = FibonacciTradingOrchestrator._klines_to_dataframe(_klines(3))
+
+        assert list(df.columns) == list(FibonacciTradingOrchestrator.OHLCV_COLUMNS)
+        assert (df.dtypes == "float64").all()
+        assert df.index.name == "timestamp"
+        assert df.index[0] == pd.Timestamp("2023-11-14 22:13:20")
+        assert df["close"].iloc[-1] == 102.5
+
+    def test_empty_klines_returns_none(self) -> None:
+        """Test that an empty response yields no DataFrame."""
+        assert FibonacciTradingOrchestrator._klines_to_dataframe([]) is None
+
+
+@pytest.fixture
+def orchestrator(tmp_path) -> FibonacciTradingOrchestrator:
+    """Create a dry-run orchestrator with stubbed market, strategy and account."""
+    orch = FibonacciTradingOrchestrator(
+        account_id="account-1",
+        symbol="BNB_USDT",
+        timeframe="1d",
+        db_path=str(tmp_path / "test.db"),
+        dry_run=True,
+    )
+    orch.binance_client = Mock()
+    orch.binance_client.get_klines.side_effect = _market(_klines(300))
+    orch.strategy = Mock()
+    orch.strategy.generate_signal.return_value = {
+        "action": "HOLD", "reason": "test", "trend": "LATERAL", "current_price": 1.0
+    }
+    account = Account()
+    account.deposit(Money(1000.0, Currency.USDT))
+    account.deposit(Money(2.0, Currency.BNB))
+    orch.account_repo = Mock()
+    orch.account_repo.find_by_id.return_value = account
+    return orch
+
+
+class TestSignalCache:
+    """Test reuse of the signal while the latest candle is unchanged."""
+
+    def test_unchanged_candle_skips_fetch_and_analysis(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that a second run on the same candle reuses the signal."""
+        first = orchestrator.execute()
+        second = orchestrator.execute()
+
+        assert first["status"] == second["status"] == "success"
+        assert second["signal"] is first["signal"]
+        assert orchestrator.strategy.generate_signal.call_count == 1
+        full_fetches = [
+            c for c in orchestrator.binance_client.get_klines.call_args_list
+            if c.kwargs["limit"] != 1
+        ]
+        assert len(full_fetches) == 1
+
+    def test_cache_keeps_only_recent_candles(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that entries for older candles are evicted."""
+        candles = FibonacciTradingOrchestrator._klines_to_dataframe(_klines(200))
+        for open_time in range(5):
+            key = ("BNB_USDT", "1d", open_time)
+            orchestrator._signal_from_candles(key, candles)
+
+        assert list(orchestrator._signal_cache) == [
+            ("BNB_USDT", "1d", 3), ("BNB_USDT", "1d", 4)
+        ]
+
+
+class TestPosition:
+    """Test position lookup."""
+
+    def test_known_price_skips_ticker_request(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that a price from the fetched candles is used as-is."""
+        position = orchestrator._get_position(600.0)
+
+        orchestrator.binance_client.get_ticker_price.assert_not_called()
+        assert position["current_price"] == 600.0
+        assert position["position_value"] == 1200.0
+
+    def test_execute_prices_position_from_latest_candle(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that a full run needs no separate ticker request."""
+        result = orchestrator.execute()
+
+        orchestrator.binance_client.get_ticker_price.assert_not_called()
+        assert result["position"]["current_price"] == 399.5
+
+
+class TestAccountCache:
+    """Test that the account is read once per trading cycle."""
+
+    def test_trade_reuses_account_read_for_position(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test one repository read per cycle, fresh on the next cycle."""
+        orchestrator.dry_run = False
+        orchestrator.strategy.generate_signal.return_value = {
+            "action": "SELL", "reason": "test", "trend": "DOWNTREND",
+            "entry": 400.0, "stop_loss": 420.0,
+            "take_profit_1": 380.0, "take_profit_2": 360.0,
+        }
+
+        first = orchestrator.execute()
+
+        assert first["trade_executed"] is True
+        assert orchestrator.account_repo.find_by_id.call_count == 1
+        orchestrator.account_repo.save.assert_called_once()
+
+        orchestrator.execute()
+
+        assert orchestrator.account_repo.find_by_id.call_count == 2
+
+
+class TestExecuteAsync:
+    """Test the event-loop friendly workflow entry point."""
+
+    def test_account_access_runs_off_the_event_loop(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that repository calls happen outside the loop thread."""
+        get_klines = orchestrator.binance_client.get_klines.side_effect
+        orchestrator.binance_client.get_klines_async = AsyncMock(side_effect=get_klines)
+        account = orchestrator.account_repo.find_by_id.return_value
+        repo_threads = []
+
+        def find_by_id(account_id):
+            repo_threads.append(threading.get_ident())
+            return account
+
+        orchestrator.account_repo.find_by_id.side_effect = find_by_id
+
+        result = asyncio.run(orchestrator.execute_async())
+
+        assert result["status"] == "success"
+        assert repo_threads and threading.get_ident() not in repo_threads
+
+
+class TestSharedResources:
+    """Test running several orchestrators on shared resources."""
+
+    def test_close_leaves_injected_resources_open(self, tmp_path) -> None:
+        """Test that shared DB and client are left for their owner to close."""
+        db = Mock()
+        client = Mock()
+        orch = FibonacciTradingOrchestrator(
+            account_id="account-1",
+            symbol="ETH_USDT",
+            timeframe="4h",
+            db_path=str(tmp_path / "unused.db"),
+            db=db,
+            binance_client=client,
+        )
+
+        orch.close()
+
+        assert orch.db is db and orch.binance_client is client
+        db.close.assert_not_called()
+        client.close.assert_not_called()
+
+    def test_shared_account_lock_prevents_double_spend(self, tmp_path) -> None:
+        """Test that concurrent BUYs on one account see each other's trade."""
+        account = Account()
+        account.deposit(Money(1000.0, Currency.USDT))
+        stored = {"account": account}
+        repo = Mock()
+
+        def find_by_id(account_id):
+            snapshot = copy.deepcopy(stored["account"])
+            time.sleep(0.05)  # Widen the read/save window for the other thread
+            return snapshot
+
+        repo.find_by_id.side_effect = find_by_id
+        repo.save.side_effect = lambda a: stored.update(account=copy.deepcopy(a))
+        lock = threading.Lock()
+        buy = {
+            "action": "BUY", "reason": "test", "trend": "UPTREND",
+            "entry": 100.0, "stop_loss": 90.0,
+            "take_profit_1": 110.0, "take_profit_2": 120.0,
+        }
+
+        orchestrators = []
+        for symbol in ("BNB_USDT", "BTC_USDT"):
+            orch = FibonacciTradingOrchestrator(
+                account_id="account-1",
+                symbol=symbol,
+                timeframe="1d",
+                db_path=str(tmp_path / "shared.db"),
+                binance_client=Mock(),
+                account_lock=lock,
+            )
+            orch.account_repo = repo
+            orchestrators.append(orch)
+
+        threads = [
+            threading.Thread(
+                target=orch._complete_workflow,
+                args=(buy, [{"close": 100.0}], 0.0),
+            )
+            for orch in orchestrators
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert repo.save.call_count == 1
+        final = stored["account"].snapshot(Currency.BNB)
+        assert final.quote == 0.0
+        bought = [
+            stored["account"].snapshot(currency).base
+            for currency in (Currency.BNB, Currency.BTC)
+        ]
+        assert sorted(bought) == [0.0, 10.0]
+
+
+class TestCandleHistory:
+    """Test incremental candle fetching."""
+
+    def test_second_fetch_requests_only_new_candles(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that later fetches start at the last stored candle."""
+        market = _klines(301)
+        orchestrator.binance_client.get_klines.side_effect = _market(market[:300])
+        orchestrator._fetch_candles()
+
+        orchestrator.binance_client.get_klines.side_effect = _market(market)
+        df = orchestrator._fetch_candles()
+
+        last_call = orchestrator.binance_client.get_klines.call_args
+        assert last_call.kwargs["start_time"] == market[299]["open_time"]
+        assert len(df) == 300
+        assert df.index[0] == pd.Timestamp(market[1]["open_time"], unit="ms")
+        assert df.index[-1] == pd.Timestamp(market[300]["open_time"], unit="ms")
+        assert df.index.is_unique
+
+    def test_gap_wider_than_window_refetches_latest(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that a long outage falls back to a full fetch of recent candles."""
+        market = _klines(1000)
+        orchestrator.binance_client.get_klines.side_effect = _market(market[:300])
+        orchestrator._fetch_candles()
+
+        orchestrator.binance_client.get_klines.side_effect = _market(market)
+        df = orchestrator._fetch_candles()
+
+        assert "start_time" not in orchestrator.binance_client.get_klines.call_args.kwargs
+        assert df.index[-1] == pd.Timestamp(market[-1]["open_time"], unit="ms")
+        assert len(df) == 300
+
+    def test_known_long_gap_fetches_latest_window_once(
+        self, orchestrator: FibonacciTradingOrchestrator
+    ) -> None:
+        """Test that a gap sized from the latest candle skips the stale page."""
+        market = _klines(1000)
+        orchestrator.binance_client.get_klines.side_effect = _market(market[:300])
+        orchestrator._fetch_candles()
+
+        orchestrator.binance_client.get_klines.reset_mock()
+        orchestrator.binance_client.get_klines.side_effect = _market(market)
+        df = orchestrator._fetch_candles(market[-1:])
+
+        orchestrator.binance_client.get_klines.assert_called_once()
+        assert "start_time" not in orchestrator.binance_client.get_klines.call_args.kwargs
+        assert df.index[-1] == pd.Timestamp(market[-1]["open_time"], unit="ms")
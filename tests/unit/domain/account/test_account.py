@@ -152,6 +152,56 @@ class TestAccountTrading:
             )
 
 
+    def test_execute_buy(self) -> None:
+        """Test executing buy updates both balances with one transaction."""
+        account = Account()
+        account.deposit(Money(1000, Currency.USDT))
+        account.execute_buy(
+            Money(200, Currency.USDT),
+            Money(0.5, Currency.BNB),
+            400.0,
+            "Weekly DCA",
+        )
+
+        assert account.get_available_balance(Currency.USDT).amount == 800
+        assert account.get_available_balance(Currency.BNB).amount == 0.5
+        assert account.get_transaction_count() == 2
+
+        buy = account.transactions[-1]
+        assert buy.transaction_type == TransactionType.BUY
+        assert buy.amount == Money(0.5, Currency.BNB)
+        assert buy.metadata["price"] == 400.0
+        assert buy.metadata["cost"] == 200
+
+    def test_execute_buy_insufficient_funds(self) -> None:
+        """Test executing buy without enough quote balance."""
+        account = Account()
+        account.deposit(Money(100, Currency.USDT))
+        with pytest.raises(ValueError, match="Insufficient"):
+            account.execute_buy(
+                Money(200, Currency.USDT),
+                Money(0.5, Currency.BNB),
+                400.0,
+                "Weekly DCA",
+            )
+
+        assert Currency.BNB not in account.balance.available
+        assert account.get_transaction_count() == 1
+
+    def test_execute_buy_on_closed_account(self) -> None:
+        """Test executing buy on closed account."""
+        account = Account()
+        account.deposit(Money(1000, Currency.USDT))
+        account.close()
+        with pytest.raises(ValueError, match="closed"):
+            account.execute_buy(
+                Money(200, Currency.USDT),
+                Money(0.5, Currency.BNB),
+                400.0,
+                "Weekly DCA",
+            )
+
+
 class TestAccountFees:
     """Test account fee recording."""
 
@@ -252,6 +302,29 @@ class TestAccountHistory:
         assert history[0].timestamp <= history[1].timestamp
 
 
+class TestAccountSnapshot:
+    """Test account balance snapshots."""
+
+    def test_snapshot(self) -> None:
+        """Test snapshot reads base and quote amounts."""
+        account = Account()
+        account.deposit(Money(1000, Currency.USDT))
+        account.deposit(Money(2.5, Currency.BNB))
+
+        snapshot = account.snapshot(Currency.BNB)
+        assert snapshot.base == 2.5
+        assert snapshot.quote == 1000
+
+    def test_snapshot_missing_currency(self) -> None:
+        """Test snapshot defaults missing currencies to zero."""
+        account = Account()
+        account.deposit(Money(1000, Currency.USDT))
+
+        snapshot = account.snapshot(Currency.BTC)
+        assert snapshot.base == 0.0
+        assert snapshot.quote == 1000
+
+
 class TestAccountSummary:
     """Test account summary."""
 
@@ -140,6 +140,23 @@ class TestBalanceOperations:
         assert balance.get_reserved(Currency.USDT).amount == 0
 
 
+class TestBalanceAvailableFloat:
+    """Test float access to available balances."""
+
+    def test_available_float_existing_currency(self) -> None:
+        """Test reading an available balance as float."""
+        balance = Balance(available={Currency.USDT: Money(1000, Currency.USDT)})
+        amount = balance.available_float(Currency.USDT)
+        assert amount == 1000.0
+        assert isinstance(amount, float)
+
+    def test_available_float_missing_currency_returns_default(self) -> None:
+        """Test default for a currency without balance."""
+        balance = Balance()
+        assert balance.available_float(Currency.BNB) == 0.0
+        assert balance.available_float(Currency.BNB, default=-1.0) == -1.0
+
+
 class TestBalanceSummary:
     """Test Balance summary methods."""
 
@@ -0,0 +1,242 @@
+"""Tests for BinanceRESTClient."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.infrastructure.exchange.binance_rest_client import BinanceRESTClient
+from src.shared.exceptions import ExchangeBannedException
+
+
+@pytest.fixture
+def client() -> BinanceRESTClient:
+    """Create client without touching the network."""
+    with BinanceRESTClient(testnet=True) as binance_client:
+        yield binance_client
+
+
+class TestSession:
+    """Test HTTP session configuration."""
+
+    def test_https_adapter_is_pooled(self, client: BinanceRESTClient) -> None:
+        """Test that HTTPS requests go through a pooled adapter."""
+        adapter = client.session.get_adapter(client.base_url)
+        assert adapter._pool_maxsize == BinanceRESTClient.POOL_SIZE
+
+    def test_keep_alive_headers(self, client: BinanceRESTClient) -> None:
+        """Test that keep-alive and user agent headers are set."""
+        assert client.session.headers["Connection"] == "keep-alive"
+        assert client.session.headers["User-Agent"] == BinanceRESTClient.USER_AGENT
+
+    def test_server_errors_are_retried(self, client: BinanceRESTClient) -> None:
+        """Test that transient server errors are retried."""
+        retries = client.session.get_adapter(client.base_url).max_retries
+        assert retries.total > 0
+        assert 503 in retries.status_forcelist
+        assert 429 not in retries.status_forcelist
+
+    def test_adapter_leaves_429_to_get(self, client: BinanceRESTClient) -> None:
+        """Test that a 429 with Retry-After is not retried inside the adapter."""
+        requests_seen = []
+
+        class RateLimited(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                requests_seen.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), RateLimited)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client.base_url = f"http://127.0.0.1:{server.server_port}"
+            client.session.mount(
+                "http://", client.session.get_adapter(BinanceRESTClient.BASE_URL)
+            )
+            with patch("src.infrastructure.exchange.binance_rest_client.time.sleep"):
+                price = client.get_ticker_price("BNBUSDT")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert price is None
+        assert len(requests_seen) == BinanceRESTClient.RATE_LIMIT_RETRIES + 1
+
+
+def _response(status_code: int, headers: dict = None, payload: dict = None) -> Mock:
+    """Build a fake requests response."""
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.json.return_value = payload or {}
+    response.content = json.dumps(payload or {}).encode()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} error", response=response
+        )
+    return response
+
+
+class TestRateLimits:
+    """Test handling of Binance rate-limit responses."""
+
+    def test_429_waits_retry_after_then_succeeds(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that a 429 is retried after the Retry-After delay."""
+        client.session.get = Mock(side_effect=[
+            _response(429, {"Retry-After": "7"}),
+            _response(200, payload={"price": "612.5"}),
+        ])
+
+        with patch("src.infrastructure.exchange.binance_rest_client.time.sleep") as sleep:
+            price = client.get_ticker_price("BNBUSDT")
+
+        assert price == 612.5
+        sleep.assert_called_once_with(7.0)
+
+    def test_429_without_header_backs_off_exponentially(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test exponential backoff and give-up after repeated 429s."""
+        client.session.get = Mock(return_value=_response(429))
+
+        with patch("src.infrastructure.exchange.binance_rest_client.time.sleep") as sleep:
+            price = client.get_ticker_price("BNBUSDT")
+
+        assert price is None
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 4.0]
+
+    def test_spent_weight_pauses_until_next_minute(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that requests wait for the weight window to reset."""
+        client.session.get = Mock(return_value=_response(
+            200,
+            {"X-MBX-USED-WEIGHT-1M": str(BinanceRESTClient.WEIGHT_LIMIT_PER_MINUTE)},
+            {"price": "612.5"},
+        ))
+        module = "src.infrastructure.exchange.binance_rest_client.time"
+
+        with patch(f"{module}.time", return_value=1_700_000_010.0), \
+                patch(f"{module}.sleep") as sleep:
+            client.get_ticker_price("BNBUSDT")
+            sleep.assert_not_called()
+            client.get_ticker_price("BNBUSDT")
+
+        sleep.assert_called_once_with(30.0)
+
+    def test_418_raises_banned(self, client: BinanceRESTClient) -> None:
+        """Test that an IP ban is surfaced instead of retried."""
+        client.session.get = Mock(return_value=_response(418, {"Retry-After": "120"}))
+
+        with pytest.raises(ExchangeBannedException):
+            client.get_24h_ticker("BNBUSDT")
+        assert client.session.get.call_count == 1
+
+
+class TestAsyncRequests:
+    """Test the awaitable request wrappers."""
+
+    def test_get_klines_async_returns_parsed_klines(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that the async fetch reuses the session and parses klines."""
+        raw = [[1700000000000, "1", "2", "0.5", "1.5", "10", 1700003599999,
+                "15", 7, "4", "6", "0"]]
+        client.session.get = Mock(return_value=_response(200, payload=raw))
+
+        klines = asyncio.run(client.get_klines_async("BNBUSDT", "1h", limit=1))
+
+        assert klines[0]["close"] == 1.5
+        assert client.session.get.call_args.kwargs["params"]["limit"] == 1
+
+    def test_get_24h_tickers_async_fetches_all_symbols_at_once(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that several 24h tickers come back from a single request."""
+        payload = [
+            {"symbol": "BNBUSDT", "lastPrice": "612.5"},
+            {"symbol": "BTCUSDT", "lastPrice": "95000.0"},
+        ]
+        client.session.get = Mock(return_value=_response(200, payload=payload))
+
+        tickers = asyncio.run(client.get_24h_tickers_async(["BNBUSDT", "BTCUSDT"]))
+
+        assert tickers["BTCUSDT"]["lastPrice"] == "95000.0"
+        assert client.session.get.call_count == 1
+        assert client.session.get.call_args.kwargs["params"] == {
+            "symbols": '["BNBUSDT","BTCUSDT"]'
+        }
+
+    def test_get_all_prices_async_returns_parsed_prices(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that the awaitable price lookup parses the full price list."""
+        payload = [{"symbol": "BNBUSDT", "price": "612.5"}]
+        client.session.get = Mock(return_value=_response(200, payload=payload))
+
+        prices = asyncio.run(client.get_all_prices_async())
+
+        assert prices == {"BNBUSDT": 612.5}
+
+
+class TestBatchPrices:
+    """Test single-request price lookups."""
+
+    def test_get_all_prices_indexes_by_symbol(self, client: BinanceRESTClient) -> None:
+        """Test that every price is parsed into a symbol -> float dict."""
+        payload = [
+            {"symbol": "BNBUSDT", "price": "612.5"},
+            {"symbol": "BTCUSDT", "price": "95000.0"},
+        ]
+        client.session.get = Mock(return_value=_response(200, payload=payload))
+
+        prices = client.get_all_prices()
+
+        assert prices == {"BNBUSDT": 612.5, "BTCUSDT": 95000.0}
+        assert client.session.get.call_args.kwargs["params"] is None
+
+    def test_get_24h_tickers_without_symbols_skips_request(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that an empty symbol list does not hit the API."""
+        client.session.get = Mock()
+
+        assert client.get_24h_tickers([]) == {}
+        client.session.get.assert_not_called()
+
+    def test_rejected_batch_falls_back_to_single_tickers(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that one invalid symbol does not unprice the others."""
+        client.session.get = Mock(side_effect=[
+            _response(400),
+            _response(200, payload={"symbol": "BNBUSDT", "lastPrice": "612.5"}),
+            _response(400),
+        ])
+
+        tickers = client.get_24h_tickers(["BNBUSDT", "BUSDUSDT"])
+
+        assert tickers == {"BNBUSDT": {"symbol": "BNBUSDT", "lastPrice": "612.5"}}
+        assert client.session.get.call_count == 3
+
+    def test_get_all_prices_reuses_recent_snapshot(
+        self, client: BinanceRESTClient
+    ) -> None:
+        """Test that prices fetched within the TTL are not requested again."""
+        payload = [{"symbol": "BNBUSDT", "price": "612.5"}]
+        client.session.get = Mock(return_value=_response(200, payload=payload))
+
+        first = client.get_all_prices()
+        second = client.get_all_prices()
+
+        assert first == second == {"BNBUSDT": 612.5}
+        assert client.session.get.call_count == 1
@@ -0,0 +1,51 @@
+"""Tests for DatabaseManager."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.database import DatabaseManager
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = DatabaseManager(str(Path(tmpdir) / "test.db"))
+        manager.initialize()
+        yield manager
+        manager.close()
+
+
+class TestConnectionPragmas:
+    """Test per-connection SQLite settings."""
+
+    def test_wal_and_synchronous_normal(self, temp_db):
+        """Test pooled connections use WAL with synchronous=NORMAL."""
+        with temp_db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+class TestAsyncQueries:
+    """Test the awaitable query wrappers."""
+
+    def test_update_then_query_async(self, temp_db):
+        """Test that async writes are visible to async reads."""
+        async def run():
+            await temp_db.execute_update_async(
+                "CREATE TABLE items (name TEXT)"
+            )
+            await temp_db.execute_update_async(
+                "INSERT INTO items (name) VALUES (?)", ("bnb",)
+            )
+            return await temp_db.execute_query_async("SELECT name FROM items")
+
+        rows = asyncio.run(run())
+
+        assert [tuple(row) for row in rows] == [("bnb",)]
@@ -0,0 +1,69 @@
+"""Tests for the Buy & Hold + DCA daemon's DCA scheduling."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from scripts.run_buyhold_dca_strategy import BuyHoldDCAStrategy
+
+MONDAY = datetime(2024, 11, 18, tzinfo=timezone.utc).timestamp()
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+@pytest.fixture
+def clock():
+    """Patch the script's clock; set clock.return_value to move time."""
+    with patch("scripts.run_buyhold_dca_strategy.time.time") as fake_time:
+        fake_time.return_value = MONDAY + 10 * HOUR
+        yield fake_time
+
+
+@pytest.fixture
+def strategy(clock, tmp_path, monkeypatch) -> BuyHoldDCAStrategy:
+    """Create a Monday DCA strategy on Monday 10:00 UTC."""
+    monkeypatch.chdir(tmp_path)
+    return BuyHoldDCAStrategy(account_id="account-1", target_weekday=0)
+
+
+class TestDCAWindow:
+    """Test that DCA is only attempted on the DCA day."""
+
+    def test_dca_day_is_due(self, strategy: BuyHoldDCAStrategy) -> None:
+        """Test that starting on the DCA day schedules today's window."""
+        assert strategy.should_execute_dca()
+
+    def test_missed_dca_day_waits_for_next_week(
+        self, strategy: BuyHoldDCAStrategy, clock
+    ) -> None:
+        """Test that an unfinished DCA day is not carried into Tuesday."""
+        clock.return_value = MONDAY + DAY + 9 * HOUR
+
+        assert not strategy.should_execute_dca()
+        assert strategy._next_dca_ts == MONDAY + 7 * DAY
+
+    def test_failed_dca_retry_stops_at_midnight(
+        self, strategy: BuyHoldDCAStrategy, clock
+    ) -> None:
+        """Test that a failure late on the DCA day is not retried on Tuesday."""
+        clock.return_value = MONDAY + 23 * HOUR + 30 * 60
+
+        strategy._schedule_dca_retry()
+
+        assert strategy._next_dca_ts == MONDAY + DAY
+
+        clock.return_value = strategy._next_dca_ts
+
+        assert not strategy.should_execute_dca()
+        assert strategy._next_dca_ts == MONDAY + 7 * DAY
+
+    def test_failed_dca_is_retried_within_the_day(
+        self, strategy: BuyHoldDCAStrategy, clock
+    ) -> None:
+        """Test that an early failure is retried after DCA_RETRY_INTERVAL."""
+        strategy._schedule_dca_retry()
+
+        clock.return_value = MONDAY + 11 * HOUR
+
+        assert strategy.should_execute_dca()
@@ -261,3 +261,41 @@ class TestCandleSchedulerEdgeCases:
         # Should close at 2025-01-01 00:00:00
         expected = datetime(2025, 1, 1, 0, 0, 0)
         assert next_close == expected
+
+
+class TestNextRunCache:
+    """Test memoization of the next close for the current time."""
+
+    def test_current_time_lookups_reuse_cached_close(self, monkeypatch):
+        """Test that the close is computed once until it has passed."""
+        scheduler = CandleScheduler()
+        calls = []
+        compute = scheduler._compute_next_candle_time
+
+        def counting_compute(timeframe, reference_time):
+            calls.append(reference_time)
+            return compute(timeframe, reference_time)
+
+        monkeypatch.setattr(scheduler, "_compute_next_candle_time", counting_compute)
+
+        first = scheduler.get_next_candle_time("1d")
+        assert scheduler.get_next_candle_time("1d") == first
+        assert 0 < scheduler.get_wait_seconds("1d") <= 86400
+        assert len(calls) == 1
+
+    def test_cached_close_refreshes_once_passed(self):
+        """Test that a passed close is replaced by the following one."""
+        scheduler = CandleScheduler()
+        now = datetime(2024, 11, 14, 14, 30, 45)
+
+        assert scheduler._cached_next_candle_time("1h", now) == datetime(2024, 11, 14, 15, 0)
+        later = datetime(2024, 11, 14, 15, 0)
+        assert scheduler._cached_next_candle_time("1h", later) == datetime(2024, 11, 14, 16, 0)
+
+    def test_explicit_reference_time_bypasses_cache(self):
+        """Test that explicit reference times are computed, not cached."""
+        scheduler = CandleScheduler()
+
+        scheduler.get_next_candle_time("1h", datetime(2024, 11, 14, 14, 30))
+
+        assert scheduler._next_run_cache == {}